@@ -1,29 +1,35 @@
 import streamlit as st
+
+from components.diagnostics import admin_token
+from components.navigation import PAGES, st_page
 from components.ui import (
     apply_brand_styles,
-    set_sidebar_branding,
-    language_toggle,
     get_lang,
+    language_toggle,
+    page_metrics,
+    scroll_to_pending_anchor,
+    start_background_workers,
+    t,
     get_app_icon_path,
 )
 
-st.set_page_config(
-    page_title="DOTS Toolkit",
-    page_icon=get_app_icon_path(),
-    layout="wide",
-    initial_sidebar_state="collapsed",
-)
-
-# Apply global styles + sidebar header (Menu)
-apply_brand_styles()
-set_sidebar_branding("Menu" if get_lang() == "English" else "メニュー")
-language_toggle(sidebar=True)
-
-# Always land on Home (especially important on mobile)
-if "boot" not in st.session_state:
-    st.session_state.boot = True
-    st.switch_page("pages/1_Home.py")
+# Single entry point: this shell runs once per rerun, then the selected page.
+# Home is the default page, so a cold visit is one script run (no redirect).
+# The whole run is recorded in the page metrics (components/metrics.py),
+# tagged with the page's URL path once navigation has picked it.
+# The warm-up, search indexer and other workers start on the first run only.
+start_background_workers()
 
-# Fallback if someone somehow lands here after boot
-lang = get_lang()
-st.write("Open Home from the sidebar" if lang == "English" else "サイドバーからホームを開いてください")
+with page_metrics("app") as run:
+    st.set_page_config(page_icon=get_app_icon_path(), layout="wide", initial_sidebar_state="collapsed")
+    apply_brand_styles()
+    # Before the navigation is built, so page titles follow a language change
+    # on the same run.
+    language_toggle(sidebar=True)
+    run.lang = get_lang()
+    specs = [spec for spec in PAGES if not spec.admin or admin_token()]
+    pages = [st_page(spec.path, title=t(spec.title_key)) for spec in specs]
+    page = st.navigation({t("common.menu"): pages})
+    run.page = specs[pages.index(page)].url_path
+    page.run()
+    scroll_to_pending_anchor()
@@ -0,0 +1,94 @@
+import pandas as pd
+import streamlit as st
+
+from components.feedback import ROLES, feedback_store
+from components.ui import page_header, require_admin, t
+
+PERIODS = (None, 90, 30)  # days, in the order of insights.period_options
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def load_rollups(version: int) -> pd.DataFrame:
+    # Keyed by the store's version, so new submissions show on the next rerun
+    # and reruns in between don't touch the database.
+    return feedback_store.rollups()
+
+
+def summarise(df: pd.DataFrame, by: str) -> pd.DataFrame:
+    """Per-group totals from daily rollup rows (all column-wise, no row loops)."""
+    weighted = df.assign(
+        points=df["rating"] * df["submissions"],
+        positive=df["submissions"].where(df["rating"] >= 4, 0),
+    )
+    g = weighted.groupby(by)[["submissions", "points", "positive", "comments", "comment_chars"]].sum()
+    return pd.DataFrame({
+        t("insights.submissions"): g["submissions"],
+        t("insights.mean_rating"): (g["points"] / g["submissions"]).round(2),
+        t("insights.positive"): (g["positive"] / g["submissions"] * 100).round(1),
+        t("insights.comments"): g["comments"],
+        t("insights.comment_chars"): (g["comment_chars"] / g["comments"].where(g["comments"] > 0)).round(0),
+    })
+
+
+page_header(t("insights.title"), t("insights.subtitle"))
+require_admin()
+
+df = load_rollups(feedback_store.version())
+
+period_labels = t("insights.period_options")
+period = st.radio(
+    t("insights.period"),
+    range(len(PERIODS)),
+    format_func=lambda i: period_labels[i],
+    horizontal=True,
+)
+if PERIODS[period]:
+    df = df[df["day"] >= pd.Timestamp.now(tz="UTC").normalize().tz_localize(None) - pd.Timedelta(days=PERIODS[period])]
+if df.empty:
+    st.caption(t("insights.no_data"))
+    st.stop()
+
+# Stored roles are language-independent keys; show them in the current language.
+role_labels = dict(zip(ROLES, t("feedback.backup.role_options")))
+df = df.assign(role=df["role"].map(role_labels).fillna(df["role"]))
+
+# ----------------------------
+# Totals
+# ----------------------------
+total = summarise(df.assign(all=""), "all").iloc[0]
+c1, c2, c3, c4 = st.columns(4)
+c1.metric(t("insights.submissions"), int(total[t("insights.submissions")]))
+c2.metric(t("insights.mean_rating"), f"{total[t('insights.mean_rating')]:.2f}")
+c3.metric(t("insights.positive"), f"{total[t('insights.positive')]:.0f}%")
+c4.metric(t("insights.comments"), int(total[t("insights.comments")]))
+
+# ----------------------------
+# By role + language
+# ----------------------------
+st.subheader(t("insights.by_role"))
+st.dataframe(summarise(df, "role").rename_axis(t("insights.role")), use_container_width=True)
+
+st.subheader(t("insights.distribution"))
+distribution = df.pivot_table(index="role", columns="rating", values="submissions", aggfunc="sum", fill_value=0)
+st.bar_chart(distribution.rename(columns=str).rename_axis(t("insights.role")))
+
+st.subheader(t("insights.by_language"))
+st.dataframe(summarise(df, "lang").rename_axis(t("insights.language")), use_container_width=True)
+
+# ----------------------------
+# Over time
+# ----------------------------
+st.subheader(t("insights.over_time"))
+weekly = summarise(df.assign(week=df["day"].dt.to_period("W").dt.start_time), "week")
+c1, c2 = st.columns(2)
+c1.bar_chart(weekly[[t("insights.submissions"), t("insights.comments")]])
+c2.line_chart(weekly[[t("insights.mean_rating")]])
+
+# ----------------------------
+# Maintenance
+# ----------------------------
+st.divider()
+if st.button(t("insights.rebuild")):
+    feedback_store.rebuild_rollups()
+    load_rollups.clear()
+    st.success(t("insights.rebuilt").format(rows=feedback_store.count()))
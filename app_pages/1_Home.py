@@ -0,0 +1,77 @@
+import streamlit as st
+from components.ui import (
+    page_header,
+    t,
+    static_block,
+    bundle_download_button,
+    tile_columns,
+)
+
+
+# --- Home text ---
+page_header(t("home.title"), t("home.subtitle"))
+static_block("home.intro")
+
+# --- Quick actions ---
+st.subheader(t("home.quick_actions.title"))
+c1, c2, c3 = tile_columns("quick_actions")
+
+with c1:
+    if st.button(
+        t("home.quick_actions.im_talking_parents"),
+        use_container_width=True,
+        key="qa_parents",
+    ):
+        st.switch_page("app_pages/4_Guides.py")
+
+with c2:
+    if st.button(
+        t("home.quick_actions.im_talking_students"),
+        use_container_width=True,
+        key="qa_students",
+    ):
+        st.switch_page("app_pages/4_Guides.py")
+
+with c3:
+    if st.button(
+        t("home.quick_actions.im_talking_colleagues"),
+        use_container_width=True,
+        key="qa_colleagues",
+    ):
+        st.switch_page("app_pages/4_Guides.py")
+
+st.divider()
+
+# --- Explore ---
+st.subheader(t("home.explore.title"))
+q1, q2, q3 = tile_columns("explore")
+
+with q1:
+    if st.button(
+        t("home.explore.browse_phrases_scripts"),
+        use_container_width=True,
+        key="ex_phrases",
+    ):
+        st.switch_page("app_pages/2_Phrases_and_Scripts.py")
+
+with q2:
+    if st.button(
+        t("home.explore.explore_visual_tools"),
+        use_container_width=True,
+        key="ex_visual",
+    ):
+        st.switch_page("app_pages/3_Visual_Tools.py")
+
+with q3:
+    if st.button(
+        t("home.explore.view_conversation_guides"),
+        use_container_width=True,
+        key="ex_guides",
+    ):
+        st.switch_page("app_pages/4_Guides.py")
+
+st.divider()
+
+# --- Everything in one download ---
+st.subheader(t("home.bundle.title"))
+bundle_download_button(key="home_bundle")
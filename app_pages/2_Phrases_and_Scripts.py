@@ -0,0 +1,71 @@
+import streamlit as st
+
+from components.assets import get_asset
+from components.ui import (
+    t,
+    static_block,
+    page_header,
+    pdf_card_actions,
+)
+
+
+# ----------------------------
+# PDF helpers (Quick Staffroom Reference)
+# ----------------------------
+QUICK_REF_RAW_URL = "https://raw.githubusercontent.com/Chawalaa/DOTS/main/assets/Quick%20Staff%20Room%20Reference%20.pdf"
+
+# ----------------------------
+# Content
+# ----------------------------
+page_header(t("phrases.title"), t("phrases.subtitle"))
+
+static_block("phrases.intro")
+
+st.divider()
+
+# ----------------------------
+# Quick Staffroom Reference (View + Download)
+# ----------------------------
+st.subheader(t("phrases.quick_staffroom_reference.title"), anchor="quick-staffroom-reference")
+
+quick_ref = get_asset("quick_staff_room_reference")
+
+# View + Download (in-app viewer and shared local asset; falls back to the
+# GitHub raw file when it isn't available locally)
+pdf_card_actions(
+    title=t("phrases.quick_staffroom_reference.title"),
+    asset=quick_ref,
+    file_name="Quick Staff Room Reference.pdf",
+    raw_url=QUICK_REF_RAW_URL,
+    key="quick_staff_room_reference",
+    fetch_missing=True,
+)
+
+st.divider()
+
+# ----------------------------
+# Core phrase sets (starter content)
+# ----------------------------
+st.subheader(t("phrases.foundational_phrases.title"), anchor="foundational-phrases")
+
+static_block("phrases.foundational_phrases.body")
+
+st.divider()
+
+st.subheader(t("phrases.for_parents.title"), anchor="for-parents")
+
+static_block("phrases.for_parents.body")
+
+st.divider()
+
+st.subheader(t("phrases.for_students.title"), anchor="for-students")
+
+static_block("phrases.for_students.body")
+
+st.divider()
+
+st.subheader(t("phrases.for_colleagues.title"), anchor="for-colleagues")
+
+static_block("phrases.for_colleagues.body")
+
+st.caption(t("phrases.for_colleagues.note"))
@@ -0,0 +1,130 @@
+import streamlit as st
+from components.ui import (
+    t,
+    static_block,
+    page_header,
+    pdf_card_actions,
+)
+from components.assets import ASSET_FILES, get_asset
+from components.sections import lazy_expander, timed_section
+
+import urllib.parse
+
+
+# -----------------------------
+# Content tables
+# -----------------------------
+# Visual metaphors: (catalog key, asset ID of its PDF). The key holds the
+# expander's label, body, usage note and the PDF's title.
+VISUAL_METAPHORS = [
+    ("visual_tools.visual_metaphors.dots_narrative", "dots"),
+    ("visual_tools.visual_metaphors.waves_narrative", "waves"),
+    ("visual_tools.visual_metaphors.pathways_narrative", "pathways"),
+]
+
+# Design-language sections: (catalog key, heading anchor, asset ID of the
+# section's PDF or None, catalog keys of its expanders).
+#
+# The first expander of each section starts open. components/search.py
+# indexes this page by unrolling the loops below over these tables.
+DESIGN_SECTIONS = [
+    ("visual_tools.color_guidelines", "color-guidelines", "color_guidelines", [
+        "visual_tools.color_guidelines.palette_direction",
+        "visual_tools.color_guidelines.color_usage_rules",
+        "visual_tools.color_guidelines.colors_to_avoid",
+        "visual_tools.color_guidelines.accessibility_consistency",
+    ]),
+    ("visual_tools.typography", "typography", None, [
+        "visual_tools.typography.primary_typeface",
+        "visual_tools.typography.text_hierarchy",
+        "visual_tools.typography.typography_rules",
+        "visual_tools.typography.what_not_to_use",
+        "visual_tools.typography.accessibility_notes",
+    ]),
+    ("visual_tools.layout_and_materials", "layout-and-materials", None, [
+        "visual_tools.layout_and_materials.layout_principles",
+        "visual_tools.layout_and_materials.content_focus",
+        "visual_tools.layout_and_materials.suitable_formats",
+        "visual_tools.layout_and_materials.interaction_philosophy",
+        "visual_tools.layout_and_materials.consistency_across_materials",
+    ]),
+    ("visual_tools.explicit_exclusions", "explicit-exclusions", None, [
+        "visual_tools.explicit_exclusions.not_permitted",
+        "visual_tools.explicit_exclusions.rationale",
+        "visual_tools.explicit_exclusions.design_boundary",
+    ]),
+]
+
+
+page_header(t("visual_tools.title"), t("visual_tools.subtitle"))
+
+# -----------------------------
+# Helpers: View + Download PDFs
+# -----------------------------
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com/Chawalaa/DOTS/main/assets/"
+
+def pdf_view_download_buttons(title: str, asset_id: str):
+    """
+    Shows a View button (in-app viewer) + Download button, as one fragment.
+    - View opens the self-hosted viewer; without a local file it links to the
+      GitHub raw URL instead.
+    - Download uses the shared, process-wide media URL for the asset
+      (shows error if the file is missing).
+    """
+    st.markdown(f"**{title}**")
+
+    asset = get_asset(asset_id)
+    pdf_filename = ASSET_FILES[asset_id][0]
+
+    # Encode filename for URL (spaces etc.)
+    raw_url = GITHUB_RAW_BASE + urllib.parse.quote(pdf_filename)
+
+    pdf_card_actions(
+        title=title,
+        asset=asset,
+        file_name=pdf_filename,
+        raw_url=raw_url,
+        key=asset_id,
+    )
+
+# ----------------------------------------
+# Visual Metaphors (structured + PDF links)
+# ----------------------------------------
+with timed_section("visual_tools.visual_metaphors"):
+    st.subheader(t("visual_tools.visual_metaphors.title"), anchor="visual-metaphors")
+
+    static_block("visual_tools.visual_metaphors.body")
+
+    st.divider()
+
+    for i, (key, asset_id) in enumerate(VISUAL_METAPHORS):
+        with lazy_expander(t(f"{key}.label"), key=key, expanded=i == 0) as is_open:
+            if is_open:
+                static_block(f"{key}.body")
+
+                static_block(f"{key}.usage")
+
+                pdf_view_download_buttons(title=t(f"{key}.pdf_title"), asset_id=asset_id)
+
+    st.info(t("visual_tools.visual_metaphors.tip"))
+
+# ----------------------------------------
+# Design language: colour, typography, layout, exclusions
+# ----------------------------------------
+for section, anchor, section_pdf, expanders in DESIGN_SECTIONS:
+    st.divider()
+
+    with timed_section(section):
+        st.subheader(t(f"{section}.title"), anchor=anchor)
+
+        static_block(f"{section}.body")
+
+        for i, key in enumerate(expanders):
+            with lazy_expander(t(f"{key}.label"), key=key, expanded=i == 0) as is_open:
+                if is_open:
+                    static_block(f"{key}.body")
+
+        st.info(t(f"{section}.tip"))
+
+        if section_pdf:
+            pdf_view_download_buttons(title=t(f"{section}.pdf_title"), asset_id=section_pdf)
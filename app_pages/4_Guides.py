@@ -0,0 +1,87 @@
+import streamlit as st
+import urllib.parse
+
+from components.assets import get_asset
+from components.ui import (
+    t,
+    static_block,
+    page_header,
+    pdf_card_actions,
+    bundle_download_button,
+)
+
+
+# ---------- PDF helpers ----------
+# GitHub raw URL (MUST NOT include /blob/)
+RAW_PDF_URL = "https://raw.githubusercontent.com/Chawalaa/DOTS/main/assets/Conversation%20Support%20Card.pdf"
+
+# ---------- Page content ----------
+page_header(t("guides.title"), t("guides.subtitle"))
+
+static_block("guides.intro")
+
+bundle_download_button(key="guides_bundle")
+
+st.divider()
+
+# =========================
+# Parents
+# =========================
+st.subheader(t("guides.parents.title"), anchor="parents")
+
+static_block("guides.parents.body")
+
+# ---- Conversation Support Card (moved here) ----
+st.subheader(t("guides.conversation_support_card.title"), anchor="conversation-support-card")
+
+card = get_asset("conversation_support_card")
+
+# View + Download (in-app viewer and shared local asset; falls back to the
+# GitHub raw file when it isn't available locally)
+pdf_card_actions(
+    title=t("guides.conversation_support_card.title"),
+    asset=card,
+    file_name="Conversation Support Card.pdf",
+    raw_url=RAW_PDF_URL,
+    key="conversation_support_card",
+    fetch_missing=True,
+)
+
+st.divider()
+
+# =========================
+# Students
+# =========================
+st.subheader(t("guides.students.title"), anchor="students")
+
+static_block("guides.students.body")
+
+# ---- Student Narrative Card (View + Download) ----
+st.subheader(t("guides.student_narrative_card.title"), anchor="student-narrative-card")
+
+pdf_filename = "Student Narrative Card.pdf"
+
+# View falls back to the GitHub raw URL if the file isn't available locally
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com/Chawalaa/DOTS/main/assets/"
+raw_url = GITHUB_RAW_BASE + urllib.parse.quote(pdf_filename)
+student_card = get_asset("student_narrative_card")
+
+# View + Download (shared local asset; error if the file is missing)
+pdf_card_actions(
+    title=t("guides.student_narrative_card.title"),
+    asset=student_card,
+    file_name=pdf_filename,
+    raw_url=raw_url,
+    key="student_narrative_card",
+)
+
+st.divider()
+
+# =========================
+# Colleagues
+# =========================
+st.subheader(t("guides.colleagues.title"), anchor="colleagues")
+
+static_block("guides.colleagues.body")
+
+st.caption(t("guides.colleagues.note"))
@@ -0,0 +1,12 @@
+import streamlit as st
+from components.ui import page_header, t, static_block
+
+
+page_header(t("about.title"))
+
+static_block("about.intro")
+
+st.subheader(t("about.framework.title"))
+static_block("about.framework.body")
+
+st.warning(t("about.disclaimer"))
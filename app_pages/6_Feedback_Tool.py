@@ -0,0 +1,77 @@
+import streamlit as st
+from components.feedback import FORM_URL, ROLES, Submission, feedback_store
+from components.ui import get_lang, t, static_block
+import streamlit.components.v1 as components
+
+
+title = t("feedback.title")
+subtitle = t("feedback.subtitle")
+
+st.title(title)
+st.caption(subtitle)
+st.divider()
+
+# --- Primary: Link button (always works) ---
+st.subheader(t("feedback.google_form.title"))
+static_block("feedback.google_form.body")
+
+# Streamlit has st.link_button in newer versions; fall back to markdown if not available.
+if hasattr(st, "link_button"):
+    st.link_button(
+        t("feedback.google_form.open"),
+        FORM_URL,
+        use_container_width=True,
+    )
+else:
+    st.markdown(f"- [{t('feedback.google_form.open')}]({FORM_URL})")
+
+st.divider()
+
+# --- Embed: Google Form inside the page ---
+st.subheader(t("feedback.embed.title"))
+
+# Use an iframe embed. If you have the special embed URL, you can replace FORM_URL with it.
+# Often, Google Forms embed works best with /viewform?embedded=true
+embed_url = FORM_URL
+if "embedded=true" not in embed_url:
+    joiner = "&" if "?" in embed_url else "?"
+    embed_url = f"{embed_url}{joiner}embedded=true"
+
+components.iframe(embed_url, height=950, scrolling=True)
+
+st.divider()
+
+# --- Backup: in-app form, stored on the server (components/feedback.py) ---
+# A fragment, so submitting reruns only the form.
+@st.fragment
+def quick_feedback_form():
+    role_options = t("feedback.backup.role_options")
+    with st.form("quick_feedback", clear_on_submit=True):
+        name = st.text_input(t("feedback.backup.name"))
+        # Options are indices, so the stored role is the same in every language.
+        role = st.selectbox(
+            t("feedback.backup.role"),
+            range(len(ROLES)),
+            format_func=lambda i: role_options[i],
+        )
+        rating = st.slider(
+            t("feedback.backup.rating"),
+            min_value=1, max_value=5, value=4,
+        )
+        comment = st.text_area(
+            t("feedback.backup.comment"),
+            height=140,
+        )
+        submitted = st.form_submit_button(t("feedback.backup.submit"))
+
+    if submitted:
+        # Queued for the background writer; the page never waits on the database.
+        feedback_store.submit(
+            Submission(role=ROLES[role], rating=rating, comment=comment.strip(), name=name.strip(), lang=get_lang())
+        )
+        st.success(t("feedback.backup.success"))
+
+
+with st.expander(t("feedback.backup.label"), expanded=False):
+    static_block("feedback.backup.body")
+    quick_feedback_form()
@@ -0,0 +1,69 @@
+import streamlit as st
+
+from components.ui import page_header, t, static_block
+
+
+page_header(t("contact.title"), t("contact.subtitle"))
+
+# --- Recommended contact methods ---
+st.subheader(t("contact.how_to_reach.title"))
+
+static_block("contact.how_to_reach.body")
+
+st.divider()
+
+# --- Quick message form (sends nowhere; shows copy-paste email) ---
+st.subheader(t("contact.send_message.title"))
+
+# Submitting reruns only this fragment, not the whole page.
+@st.fragment
+def contact_form():
+    with st.form("contact_form"):
+        name = st.text_input(t("contact.send_message.your_name"))
+        affiliation = st.text_input(t("contact.send_message.affiliation"))
+        email = st.text_input(t("contact.send_message.email"))
+        topic = st.selectbox(
+            t("contact.send_message.topic"),
+            t("contact.send_message.topic_options"),
+        )
+        message = st.text_area(
+            t("contact.send_message.message"),
+            height=160,
+            placeholder=t("contact.send_message.placeholder"),
+        )
+        consent = st.checkbox(t("contact.send_message.consent"))
+
+        submitted = st.form_submit_button(t("contact.send_message.submit"))
+
+    if submitted:
+        if not consent:
+            st.warning(t("contact.send_message.warning"))
+        else:
+            # Create a copy-paste email (since Streamlit Cloud cannot send email by default)
+            to_address = "chawala.banda@keio.jp"
+            subject = f"[Toolkit Contact] {topic}"
+            body = (
+                f"Name: {name}\n"
+                f"Affiliation: {affiliation}\n"
+                f"Email: {email}\n"
+                f"Topic: {topic}\n\n"
+                f"Message:\n{message}\n"
+            )
+
+            st.success(t("contact.send_message.success"))
+
+            st.code(f"To: {to_address}\nSubject: {subject}\n\n{body}", language="text")
+
+            # Optional convenience button to open mail client
+            st.markdown(
+                f"[{t('contact.send_message.open_draft')}]"
+                f"(mailto:{to_address}?subject={subject.replace(' ', '%20')})"
+            )
+
+
+contact_form()
+
+st.divider()
+
+# --- Footer note ---
+st.caption(t("contact.footer"))
@@ -0,0 +1,56 @@
+import time
+
+import streamlit as st
+
+from components.search import PAGE_TITLES, search_index
+from components.ui import (
+    get_lang,
+    go_to,
+    page_header,
+    t,
+)
+
+
+lang = get_lang()
+# app.py has usually started the indexer already; this covers the page run
+# on its own (e.g. benchmarks/pages.py).
+search_index.start()
+
+# ----------------------------
+# Content
+# ----------------------------
+page_header(t("search.title"), t("search.subtitle"))
+
+
+@st.fragment
+def search_box():
+    # Only this fragment reruns while searching; the page around it is untouched.
+    query = st.text_input(
+        t("search.title"),
+        placeholder=t("search.placeholder"),
+        key="search_query",
+        label_visibility="collapsed",
+    )
+    if not query.strip():
+        return
+
+    started = time.perf_counter()
+    results = search_index.search(query, lang)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if not results:
+        st.info(t("search.no_results"))
+        return
+
+    st.caption(t("search.results_one" if len(results) == 1 else "search.results").format(count=len(results), ms=elapsed_ms))
+    for i, result in enumerate(results):
+        doc = result.doc
+        page_title = t(PAGE_TITLES[doc.page]) if doc.page in PAGE_TITLES else doc.page
+        # A button, not a link: go_to() stays in this session, so the page
+        # opens in the same language, scrolled to the section.
+        if st.button(f"{doc.title or page_title} · {page_title}", key=f"search_result_{i}"):
+            go_to(doc.page, doc.anchor)
+        st.caption(result.snippet)
+
+
+search_box()
@@ -0,0 +1,120 @@
+import streamlit as st
+
+from components.diagnostics import prometheus_text, snapshot
+from components.feedback import feedback_store
+from components.metrics import RING_SIZE, export_json, summary
+from components.sections import section_costs
+from components.ui import lazy_download_button, page_header, require_admin, t
+
+
+def format_bytes(n: int | None) -> str:
+    if n is None:
+        return "–"
+    if n < 1024:
+        return f"{n} B"
+    if n < 1024 * 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+def hit_rate(stats: dict) -> str:
+    total = stats["hits"] + stats["misses"]
+    return f"{stats['hits'] / total:.0%}" if total else "–"
+
+
+page_header(t("admin.title"), t("admin.subtitle"))
+
+require_admin()
+
+# ----------------------------
+# Overview
+# ----------------------------
+st.button(t("admin.refresh"))
+
+snap = snapshot()
+media = snap["media_store"] or {}
+
+c1, c2, c3, c4 = st.columns(4)
+c1.metric(t("admin.sessions"), len(snap["sessions"]))
+c2.metric(t("admin.media_store"), format_bytes(media.get("bytes")))
+c3.metric(t("admin.asset_hits"), hit_rate(snap["assets"]))
+c4.metric(t("admin.block_hits"), hit_rate(snap["blocks"]))
+
+# ----------------------------
+# Pages + sections
+# ----------------------------
+st.subheader(t("admin.pages").format(runs=RING_SIZE))
+rows = summary()
+if rows:
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+else:
+    st.caption(t("admin.no_data"))
+
+st.subheader(t("admin.sections"))
+costs = section_costs()
+if costs:
+    st.dataframe(
+        [{"section": name, **{k: round(v, 2) for k, v in cost.items()}} for name, cost in costs.items()],
+        use_container_width=True,
+        hide_index=True,
+    )
+else:
+    st.caption(t("admin.no_data"))
+
+# ----------------------------
+# Sessions + caches
+# ----------------------------
+st.subheader(t("admin.session_state"))
+st.dataframe(
+    [{"session": s["id"], "state": format_bytes(s["state_bytes"])} for s in snap["sessions"]],
+    use_container_width=True,
+    hide_index=True,
+)
+
+st.subheader(t("admin.caches"))
+st.json({key: snap[key] for key in ("assets", "media_store", "blocks", "remote")}, expanded=False)
+
+# ----------------------------
+# Feedback (components/feedback.py)
+# ----------------------------
+st.subheader(t("admin.feedback"))
+c1, c2 = st.columns(2)
+c1.metric(t("admin.feedback_stored"), feedback_store.count())
+c2.metric(t("admin.feedback_pending"), snap["feedback"]["pending"])
+sync = snap["outbox"]
+if sync["running"] or sync["waiting"] or sync["rejected"]:
+    # Feedback sync (DOTS_FEEDBACK_SYNC, components/outbox.py)
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric(t("admin.outbox_waiting"), sync["waiting"])
+    c2.metric(t("admin.outbox_retrying"), sync["retrying"])
+    c3.metric(t("admin.outbox_rejected"), sync["rejected"])
+    c4.metric(t("admin.outbox_sent"), sync["sent"])
+lazy_download_button(
+    label=t("admin.feedback_export"),
+    ready_label=t("admin.feedback_download"),
+    load=feedback_store.export_csv,
+    file_name="dots-feedback.csv",
+    key="admin_feedback_csv",
+    mime="text/csv",
+)
+
+# ----------------------------
+# Export
+# ----------------------------
+c1, c2 = st.columns(2)
+with c1:
+    st.download_button(
+        t("admin.export_json"),
+        data=export_json(),
+        file_name="dots-metrics.json",
+        mime="application/json",
+        use_container_width=True,
+    )
+with c2:
+    st.download_button(
+        t("admin.export_prometheus"),
+        data=prometheus_text(),
+        file_name="dots-metrics.prom",
+        mime="text/plain",
+        use_container_width=True,
+    )
@@ -0,0 +1,373 @@
+"""
+Concurrent-user load test over Streamlit's websocket protocol.
+
+Starts the app on a local port (or targets --url) and drives N simulated
+browser sessions at once, for each N in --users. Each session:
+
+1. lands on Home
+2. switches language
+3. opens Visual Tools and expands two closed sections
+4. downloads up to two of the PDFs linked there (plain HTTP, like a browser)
+5. opens Contact and submits the form (a fragment rerun)
+6. opens Feedback Tool and submits the in-app feedback form
+
+Every step is one script run: the time from sending the rerun to the
+server's script_finished. For each level the report gives throughput
+(script runs per second), p50/p95/p99 latency per step and overall, errors,
+and the server's peak RSS while the level ran.
+
+    python -m benchmarks.load --users 1,5,10,25
+    python -m benchmarks.load --users 50 --iterations 3 --think 1.0 --output load.json
+    python -m benchmarks.load --url http://localhost:8501 --pid 12345
+
+The server keeps running across levels, as a deployed one would, so RSS
+shows growth as well as the peak. It is started with DOTS_METRICS_PORT
+unset, DOTS_FEEDBACK_DB pointing at a scratch file in the temp directory
+(unless it is set), and otherwise inherits the environment (e.g.
+DOTS_ASSET_BASE_URL).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+from tornado.websocket import websocket_connect
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STEP_TIMEOUT = 60.0
+DOWNLOADS = 2
+SECTIONS = 2
+
+
+# -----------------------------
+# One browser session
+# -----------------------------
+class Session:
+    """A websocket client that speaks enough of the protocol to rerun pages and set widgets."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.ws = None
+        self.elements: list[tuple[str, object, str]] = []  # (type, proto, fragment id) from the last run
+        self.widgets: dict[str, WidgetState] = {}  # sticky widget values, as a browser keeps them
+        self._by_hash: dict[str, ForwardMsg] = {}
+        self.first_element_ms: float | None = None  # of the last rerun: when the first element arrived
+        self.page_not_found = False
+
+    async def connect(self):
+        ws_url = self.base_url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.ws = await websocket_connect(ws_url, max_message_size=64 * 1024 * 1024)
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(
+        self,
+        page: str | None = None,
+        triggers: list[WidgetState] = (),
+        fragment_id: str = "",
+    ) -> float:
+        """Send a rerun (optionally to another page) and wait for it to finish; returns ms."""
+        msg = BackMsg()
+        if page is not None:
+            msg.rerun_script.page_name = page
+            # A new page has new widgets; only the sidebar ones carry over.
+            self.widgets = {wid: w for wid, w in self.widgets.items() if wid.endswith("-lang_selector")}
+        msg.rerun_script.widget_states.widgets.extend([*self.widgets.values(), *triggers])
+        msg.rerun_script.fragment_id = fragment_id
+
+        started = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        if not fragment_id:
+            self.elements = []
+        self.first_element_ms = None
+        self.page_not_found = False
+        while True:
+            raw = await asyncio.wait_for(self.ws.read_message(), STEP_TIMEOUT)
+            if raw is None:
+                raise ConnectionError("server closed the connection")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "ref_hash":
+                fwd = self._by_hash.get(fwd.ref_hash, fwd)
+                kind = fwd.WhichOneof("type")
+            elif fwd.hash:
+                self._by_hash[fwd.hash] = fwd
+
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                if self.first_element_ms is None:
+                    self.first_element_ms = (time.perf_counter() - started) * 1000
+                element = fwd.delta.new_element
+                etype = element.WhichOneof("type")
+                self.elements.append((etype, getattr(element, etype), fwd.delta.fragment_id))
+            elif kind == "page_not_found":
+                # Sent provisionally on a process's first run, before
+                # st.navigation has registered the pages; the navigation
+                # message that follows says which page actually ran.
+                self.page_not_found = True
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("script failed to compile")
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return (time.perf_counter() - started) * 1000
+
+    def find(self, etype: str, key_suffix: str = "") -> list:
+        # Only widgets have ids; key_suffix matches a widget's user key.
+        return [
+            (proto, frag)
+            for t, proto, frag in self.elements
+            if t == etype and (not key_suffix or proto.id.endswith(key_suffix))
+        ]
+
+    def set_widget(self, widget_id: str, **value):
+        self.widgets[widget_id] = WidgetState(id=widget_id, **value)
+
+
+async def scenario(session: Session, http: AsyncHTTPClient, think: float, record):
+    async def step(name: str, coro):
+        record(name, await coro)
+        if think:
+            await asyncio.sleep(think)
+
+    await step("home", session.rerun(page=""))
+
+    radios = session.find("radio", "-lang_selector")
+    if radios:
+        radio = radios[0][0]
+        session.set_widget(radio.id, int_value=(radio.value + 1) % len(radio.options))
+        await step("language", session.rerun())
+
+    await step("visual_tools", session.rerun(page="Visual_Tools"))
+    closed = [proto for proto, _ in session.find("checkbox") if "_section_" in proto.id and not proto.value]
+    for toggle in closed[:SECTIONS]:
+        session.set_widget(toggle.id, bool_value=True)
+        await step("section_open", session.rerun())
+
+    urls = [proto.url for proto, _ in session.find("link_button") if ".pdf" in proto.url or "/media/" in proto.url]
+    for url in urls[:DOWNLOADS]:
+        full = url if url.startswith("http") else session.base_url + url
+        started = time.perf_counter()
+        response = await http.fetch(full, request_timeout=STEP_TIMEOUT)
+        record("download", (time.perf_counter() - started) * 1000, len(response.body))
+
+    await step("contact", session.rerun(page="Contact"))
+    await _submit_form(session, step, "contact_submit")
+
+    await step("feedback", session.rerun(page="Feedback_Tool"))
+    await _submit_form(session, step, "feedback_submit")
+
+
+async def _submit_form(session: Session, step, name: str):
+    # Text fields of the page's first form filled in, boxes ticked, then its submit button.
+    submit = [(proto, frag) for proto, frag in session.find("button") if proto.is_form_submitter]
+    if not submit:
+        return
+    button, fragment_id = submit[0]
+    for proto, _ in session.find("text_input") + session.find("text_area"):
+        if proto.form_id == button.form_id:
+            session.set_widget(proto.id, string_value="Load test")
+    for proto, _ in session.find("checkbox"):
+        if proto.form_id == button.form_id:
+            session.set_widget(proto.id, bool_value=True)
+    trigger = WidgetState(id=button.id, trigger_value=True)
+    await step(name, session.rerun(triggers=[trigger], fragment_id=fragment_id))
+
+
+# -----------------------------
+# Levels
+# -----------------------------
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def _stats(values: list[float]) -> dict:
+    return {
+        "n": len(values),
+        "p50_ms": round(_percentile(values, 0.50), 1),
+        "p95_ms": round(_percentile(values, 0.95), 1),
+        "p99_ms": round(_percentile(values, 0.99), 1),
+        "mean_ms": round(statistics.mean(values), 1) if values else 0.0,
+    }
+
+
+def rss_kb(pid: int | None) -> int | None:
+    if pid is None:
+        return None
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True, timeout=5)
+        return int(out.stdout.strip())
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+async def run_level(base_url: str, users: int, iterations: int, think: float, pid: int | None) -> dict:
+    latencies: dict[str, list[float]] = {}
+    downloaded = [0]
+    errors: list[str] = []
+    peak_rss = [rss_kb(pid) or 0]
+    http = AsyncHTTPClient(max_clients=max(10, users))
+
+    def record(name: str, ms: float, nbytes: int = 0):
+        latencies.setdefault(name, []).append(ms)
+        downloaded[0] += nbytes
+
+    async def user():
+        session = Session(base_url)
+        try:
+            await session.connect()
+            for _ in range(iterations):
+                await scenario(session, http, think, record)
+        except (asyncio.TimeoutError, ConnectionError, HTTPClientError, RuntimeError, OSError) as e:
+            errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            session.close()
+
+    async def sample_rss():
+        while True:
+            peak_rss[0] = max(peak_rss[0], rss_kb(pid) or 0)
+            await asyncio.sleep(0.25)
+
+    sampler = asyncio.create_task(sample_rss())
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(users)))
+    elapsed = time.perf_counter() - started
+    sampler.cancel()
+
+    runs = [ms for name, values in latencies.items() if name != "download" for ms in values]
+    return {
+        "users": users,
+        "elapsed_s": round(elapsed, 2),
+        "script_runs": len(runs),
+        "throughput_rps": round(len(runs) / elapsed, 2) if elapsed else 0.0,
+        "overall": _stats(runs),
+        "steps": {name: _stats(values) for name, values in sorted(latencies.items())},
+        "downloaded_bytes": downloaded[0],
+        "errors": errors,
+        "rss_peak_kb": peak_rss[0] or None,
+        "rss_after_kb": rss_kb(pid),
+    }
+
+
+# -----------------------------
+# Server
+# -----------------------------
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_healthy(base_url: str, timeout: float = 60.0):
+    http = AsyncHTTPClient()
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await http.fetch(base_url + "/_stcore/health", request_timeout=2)
+            return
+        except (HTTPClientError, OSError):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"server at {base_url} did not become healthy")
+            await asyncio.sleep(0.25)
+
+
+def start_server(
+    port: int,
+    python_args: tuple[str, ...] = (),
+    stderr=subprocess.DEVNULL,
+    server_args: tuple[str, ...] = (),
+) -> subprocess.Popen:
+    env = {k: v for k, v in os.environ.items() if k != "DOTS_METRICS_PORT"}
+    env.setdefault("DOTS_FEEDBACK_DB", os.path.join(tempfile.gettempdir(), f"dots-load-feedback-{port}.db"))
+    return subprocess.Popen(
+        [
+            sys.executable, *python_args, "-m", "streamlit", "run", "app.py",
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+            *server_args,
+        ],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=stderr,
+    )
+
+
+def _print_level(level: dict):
+    overall = level["overall"]
+    rss = f"{level['rss_peak_kb'] / 1024:.0f} MB" if level["rss_peak_kb"] else "n/a"
+    print(
+        f"users {level['users']:4d}  {level['script_runs']:5d} runs in {level['elapsed_s']:6.1f} s  "
+        f"{level['throughput_rps']:6.1f} runs/s  p50 {overall['p50_ms']:7.1f}  p95 {overall['p95_ms']:7.1f}  "
+        f"p99 {overall['p99_ms']:7.1f} ms  RSS peak {rss}  errors {len(level['errors'])}"
+    )
+    for name, stats in level["steps"].items():
+        print(f"    {name:16s} n={stats['n']:5d}  p50 {stats['p50_ms']:7.1f}  p95 {stats['p95_ms']:7.1f}  p99 {stats['p99_ms']:7.1f} ms")
+    for error in sorted(set(level["errors"]))[:5]:
+        print(f"    error: {error}")
+
+
+async def main_async(args) -> dict:
+    server = None
+    base_url, pid = args.url, args.pid
+    if base_url is None:
+        port = free_port()
+        server = start_server(port)
+        base_url, pid = f"http://127.0.0.1:{port}", server.pid
+    base_url = base_url.rstrip("/")
+    try:
+        await wait_healthy(base_url)
+        # One untimed session so imports and the warm-up aren't charged to the first level.
+        await run_level(base_url, 1, 1, 0.0, None)
+        levels = []
+        for users in args.users:
+            level = await run_level(base_url, users, args.iterations, args.think, pid)
+            _print_level(level)
+            levels.append(level)
+        return {"url": base_url, "iterations": args.iterations, "think_s": args.think, "levels": levels}
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=lambda s: [int(n) for n in s.split(",")], default=[1, 5, 10, 25],
+                        help="comma-separated concurrency levels (default 1,5,10,25)")
+    parser.add_argument("--iterations", type=int, default=1, help="scenario repeats per session")
+    parser.add_argument("--think", type=float, default=0.0, help="pause between steps, seconds")
+    parser.add_argument("--url", help="target a running server instead of starting one")
+    parser.add_argument("--pid", type=int, help="server process to sample RSS from (with --url)")
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 1 if any(level["errors"] for level in report["levels"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Headless page benchmarks on streamlit.testing.v1.AppTest.
+
+Every page in components/navigation.PAGES runs in every catalog language.
+Each run measures:
+
+- cold: the first run of a new session, with the render caches cleared
+- warm: the median of reruns of the same session
+- the number of elements emitted
+- the peak memory allocated during a cold run (tracemalloc; a separate run,
+  since tracing slows everything down)
+- typical interactions on a warm session: switching language, submitting
+  the Contact and Feedback forms, opening a Visual Tools section
+
+The figures are compared with benchmarks/baseline.json. A figure past its
+threshold (see THRESHOLDS, overridable in the baseline) counts as a
+regression, and the exit status is 1.
+
+    python -m benchmarks.pages                    # compare with the baseline
+    python -m benchmarks.pages --update           # write a new baseline
+    python -m benchmarks.pages --page Contact --repeat 10
+
+Submitted feedback goes to a scratch database in the temp directory
+(DOTS_FEEDBACK_DB), not data/.
+
+Pages run on their own, without the app.py shell, because AppTest does not
+render pages under st.navigation. The language toggle is simulated through
+session state for the same reason. Timings depend on the machine, so
+rebuild the baseline (--update) when the suite moves to another one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+from components.assets import warm_assets
+from components.blocks import clear_blocks
+from components.catalog import languages
+from components.navigation import PAGES
+from components.search import search_index
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# A time regresses past max(baseline * time_ratio, baseline + time_slack_ms):
+# a doubled render time fails, while millisecond-scale noise on the smallest
+# pages does not.
+THRESHOLDS = {
+    "time_ratio": 1.75,
+    "time_slack_ms": 5.0,
+    "elements_ratio": 1.25,
+    "memory_ratio": 1.5,
+}
+
+TIMEOUT = 60
+
+
+# -----------------------------
+# Interactions
+# -----------------------------
+def _other_language(at: AppTest):
+    langs = languages()
+    at.session_state["lang"] = langs[(langs.index(at.session_state["lang"]) + 1) % len(langs)]
+
+
+def _submit_form(at: AppTest):
+    # First text field filled in, any consent box ticked, then the form's submit button.
+    at.text_input[0].input("Benchmark")
+    for box in at.checkbox:
+        box.check()
+    next(b for b in at.button if b.proto.is_form_submitter).click()
+
+
+def _open_section(key: str) -> Callable[[AppTest], None]:
+    def action(at: AppTest):
+        at.toggle(key=f"_section_{key}").set_value(True)
+
+    return action
+
+
+# url_path -> {name: action}; the language toggle applies to every page.
+INTERACTIONS: dict[str, dict[str, Callable[[AppTest], None]]] = {
+    "Visual_Tools": {"section_open": _open_section("visual_tools.visual_metaphors.waves_narrative")},
+    "Feedback_Tool": {"form_submit": _submit_form},
+    "Contact": {"form_submit": _submit_form},
+}
+
+
+# -----------------------------
+# Measurement
+# -----------------------------
+def count_elements(at: AppTest) -> int:
+    def walk(node) -> int:
+        children = getattr(node, "children", None)
+        if isinstance(children, dict):
+            return sum(walk(child) for child in children.values())
+        return 1
+
+    return walk(at.main) + walk(at.sidebar)
+
+
+def _session(path: str, lang: str) -> AppTest:
+    at = AppTest.from_file(str(ROOT / path), default_timeout=TIMEOUT)
+    at.session_state["lang"] = lang
+    return at
+
+
+def _timed_run(at: AppTest) -> float:
+    started = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - started) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return elapsed
+
+
+def bench_page(path: str, url_path: str, lang: str, repeat: int) -> dict:
+    cold, warm, elements = [], [], 0
+    for _ in range(repeat):
+        clear_blocks()
+        at = _session(path, lang)
+        cold.append(_timed_run(at))
+        elements = count_elements(at)
+        warm.append(_timed_run(at))
+
+    clear_blocks()
+    at = _session(path, lang)
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    actions = {"language_toggle": _other_language, **INTERACTIONS.get(url_path, {})}
+    interactions = {}
+    for name, action in actions.items():
+        samples = []
+        for _ in range(repeat):
+            at = _session(path, lang)
+            at.run()
+            action(at)
+            samples.append(_timed_run(at))
+        interactions[name] = round(statistics.median(samples), 2)
+
+    return {
+        "cold_ms": round(statistics.median(cold), 2),
+        "warm_ms": round(statistics.median(warm), 2),
+        "elements": elements,
+        "peak_kb": round(peak / 1024, 1),
+        "interactions": interactions,
+    }
+
+
+def prime():
+    """Load the assets, search index and page imports once, so cold runs measure the page, not the process start."""
+    warm_assets()
+    search_index.refresh()
+    for spec in PAGES:
+        _session(spec.path, languages()[0]).run()
+
+
+def run_suite(pages: list[str] | None = None, repeat: int = 5) -> dict:
+    prime()
+    results = {}
+    for spec in PAGES:
+        if spec.admin or (pages and spec.url_path not in pages):
+            continue
+        for lang in languages():
+            key = f"{spec.url_path}/{lang}"
+            try:
+                results[key] = bench_page(spec.path, spec.url_path, lang, repeat)
+            except Exception as e:
+                results[key] = {"error": f"{type(e).__name__}: {e}"}
+            print(_row(key, results[key]), flush=True)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "repeat": repeat,
+        "thresholds": THRESHOLDS,
+        "results": results,
+    }
+
+
+# -----------------------------
+# Baseline comparison
+# -----------------------------
+def _flatten(result: dict) -> dict[str, float]:
+    flat = {k: v for k, v in result.items() if k != "interactions"}
+    flat.update({f"interactions.{k}": v for k, v in result.get("interactions", {}).items()})
+    return flat
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Regressions of `current` against `baseline`, as readable lines."""
+    limits = {**THRESHOLDS, **baseline.get("thresholds", {})}
+    regressions = []
+    for key, result in current["results"].items():
+        if "error" in result:
+            regressions.append(f"{key}: {result['error']}")
+            continue
+        base = baseline["results"].get(key)
+        if base is None or "error" in base:
+            continue
+        old = _flatten(base)
+        for metric, value in _flatten(result).items():
+            if metric not in old:
+                continue
+            if metric == "elements":
+                limit = old[metric] * limits["elements_ratio"]
+            elif metric == "peak_kb":
+                limit = old[metric] * limits["memory_ratio"]
+            else:
+                limit = max(old[metric] * limits["time_ratio"], old[metric] + limits["time_slack_ms"])
+            if value > limit:
+                regressions.append(f"{key} {metric}: {value:g} (baseline {old[metric]:g}, limit {limit:.1f})")
+    return regressions
+
+
+def _row(key: str, result: dict) -> str:
+    if "error" in result:
+        return f"{key:32s} ERROR {result['error']}"
+    actions = "  ".join(f"{k}={v:.1f}" for k, v in result["interactions"].items())
+    return (
+        f"{key:32s} cold {result['cold_ms']:7.1f} ms  warm {result['warm_ms']:7.1f} ms  "
+        f"{result['elements']:4d} el  {result['peak_kb']:8.1f} KB  {actions}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    os.environ.setdefault("DOTS_FEEDBACK_DB", os.path.join(tempfile.gettempdir(), "dots-bench-feedback.db"))
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page", action="append", help="URL path of a page to run (repeatable); default all")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per figure (median is kept)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.page, args.repeat)
+    text = json.dumps(current, ensure_ascii=False, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    if args.update:
+        if args.baseline.exists():
+            # Keep hand-tuned thresholds, and the pages this run skipped.
+            previous = json.loads(args.baseline.read_text(encoding="utf-8"))
+            current["thresholds"] = {**THRESHOLDS, **previous.get("thresholds", {})}
+            current["results"] = {**previous.get("results", {}), **current["results"]}
+            text = json.dumps(current, ensure_ascii=False, indent=2) + "\n"
+        args.baseline.write_text(text, encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update to create one")
+        return 0
+    regressions = compare(current, json.loads(args.baseline.read_text(encoding="utf-8")))
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Cold-start profile: what a freshly scaled-up instance pays before each page
+first paints.
+
+For every page in components/navigation.PAGES this starts a new server under
+`python -X importtime`, waits until it is healthy, opens one session on the
+page, and reports:
+
+- ready: process start to a healthy /_stcore/health
+- first paint: rerun sent to the first element received
+- run: rerun sent to script_finished
+- imports: the import time charged to that first run (modules the server
+  had not loaded at startup), with the costliest modules
+
+With --warm, the server is started with server.scriptHealthCheckEnabled and
+/_stcore/script-health-check is requested once it is healthy and before the
+session, the way a readiness probe would on deploy. That check runs app.py,
+so the first visitor no longer pays the shell's imports; "warm" is how long
+it took. The check is off by default (every probe is a full script run);
+a deployment that wants it passes --server.scriptHealthCheckEnabled true or
+sets STREAMLIT_SERVER_SCRIPT_HEALTH_CHECK_ENABLED=true.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --page Feedback_Tool --modules 15
+    python -m benchmarks.startup --warm --repeat 3
+    python -m benchmarks.startup --output startup.json
+
+Import times are cumulative (a module includes what it imports) and, like
+everything here, vary between runs by a few milliseconds; compare medians
+over --repeat cold starts when judging a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from tornado.httpclient import AsyncHTTPClient
+
+from benchmarks.load import Session, free_port, start_server, wait_healthy
+from components.navigation import PAGES, page_url
+
+
+def parse_importtime(lines: list[str]) -> list[tuple[str, float, int]]:
+    """(module, cumulative ms, nesting depth) for each `-X importtime` line."""
+    rows = []
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), int(cumulative) / 1000, depth))
+    return rows
+
+
+async def profile_page(url_path: str, warm: bool = False) -> dict:
+    port = free_port()
+    lines: list[str] = []
+    started = time.perf_counter()
+    server = start_server(
+        port,
+        python_args=("-X", "importtime"),
+        stderr=subprocess.PIPE,
+        server_args=("--server.scriptHealthCheckEnabled", "true") if warm else (),
+    )
+
+    def drain():
+        for raw in server.stderr:
+            lines.append(raw.decode("utf-8", "replace").rstrip("\n"))
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        await wait_healthy(base_url)
+        ready_ms = (time.perf_counter() - started) * 1000
+        warm_ms = None
+        if warm:
+            warm_started = time.perf_counter()
+            await AsyncHTTPClient().fetch(base_url + "/_stcore/script-health-check", request_timeout=60)
+            warm_ms = (time.perf_counter() - warm_started) * 1000
+            await asyncio.sleep(0.2)
+        mark = len(lines)
+
+        session = Session(base_url)
+        await session.connect()
+        run_ms = await session.rerun(page=url_path)
+        first_paint_ms = session.first_element_ms
+        session.close()
+        # Let the reader catch up with the last import lines.
+        await asyncio.sleep(0.2)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        reader.join(timeout=5)
+
+    # Top-level entries after the server was healthy were imported by this run.
+    imported = [(name, ms) for name, ms, depth in parse_importtime(lines[mark:]) if depth == 0]
+    return {
+        "ready_ms": round(ready_ms, 1),
+        "warm_ms": None if warm_ms is None else round(warm_ms, 1),
+        "first_paint_ms": round(first_paint_ms or run_ms, 1),
+        "run_ms": round(run_ms, 1),
+        "import_ms": round(sum(ms for _, ms in imported), 1),
+        "modules": sorted(imported, key=lambda row: row[1], reverse=True),
+    }
+
+
+def _median_profile(samples: list[dict], modules: int) -> dict:
+    keys = ("ready_ms", "warm_ms", "first_paint_ms", "run_ms", "import_ms")
+    result = {k: round(statistics.median(s[k] for s in samples), 1) for k in keys if samples[0][k] is not None}
+    result["modules"] = [(name, round(ms, 1)) for name, ms in samples[0]["modules"][:modules]]
+    return result
+
+
+async def main_async(pages: list[str] | None, repeat: int, modules: int, warm: bool = False) -> dict:
+    results = {}
+    for spec in PAGES:
+        if spec.admin or (pages and spec.url_path not in pages):
+            continue
+        samples = [await profile_page(page_url(spec.path), warm) for _ in range(repeat)]
+        result = results[spec.url_path] = _median_profile(samples, modules)
+        warmed = f"  warm {result['warm_ms']:6.0f} ms" if "warm_ms" in result else ""
+        print(
+            f"{spec.url_path:22s} ready {result['ready_ms']:7.0f} ms{warmed}  first paint {result['first_paint_ms']:7.1f} ms  "
+            f"run {result['run_ms']:7.1f} ms  imports {result['import_ms']:6.1f} ms",
+            flush=True,
+        )
+        for name, ms in result["modules"]:
+            print(f"    {ms:7.1f} ms  {name}")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page", action="append", help="URL path of a page to profile (repeatable); default all")
+    parser.add_argument("--repeat", type=int, default=1, help="cold starts per page (medians are reported)")
+    parser.add_argument("--modules", type=int, default=8, help="costliest first-run imports to list")
+    parser.add_argument("--warm", action="store_true", help="run the script health check before the first session")
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(main_async(args.page, args.repeat, args.modules, args.warm))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Offline build step that produces web-optimised copies of the bundled assets.
+
+- PDFs -> assets/web/: print-only output intents (multi-MB CMYK ICC profiles)
+  are dropped, oversized images are downsampled, large RGB/gray images are
+  re-encoded as JPEG, and the result is saved linearised ("fast web view").
+  A web copy is only kept if it is smaller than the original.
+- Dots_icon.png -> assets/icons/: square favicon / touch / PWA icons.
+- assets/manifest.json: logical asset IDs (see ASSET_FILES) mapped to the
+  resolved file name, MIME type, and original / optimised paths, sizes and
+  hashes. components/assets.py reads it so pages look assets up by ID and
+  serve the web copies by default, while the print-quality originals stay
+  available on request.
+
+Usage (build machine only; needs pikepdf, which the app itself does not):
+    python -m components.asset_pipeline
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mimetypes
+from pathlib import Path
+
+import pikepdf
+from PIL import Image
+
+from components.assets import ASSET_FILES, ASSETS_DIR, MANIFEST_PATH
+
+WEB_DIR = ASSETS_DIR / "web"
+ICON_DIR = ASSETS_DIR / "icons"
+ICON_SOURCE = ASSETS_DIR / "Dots_icon.png"
+
+# Longest image side kept in web PDFs. The cards are A6, so this is roughly
+# 300 dpi at full size and plenty for phone screens.
+MAX_IMAGE_PX = 1200
+JPEG_QUALITY = 80
+# Images smaller than this (in pixels) aren't worth re-encoding.
+MIN_REENCODE_PIXELS = 250_000
+
+ICON_SIZES = {
+    "favicon-16.png": 16,
+    "favicon-32.png": 32,
+    "apple-touch-icon.png": 180,
+    "icon-192.png": 192,
+    "icon-512.png": 512,
+}
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_entry(path: Path) -> dict:
+    data = path.read_bytes()
+    return {
+        "path": path.relative_to(ASSETS_DIR).as_posix(),
+        "size": len(data),
+        "sha256": _sha256(data),
+    }
+
+
+# -----------------------------
+# PDFs
+# -----------------------------
+def _components(colorspace) -> int | None:
+    if colorspace == "/DeviceGray":
+        return 1
+    if colorspace == "/DeviceRGB":
+        return 3
+    if colorspace == "/DeviceCMYK":
+        return 4
+    if isinstance(colorspace, pikepdf.Array) and len(colorspace) == 2 and colorspace[0] == "/ICCBased":
+        return int(colorspace[1].get("/N", 0)) or None
+    return None
+
+
+def _drop(d: pikepdf.Dictionary, *keys: str):
+    for key in keys:
+        if key in d:
+            del d[key]
+
+
+def _optimise_image(stream: pikepdf.Stream) -> bool:
+    """Downsample / re-encode one image XObject in place. Returns True if changed."""
+    d = stream.stream_dict
+    # Masked images would come back from PIL with alpha; leave them alone.
+    if d.get("/BitsPerComponent") != 8 or "/Mask" in d or "/SMask" in d or "/Decode" in d:
+        return False
+    # Already-lossy JPEGs are small, and decoding Adobe CMYK JPEGs round-trip
+    # is ambiguous (inverted channels), so they are kept as they are.
+    if d.get("/Filter") == "/DCTDecode":
+        return False
+    n = _components(d.get("/ColorSpace"))
+    if n not in (1, 3, 4):
+        return False
+
+    try:
+        image = pikepdf.PdfImage(stream).as_pil_image()
+    except Exception:
+        return False
+    if image.mode not in ("L", "RGB", "CMYK"):
+        return False
+
+    width, height = image.size
+    scale = min(1.0, MAX_IMAGE_PX / max(width, height))
+    if scale < 1.0:
+        image = image.resize((max(1, round(width * scale)), max(1, round(height * scale))), Image.LANCZOS)
+
+    original_size = len(stream.read_raw_bytes())
+    jpeg_ok = n in (1, 3) and image.width * image.height >= MIN_REENCODE_PIXELS
+
+    if jpeg_ok:
+        buf = io.BytesIO()
+        image.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        encoded, filter_ = buf.getvalue(), pikepdf.Name.DCTDecode
+        if len(encoded) < original_size:
+            stream.write(encoded, filter=filter_)
+            d.Width, d.Height = image.width, image.height
+            _drop(d, "/DecodeParms")
+            return True
+
+    if scale < 1.0:
+        stream.write(image.tobytes())  # pikepdf re-compresses with Flate on save
+        _drop(d, "/Filter", "/DecodeParms")
+        d.Width, d.Height = image.width, image.height
+        return True
+    return False
+
+
+def optimise_pdf(src: Path, dst: Path) -> bool:
+    """Write a web-optimised copy of `src` to `dst`. Returns False if it wasn't smaller."""
+    with pikepdf.open(src) as pdf:
+        # Output intents embed a print (CMYK) ICC profile; screens don't use it.
+        if "/OutputIntents" in pdf.Root:
+            del pdf.Root.OutputIntents
+
+        for obj in pdf.objects:
+            if isinstance(obj, pikepdf.Stream) and obj.stream_dict.get("/Subtype") == "/Image":
+                _optimise_image(obj)
+
+        pdf.remove_unreferenced_resources()
+        buf = io.BytesIO()
+        pdf.save(
+            buf,
+            linearize=True,
+            deterministic_id=True,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+
+    data = buf.getvalue()
+    if len(data) >= src.stat().st_size:
+        if dst.exists():
+            dst.unlink()
+        return False
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.write_bytes(data)
+    return True
+
+
+# -----------------------------
+# Icons
+# -----------------------------
+def build_icons(src: Path = ICON_SOURCE, out: Path = ICON_DIR) -> dict[str, dict]:
+    out.mkdir(parents=True, exist_ok=True)
+    image = Image.open(src).convert("RGBA")
+
+    # Pad to a square canvas so icons aren't stretched.
+    side = max(image.size)
+    square = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    square.paste(image, ((side - image.width) // 2, (side - image.height) // 2))
+
+    icons = {}
+    for name, size in ICON_SIZES.items():
+        target = out / name
+        if size > side:
+            # Never upscale the source; skip sizes it can't honestly provide.
+            if target.exists():
+                target.unlink()
+            continue
+        square.resize((size, size), Image.LANCZOS).save(target, "PNG", optimize=True)
+        icons[name] = {**_file_entry(target), "px": size}
+    return icons
+
+
+# -----------------------------
+# Manifest
+# -----------------------------
+def build(src: Path = ASSETS_DIR) -> dict:
+    assets = {}
+    for asset_id, names in ASSET_FILES.items():
+        path = next((src / n for n in names if (src / n).exists()), None)
+        if path is None:
+            print(f"warning: no file for asset {asset_id!r} (looked for {', '.join(names)})")
+            continue
+
+        entry = {
+            "name": path.name,
+            "mime": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "original": _file_entry(path),
+        }
+        if path.suffix.lower() == ".pdf" and optimise_pdf(path, WEB_DIR / path.name):
+            entry["web"] = _file_entry(WEB_DIR / path.name)
+        assets[asset_id] = entry
+
+    manifest = {"version": 2, "assets": assets, "icons": build_icons()}
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest
+
+
+def main():
+    manifest = build()
+    for asset_id, entry in manifest["assets"].items():
+        original = entry["original"]["size"]
+        web = entry.get("web", {}).get("size")
+        saving = f"{web:>9} bytes ({100 * (1 - web / original):.0f}% smaller)" if web else "kept original"
+        print(f"{asset_id:28} {original:>9} -> {saving}")
+    for name, entry in manifest["icons"].items():
+        print(f"icons/{name:30} {entry['size']:>9} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Companion static server for the files under assets/.
+
+Streamlit's own static serving (`server.enableStaticServing`) sends every file
+that is not an image as `text/plain` with `nosniff`, which browsers won't
+render or save as a PDF. This small Tornado app serves assets/ properly:
+
+- strong ETags (SHA-256 of the file) and 304s for `If-None-Match`
+- `Cache-Control: immutable` for content-hashed URLs (`?v=<hash>`)
+- HTTP Range requests (resumable downloads)
+- gzip / brotli variants built ahead of time with `build`, served only while
+  they still match their original (identity encoding otherwise)
+- `?download=1` for an attachment instead of inline display (`&name=` sets
+  the saved file name)
+- the "download all cards" ZIPs (components/bundles.py) under /assets/_bundles/
+- the compiled brand stylesheet (components/styles.py) under /assets/_styles/
+- bytes and responses served per route at /metrics (Prometheus text format,
+  see components/diagnostics.py)
+
+Usage:
+    python -m components.asset_server build
+    python -m components.asset_server serve --port 8502
+
+Point the app at it with DOTS_ASSET_BASE_URL (e.g. http://localhost:8502/assets).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import mimetypes
+import os
+from collections import Counter
+from pathlib import Path
+
+import tornado.escape
+import tornado.ioloop
+import tornado.web
+
+from components.assets import ASSETS_DIR
+from components.bundles import BUNDLE_DIR, build_all
+from components.diagnostics import admin_token, check_token, render_families
+from components.styles import STYLE_CACHE_DIR, build_stylesheet
+
+PRECOMPRESSED_DIR = ASSETS_DIR.parent / "build" / "static"
+
+# Only keep an encoded variant if it saves at least this much.
+MIN_SAVING_RATIO = 0.05
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+REVALIDATE_MAX_AGE = 60 * 60
+
+try:
+    import brotli
+except ImportError:  # optional: gzip variants are still built and served
+    brotli = None
+
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Per route ("assets", "bundles", "styles"), since the server started.
+bytes_served: Counter = Counter()
+responses: Counter = Counter()
+
+
+# -----------------------------
+# Build step
+# -----------------------------
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_precompressed(src: Path = ASSETS_DIR, out: Path = PRECOMPRESSED_DIR) -> list[dict]:
+    """
+    Write .gz (and .br when brotli is installed) variants of each asset
+    under `out`. Variants that save less than MIN_SAVING_RATIO are skipped,
+    which is the common case for already-compressed PDFs and PNGs.
+
+    Each variant is stamped with its original's mtime; the server only uses
+    variants whose mtime still matches, so replacing an asset without
+    re-running `build` falls back to the identity encoding.
+    """
+    out.mkdir(parents=True, exist_ok=True)
+    report = []
+    for path in sorted(p for p in src.rglob("*") if p.is_file() and not p.name.startswith(".")):
+        st = path.stat()
+        raw = path.read_bytes()
+        name = path.relative_to(src).as_posix()
+        entry = {"name": name, "size": len(raw), "sha256": hashlib.sha256(raw).hexdigest()}
+
+        variants = {"gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants["br"] = brotli.compress(raw, quality=11)
+
+        for encoding, suffix in ENCODINGS:
+            target = out / (name + suffix)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            data = variants.get(encoding)
+            if data is not None and len(data) <= len(raw) * (1 - MIN_SAVING_RATIO):
+                target.write_bytes(data)
+                os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+                entry[encoding] = len(data)
+            elif target.exists():
+                target.unlink()
+        report.append(entry)
+    return report
+
+
+# -----------------------------
+# Handler
+# -----------------------------
+def _matches(variant: str, original: str) -> bool:
+    """True if `variant` was built from the current `original` (same mtime)."""
+    try:
+        return os.stat(variant).st_mtime_ns == os.stat(original).st_mtime_ns
+    except OSError:
+        return False
+
+
+class AssetHandler(tornado.web.StaticFileHandler):
+    # absolute path -> (mtime_ns, size, sha256); one entry per served file.
+    _sha_cache: dict[str, tuple[int, int, str]] = {}
+
+    def initialize(self, path: str, route: str = "assets", precompressed_path: str | None = None) -> None:
+        super().initialize(path)
+        self.route = route
+        self.precompressed_path = precompressed_path
+        self.content_encoding: str | None = None
+
+    def write(self, chunk) -> None:
+        bytes_served[self.route] += len(chunk)
+        super().write(chunk)
+
+    def on_finish(self) -> None:
+        responses[(self.route, self.get_status())] += 1
+
+    def _accepted_encodings(self) -> set[str]:
+        header = self.request.headers.get("Accept-Encoding", "")
+        return {part.split(";")[0].strip() for part in header.split(",") if part.strip()}
+
+    def get_absolute_path(self, root: str, path: str) -> str:
+        original = super().get_absolute_path(root, path)
+        self.content_encoding = None
+        if not self.precompressed_path or self.request.headers.get("Range"):
+            # Ranges always address the identity encoding.
+            return original
+
+        accepted = self._accepted_encodings()
+        for encoding, suffix in ENCODINGS:
+            variant = os.path.join(self.precompressed_path, path + suffix)
+            if encoding in accepted and _matches(variant, original):
+                self.content_encoding = encoding
+                return variant
+        return original
+
+    def validate_absolute_path(self, root: str, absolute_path: str) -> str | None:
+        if self.content_encoding and self.precompressed_path:
+            root = os.path.abspath(self.precompressed_path)
+        return super().validate_absolute_path(root, absolute_path)
+
+    def get_content_type(self) -> str:
+        mime, _ = mimetypes.guess_type(self.path)
+        return mime or "application/octet-stream"
+
+    def compute_etag(self) -> str | None:
+        # Strong ETag over the served bytes, cached per path and rehashed when
+        # the file's (mtime, size) changes, so a replaced file gets a new ETag
+        # without a restart and the old digest is dropped.
+        if self.absolute_path is None:
+            return None
+        st = os.stat(self.absolute_path)
+        cached = self._sha_cache.get(self.absolute_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            digest = cached[2]
+        else:
+            digest = _file_sha256(Path(self.absolute_path))
+            self._sha_cache[self.absolute_path] = (st.st_mtime_ns, st.st_size, digest)
+        return f'"{digest}"'
+
+    def get_cache_time(self, path: str, modified, mime_type: str) -> int:
+        return IMMUTABLE_MAX_AGE if self.get_query_argument("v", None) else REVALIDATE_MAX_AGE
+
+    def set_extra_headers(self, path: str) -> None:
+        self.set_header("Vary", "Accept-Encoding")
+        self.set_header("X-Content-Type-Options", "nosniff")
+        if self.content_encoding:
+            self.set_header("Content-Encoding", self.content_encoding)
+        if self.get_query_argument("v", None):
+            self.set_header("Cache-Control", f"public, max-age={IMMUTABLE_MAX_AGE}, immutable")
+        else:
+            self.set_header("Cache-Control", f"public, max-age={REVALIDATE_MAX_AGE}")
+        if self.get_query_argument("download", None):
+            # `name` saves a content-addressed file under its friendly name.
+            name = os.path.basename(self.get_query_argument("name", "")) or os.path.basename(path)
+            self.set_header(
+                "Content-Disposition",
+                f"attachment; filename*=utf-8''{tornado.escape.url_escape(name, plus=False)}",
+            )
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    """Bytes and responses served, gated by DOTS_ADMIN_TOKEN like the app's exporter."""
+
+    def get(self) -> None:
+        if admin_token():
+            scheme, _, given = self.request.headers.get("Authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not check_token(given.strip()):
+                raise tornado.web.HTTPError(401)
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.write(render_families([
+            ("dots_static_bytes_served_total", "counter", "Response body bytes served per route.",
+             [("", {"route": route}, n) for route, n in sorted(bytes_served.items())]),
+            ("dots_static_responses_total", "counter", "Responses per route and status code.",
+             [("", {"route": route, "code": str(code)}, n) for (route, code), n in sorted(responses.items())]),
+        ]))
+
+
+def make_app(src: Path = ASSETS_DIR, precompressed: Path = PRECOMPRESSED_DIR) -> tornado.web.Application:
+    return tornado.web.Application(
+        [
+            (r"/metrics", MetricsHandler),
+            # Bundles are content-addressed ZIPs; no compressed variants.
+            (r"/assets/_bundles/(.*)", AssetHandler, {"path": str(BUNDLE_DIR), "route": "bundles"}),
+            (r"/assets/_styles/(.*)", AssetHandler, {"path": str(STYLE_CACHE_DIR), "route": "styles"}),
+            (
+                r"/assets/(.*)",
+                AssetHandler,
+                {"path": str(src), "precompressed_path": str(precompressed)},
+            ),
+        ]
+    )
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="build gzip/brotli variants of assets/, the card bundles and the stylesheet")
+    serve = sub.add_parser("serve", help="serve assets/ over HTTP")
+    serve.add_argument("--port", type=int, default=8502)
+    serve.add_argument("--address", default="0.0.0.0")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for entry in build_precompressed():
+            variants = ", ".join(f"{k}={entry[k]}" for k in ("br", "gzip") if k in entry) or "no variants"
+            print(f"{entry['name']}: {entry['size']} bytes ({variants})")
+        for bundle in build_all():
+            print(f"_bundles/{bundle.path.name}: {bundle.size} bytes")
+        sheet = build_stylesheet()
+        print(f"_styles/{sheet.path.name}: {sheet.size} bytes")
+        return
+
+    make_app().listen(args.port, address=args.address)
+    print(f"Serving {ASSETS_DIR} on http://{args.address}:{args.port}/assets/")
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
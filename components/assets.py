@@ -0,0 +1,457 @@
+"""
+Process-wide asset registry for the files under assets/.
+
+Every page and every session share one copy of each file. Pages ask for
+assets by logical ID (`get_asset("dots")`); the build manifest
+(assets/manifest.json, see components/asset_pipeline.py) maps each ID to its
+resolved path, size, hash and MIME type, preferring the web-optimised copy
+under assets/web/ (pass `print_quality=True` for the original).
+
+The manifest is validated once per process and the cache warmed in the
+background (`start_warmup`). After that a lookup is a dict hit plus, at most
+every REVALIDATE_INTERVAL seconds per asset, one stat call: a file whose
+mtime or size changed is re-read, so a replaced PDF reaches the pages, the
+search index and the bundle keys without a restart. Without a manifest,
+`load_asset` falls back to reading files by name. Either way a file is read
+once per version and stored by content hash (identical files share one bytes
+object).
+
+Downloads are served from Streamlit's media store under a stable,
+content-hash URL that is registered once per process and shared by all
+sessions (see `shared_media_url`). When the companion static server
+(components/asset_server.py) is deployed, DOTS_ASSET_BASE_URL points View and
+Download links at it instead (see `static_asset_url`).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from pathlib import Path
+
+from streamlit import config
+from streamlit.runtime import Runtime
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+from components.metrics import timed
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+MANIFEST_PATH = ASSETS_DIR / "manifest.json"
+
+# Seconds between stat calls on a cached asset's file.
+REVALIDATE_INTERVAL = 2.0
+
+# e.g. "https://assets.example.org/assets" (served by components/asset_server.py)
+ASSET_BASE_URL_ENV = "DOTS_ASSET_BASE_URL"
+
+# Logical asset IDs -> accepted file names under assets/ (first match wins).
+# Extra names cover the stray space before ".pdf" in some uploads.
+ASSET_FILES = {
+    "conversation_support_card": ("Conversation Support Card.pdf", "Conversation Support Card .pdf"),
+    "student_narrative_card": ("Student Narrative Card.pdf", "Student Narrative Card .pdf"),
+    "quick_staff_room_reference": ("Quick Staff Room Reference.pdf", "Quick Staff Room Reference .pdf"),
+    "dots": ("Dots.pdf",),
+    "waves": ("Waves.pdf",),
+    "pathways": ("Pathways.pdf",),
+    "color_guidelines": ("color_guidelines.pdf",),
+    "app_icon": ("Dots_icon.png",),
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Asset:
+    name: str
+    path: Path
+    data: bytes
+    sha256: str
+    size: int
+    mtime_ns: int
+    variant: str = "original"  # or "web"
+    asset_id: str | None = None
+    mime: str = "application/octet-stream"
+
+    @property
+    def relpath(self) -> str:
+        return self.path.relative_to(ASSETS_DIR).as_posix()
+
+
+_lock = threading.Lock()
+_assets_by_path: dict[Path, Asset] = {}
+_blobs_by_hash: dict[str, bytes] = {}
+_media_ids: dict[tuple[str, str, str, bool], str] = {}
+_assets_by_id: dict[tuple[str, bool], Asset] = {}
+_checked_at: dict[tuple[str, bool], float] = {}  # monotonic time of the last stat
+_manifest: dict | None = None
+_manifest_problems: dict[str, str] = {}
+_warmup_started = False
+_stats = {"hits": 0, "misses": 0}
+
+
+# -----------------------------
+# Build manifest
+# -----------------------------
+def load_manifest() -> dict:
+    """
+    Return the parsed assets/manifest.json ({} if it hasn't been built).
+    Read once per process: the manifest is a deploy artifact, regenerated by
+    the build step, so it isn't re-checked on reruns.
+    """
+    global _manifest
+    if _manifest is None:
+        try:
+            _manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _manifest_entry(asset_id: str) -> dict | None:
+    return load_manifest().get("assets", {}).get(asset_id)
+
+
+def _web_copy(name: str) -> str | None:
+    for entry in load_manifest().get("assets", {}).values():
+        if entry["original"]["path"] == name and "web" in entry:
+            return entry["web"]["path"]
+    return None
+
+
+# -----------------------------
+# Lookup helpers
+# -----------------------------
+def resolve_asset(*names: str, print_quality: bool = False) -> Path | None:
+    """
+    Return the first existing file among `names` (relative to assets/).
+    Several names let callers accept known filename variants, e.g. the stray
+    space in "Quick Staff Room Reference .pdf". Unless `print_quality` is set,
+    a name's web-optimised copy is preferred when the manifest has one.
+    """
+    for name in names:
+        web = None if print_quality else _web_copy(name)
+        for candidate in filter(None, (web, name)):
+            p = ASSETS_DIR / candidate
+            if p.is_file():
+                return p
+    return None
+
+
+def load_asset(*names: str, print_quality: bool = False) -> Asset | None:
+    """
+    Return the shared Asset for the first existing name, or None if none exist.
+    The file is only re-read when its mtime or size changed since the last load.
+    """
+    path = resolve_asset(*names, print_quality=print_quality)
+    if path is None:
+        return None
+    return _load_path(path)
+
+
+def _load_path(path: Path, asset_id: str | None = None) -> Asset:
+    stat = path.stat()
+    cached = _assets_by_path.get(path)
+    if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached
+
+    with _lock:
+        # Another thread may have refreshed it while we waited.
+        cached = _assets_by_path.get(path)
+        if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        data = _blobs_by_hash.setdefault(digest, data)
+
+        asset = Asset(
+            name=path.name,
+            path=path,
+            data=data,
+            sha256=digest,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            variant="original" if path.parent == ASSETS_DIR else "web",
+            asset_id=asset_id,
+            mime=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        )
+        _assets_by_path[path] = asset
+
+        # Drop blobs that no registered path points to any more.
+        if cached and cached.sha256 != digest:
+            live = {a.sha256 for a in _assets_by_path.values()}
+            if cached.sha256 not in live:
+                _blobs_by_hash.pop(cached.sha256, None)
+
+        return asset
+
+
+def _unchanged(asset: Asset) -> bool:
+    try:
+        stat = asset.path.stat()
+    except OSError:
+        return False
+    return stat.st_mtime_ns == asset.mtime_ns and stat.st_size == asset.size
+
+
+def get_asset(asset_id: str, print_quality: bool = False, revalidate: bool = False) -> Asset | None:
+    """
+    Return the shared Asset for a logical ID (see ASSET_FILES).
+
+    Once an ID has been resolved (by the warm-up or a first request) it is
+    served from memory. Its file is stat'ed at most every REVALIDATE_INTERVAL
+    seconds (always with `revalidate`, as the warm-up and the search index
+    do) and re-read when its mtime or size changed. IDs the manifest doesn't
+    cover fall back to a lookup by file name.
+    """
+    key = (asset_id, print_quality)
+    asset = _assets_by_id.get(key)
+    if asset is not None:
+        now = time.monotonic()
+        if not revalidate and now - _checked_at.get(key, 0.0) < REVALIDATE_INTERVAL:
+            _stats["hits"] += 1
+            return asset
+        _checked_at[key] = now
+        if _unchanged(asset):
+            _stats["hits"] += 1
+            return asset
+        _assets_by_id.pop(key, None)
+    _stats["misses"] += 1
+
+    # Cache misses read and hash the file; timed for the page metrics.
+    with timed("load_asset"):
+        entry = _manifest_entry(asset_id)
+        if entry is not None and asset_id not in _manifest_problems:
+            variant = entry["original"] if print_quality or "web" not in entry else entry["web"]
+            asset = _load_path(ASSETS_DIR / variant["path"], asset_id)
+            if asset.sha256 != variant["sha256"]:
+                _LOGGER.warning("Asset %s changed since the manifest was built; rebuild it.", asset_id)
+        else:
+            names = ASSET_FILES.get(asset_id, ())
+            path = resolve_asset(*names, print_quality=print_quality)
+            if path is None:
+                return None
+            asset = _load_path(path, asset_id)
+
+    _assets_by_id[key] = asset
+    _checked_at[key] = time.monotonic()
+    return asset
+
+
+def asset_bytes(asset_id: str, print_quality: bool = False) -> bytes | None:
+    asset = get_asset(asset_id, print_quality=print_quality)
+    return asset.data if asset else None
+
+
+# -----------------------------
+# Startup validation + warm-up
+# -----------------------------
+def validate_manifest() -> dict[str, str]:
+    """
+    Check every manifest entry against the files on disk (existence and size
+    for all files, content hash for the web copies that pages serve).
+    Returns {asset_id: problem}; entries with problems fall back to lookup
+    by file name.
+    """
+    problems = {}
+    manifest = load_manifest()
+    if not manifest:
+        return {"*": f"{MANIFEST_PATH.name} missing; run python -m components.asset_pipeline"}
+
+    for asset_id, entry in manifest.get("assets", {}).items():
+        for variant_name in ("original", "web"):
+            variant = entry.get(variant_name)
+            if variant is None:
+                continue
+            path = ASSETS_DIR / variant["path"]
+            try:
+                size = path.stat().st_size
+            except OSError:
+                problems[asset_id] = f"{variant['path']} missing"
+                break
+            if size != variant["size"]:
+                problems[asset_id] = f"{variant['path']} is {size} bytes, manifest says {variant['size']}"
+                break
+    return problems
+
+
+def warm_assets() -> dict[str, str]:
+    """Validate the manifest and load every served asset into the shared cache."""
+    global _manifest_problems
+    _manifest_problems = validate_manifest()
+    for asset_id, problem in _manifest_problems.items():
+        _LOGGER.warning("Asset manifest: %s: %s", asset_id, problem)
+
+    for asset_id in load_manifest().get("assets", {}) or ASSET_FILES:
+        try:
+            get_asset(asset_id, revalidate=True)
+            # Pages link the print-quality original next to each web copy.
+            if "web" in (_manifest_entry(asset_id) or {}):
+                get_asset(asset_id, print_quality=True, revalidate=True)
+        except OSError as e:
+            _manifest_problems[asset_id] = str(e)
+    return _manifest_problems
+
+
+def _warm():
+    warm_assets()
+    # The "download all cards" ZIPs are built from the assets just loaded.
+    # Imported here: bundles imports this module.
+    from components.bundles import build_all
+
+    try:
+        build_all()
+    except OSError as e:
+        _LOGGER.warning("Card bundles not built: %s", e)
+
+
+def start_warmup():
+    """Run `warm_assets` and build the card bundles once per process on a
+    background thread (no-op after the first call)."""
+    global _warmup_started
+    if _warmup_started:
+        return
+    _warmup_started = True
+    threading.Thread(target=_warm, name="dots-asset-warmup", daemon=True).start()
+
+
+def asset_health() -> dict[str, str]:
+    return dict(_manifest_problems)
+
+
+def asset_cache_stats() -> dict[str, int]:
+    """get_asset hits and misses, files loaded, and bytes held (shared blobs counted once)."""
+    with _lock:
+        return {**_stats, "assets": len(_assets_by_path), "bytes": sum(len(b) for b in _blobs_by_hash.values())}
+
+
+# -----------------------------
+# Shared media URLs
+# -----------------------------
+def _media_storage() -> MemoryMediaFileStorage | None:
+    if not Runtime.exists():
+        return None
+    # MediaFileManager has no public accessor for its storage. We go to the
+    # storage directly so the file is not tied to any one session: files the
+    # manager tracks per session are dropped when those sessions end.
+    # tests/test_streamlit_hooks.py guards the private name.
+    storage = getattr(Runtime.instance().media_file_mgr, "_storage", None)
+    if not isinstance(storage, MemoryMediaFileStorage):
+        _media_storage_missing()
+        return None
+    return storage
+
+
+@functools.cache
+def _media_storage_missing():
+    _LOGGER.warning(
+        "Streamlit's in-memory media storage not found (MediaFileManager._storage); "
+        "shared media URLs are off and files are sent per session."
+    )
+
+
+def media_store_stats() -> dict[str, int] | None:
+    """Files and bytes in Streamlit's media store (all sessions), or None without one."""
+    storage = _media_storage()
+    if storage is None:
+        return None
+    stats = storage.get_stats()
+    return {"files": len(stats), "bytes": sum(s.byte_length for s in stats)}
+
+
+def _media_has(storage: MemoryMediaFileStorage, file_id: str) -> bool:
+    try:
+        storage.get_file(file_id)
+    except MediaFileStorageError:
+        return False
+    return True
+
+
+def shared_media_url(
+    asset: Asset,
+    file_name: str | None = None,
+    mime: str = "application/pdf",
+    download: bool = True,
+) -> str | None:
+    """
+    Return a stable URL serving `asset` from Streamlit's media endpoint.
+
+    The file is registered once per process (per content hash, file name and
+    disposition) and reused by every session and rerun, so memory stays flat
+    as users grow. The `?v=` content-hash suffix lets browsers cache it.
+    Returns None when there is no media store to register with.
+    """
+    storage = _media_storage()
+    if storage is None:
+        return None
+
+    file_name = file_name or asset.name
+    key = (asset.sha256, file_name, mime, download)
+
+    file_id = _media_ids.get(key)
+    if file_id is None or not _media_has(storage, file_id):
+        with _lock:
+            file_id = storage.load_and_get_id(
+                asset.data,
+                mimetype=mime,
+                kind=MediaFileKind.DOWNLOADABLE if download else MediaFileKind.MEDIA,
+                filename=file_name,
+            )
+            _media_ids[key] = file_id
+
+    base = config.get_option("server.baseUrlPath").strip("/")
+    prefix = f"/{base}" if base else ""
+    return f"{prefix}{storage.get_url(file_id)}?v={asset.sha256[:16]}"
+
+
+# -----------------------------
+# Companion static server URLs
+# -----------------------------
+def static_asset_url(asset: Asset, download: bool = False) -> str | None:
+    """
+    Return a cacheable URL for `asset` on the companion static server, or None
+    when DOTS_ASSET_BASE_URL is not set. The `?v=` content hash makes the URL
+    immutable, so repeat visits are served from the browser cache.
+    """
+    return static_url(asset.relpath, asset.sha256, download)
+
+
+def static_original_url(asset_id: str, download: bool = True) -> str | None:
+    """Static-server URL for the print-quality original of `asset_id`, from
+    the manifest, without loading the (large) original into memory."""
+    entry = _manifest_entry(asset_id)
+    if not entry:
+        return None
+    return static_url(entry["original"]["path"], entry["original"]["sha256"], download)
+
+
+def static_url(relpath: str, sha256: str, download: bool, file_name: str | None = None) -> str | None:
+    """URL for `relpath` on the static server, versioned by content hash.
+    `file_name` is what a download is saved as (default: the file's own name)."""
+    base = os.environ.get(ASSET_BASE_URL_ENV, "").rstrip("/")
+    if not base:
+        return None
+    url = f"{base}/{urllib.parse.quote(relpath)}?v={sha256[:16]}"
+    if not download:
+        return url
+    url += "&download=1"
+    return url + "&name=" + urllib.parse.quote(file_name) if file_name else url
+
+
+if __name__ == "__main__":
+    # Deploy check: python -m components.assets
+    found = warm_assets()
+    for asset_id, problem in found.items():
+        print(f"{asset_id}: {problem}")
+    print("assets OK" if not found else f"{len(found)} asset problem(s)")
+    sys.exit(1 if found else 0)
@@ -0,0 +1,77 @@
+"""
+Pre-rendered static content blocks.
+
+Long static text (the Visual Tools expanders, the Guides and Phrases bodies)
+used to go out as markdown on every rerun, to be parsed again in the browser
+each time. Here each block is rendered to HTML once per (block id, language,
+content hash) and the cached fragment is what gets sent afterwards.
+
+Rendering uses markdown-it (CommonMark plus tables and strikethrough, the
+same flavour st.markdown accepts) with raw HTML disabled, so catalog text
+cannot inject markup and unsafe link schemes are dropped. The browser runs
+st.html output through its own sanitizer as well.
+
+The cache is a bounded LRU shared by every session in the process. A content
+change produces a new hash, so edited text is never served stale.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    from markdown_it import MarkdownIt  # installed with Streamlit (via rich)
+except ImportError:  # pragma: no cover - callers fall back to st.markdown
+    MarkdownIt = None
+
+# Every block on every page in every language comes to well under this.
+MAX_BLOCKS = 256
+
+_md = MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"]) if MarkdownIt else None
+
+_lock = threading.Lock()
+_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def blocks_available() -> bool:
+    return _md is not None
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def render_block(block_id: str, lang: str, text: str) -> str | None:
+    """Sanitised HTML for a static markdown block, or None without markdown-it."""
+    if _md is None:
+        return None
+    key = (block_id, lang, _content_hash(text))
+    with _lock:
+        html = _cache.get(key)
+        if html is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return html
+
+    html = f'<div class="dots-block">{_md.render(text)}</div>'
+    with _lock:
+        _stats["misses"] += 1
+        _cache[key] = html
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_BLOCKS:
+            _cache.popitem(last=False)
+            _stats["evictions"] += 1
+    return html
+
+
+def block_cache_stats() -> dict[str, int]:
+    with _lock:
+        return {**_stats, "size": len(_cache), "bytes": sum(len(h) for h in _cache.values())}
+
+
+def clear_blocks():
+    with _lock:
+        _cache.clear()
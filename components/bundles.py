@@ -0,0 +1,182 @@
+"""
+"Download all cards" bundles: one ZIP per language with the cards,
+the quick reference and the metaphor narratives.
+
+A bundle is built once per language and set of asset hashes. It is written to
+.cache/bundles under a content-addressed name and reused by every session and
+every process on the machine. A change to any PDF changes the key, and with it
+the file name. The bundles are built by the asset warm-up thread
+(components/assets.py), not by a page. The companion static server serves
+these files from disk in chunks (see components/asset_server.py), saved
+under the bundle's download name. Without that server, the bundle is
+registered once per process with Streamlit's media store, which holds files
+in memory: bundle_as_asset() reads the ZIP once and keeps the current bundle
+of each language (a few MB) for the life of the process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from components import catalog
+from components.assets import Asset, get_asset, static_url
+
+BUNDLE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "bundles"
+
+# Bump when the bundle layout changes so old cached ZIPs aren't reused.
+BUNDLE_VERSION = 1
+
+# Asset ids, in ZIP order. File names inside the ZIP, the README and the ZIP's
+# own name come from each language's catalog (ui.bundle.*).
+BUNDLE_CONTENTS = [
+    "conversation_support_card",
+    "student_narrative_card",
+    "quick_staff_room_reference",
+    "dots",
+    "waves",
+    "pathways",
+]
+
+
+@dataclass(frozen=True)
+class Bundle:
+    lang: str
+    path: Path
+    sha256: str
+    size: int
+    missing: tuple[str, ...]
+
+    @property
+    def download_name(self) -> str:
+        return catalog.text(self.lang, "ui.bundle.zip_name")
+
+
+_lock = threading.Lock()
+_bundles: dict[tuple[str, str], Bundle] = {}
+_bundle_assets: dict[str, Asset] = {}  # lang -> current bundle, read into memory
+_warmed = threading.Event()  # build_all() has run (see start_warmup)
+
+
+def _members(lang: str) -> tuple[list[tuple[Asset, str]], tuple[str, ...]]:
+    members, missing = [], []
+    names = catalog.catalog(lang)
+    for asset_id in BUNDLE_CONTENTS:
+        asset = get_asset(asset_id)
+        if asset is None:
+            missing.append(asset_id)
+        else:
+            members.append((asset, names.get(f"ui.bundle.files.{asset_id}", asset.name)))
+    return members, tuple(missing)
+
+
+def _bundle_key(lang: str, members: list[tuple[Asset, str]]) -> str:
+    h = hashlib.sha256(f"v{BUNDLE_VERSION}:{lang}".encode("utf-8"))
+    for asset, name in members:
+        h.update(f"\0{name}\0{asset.sha256}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _write_zip(target: Path, lang: str, members: list[tuple[Asset, str]]):
+    # PDFs are already compressed, so they are stored rather than deflated.
+    # Files are copied in chunks from disk, so building needs no memory for
+    # the ZIP (serving it through the media store does; see bundle_as_asset).
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr(
+            zipfile.ZipInfo("README.txt", date_time=(2024, 1, 1, 0, 0, 0)),
+            catalog.text(lang, "ui.bundle.readme"),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+        for asset, name in members:
+            info = zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0))
+            info.file_size = asset.size
+            with asset.path.open("rb") as src, zf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, 1 << 16)
+    tmp.replace(target)
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_bundle(lang: str, build: bool = True) -> Bundle | None:
+    """
+    Return the bundle for `lang`, building it on first use. Later calls with
+    the same asset hashes return the cached Bundle without touching disk.
+    Returns None if none of the bundled assets are available, or, with
+    `build=False`, if the bundle isn't ready yet.
+    """
+    members, missing = _members(lang)
+    if not members:
+        return None
+    key = _bundle_key(lang, members)
+    bundle = _bundles.get((lang, key))
+    if bundle is not None or not build:
+        return bundle
+
+    with _lock:
+        bundle = _bundles.get((lang, key))
+        if bundle is not None:
+            return bundle
+
+        path = BUNDLE_DIR / f"dots-cards-{catalog.language_code(lang)}-{key[:16]}.zip"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_zip(path, lang, members)
+        bundle = Bundle(lang=lang, path=path, sha256=_file_sha256(path), size=path.stat().st_size, missing=missing)
+        _bundles[(lang, key)] = bundle
+        return bundle
+
+
+def build_all() -> list[Bundle]:
+    """Build the bundles for every language. The asset warm-up thread runs
+    this, so the first visitor doesn't wait for a ZIP to be written."""
+    try:
+        return [b for b in (get_bundle(lang) for lang in catalog.languages()) if b is not None]
+    finally:
+        _warmed.set()
+
+
+def bundles_warmed() -> bool:
+    """True once build_all() has run in this process."""
+    return _warmed.is_set()
+
+
+def bundle_as_asset(bundle: Bundle) -> Asset:
+    """
+    The bundle as an Asset, for the shared media registration and the
+    deferred download button, which both need its bytes. The ZIP is read
+    once and kept while it is its language's current bundle; a rebuilt
+    bundle replaces it.
+    """
+    asset = _bundle_assets.get(bundle.lang)
+    if asset is None or asset.sha256 != bundle.sha256:
+        stat = bundle.path.stat()
+        asset = Asset(
+            name=bundle.download_name,
+            path=bundle.path,
+            data=bundle.path.read_bytes(),
+            sha256=bundle.sha256,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            variant="bundle",
+            mime="application/zip",
+        )
+        _bundle_assets[bundle.lang] = asset
+    return asset
+
+
+def static_bundle_url(bundle: Bundle) -> str | None:
+    """URL of `bundle` on the companion static server (served from BUNDLE_DIR
+    under /assets/_bundles/), or None when DOTS_ASSET_BASE_URL is not set."""
+    return static_url(f"_bundles/{bundle.path.name}", bundle.sha256, download=True, file_name=bundle.download_name)
@@ -0,0 +1,182 @@
+"""
+Bilingual content catalog.
+
+All user-facing text lives in content/<lang>.toml, one file per language, as
+nested tables (`[guides.parents]` + `body = ...` is the key
+"guides.parents.body"). content/languages.toml lists the languages in toggle
+order and names the default.
+
+Each language is compiled the first time it is selected: its file is parsed,
+flattened to dotted keys and laid over the default language, so a missing
+translation falls back once at compile time rather than on every lookup.
+After that a lookup is a single dict hit, and languages nobody selects are
+never loaded.
+
+refresh() picks up edited files: the new tables are built aside and swapped
+in whole, so a script reading text meanwhile never sees a half-loaded
+catalog.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: the toml package Streamlit already depends on
+    tomllib = None
+    import toml
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+LANGUAGES_FILE = CONTENT_DIR / "languages.toml"
+
+_LOGGER = logging.getLogger(__name__)
+
+_lock = threading.RLock()
+
+
+@dataclass(frozen=True)
+class _State:
+    languages: dict[str, str]  # display name -> catalog file, in toggle order
+    default: str
+    stamp: tuple  # file mtimes the tables were built from
+    tables: dict[str, dict[str, object]]  # compiled so far; only ever grows
+
+
+# Replaced whole by reload(), so a lookup sees one consistent catalog.
+_state: _State | None = None
+
+
+def _flatten(table: dict, prefix: str = "") -> dict[str, object]:
+    flat = {}
+    for key, value in table.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _read(path: Path) -> dict:
+    if tomllib is None:
+        return toml.loads(path.read_text(encoding="utf-8"))
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _files(languages: dict[str, str]) -> list[Path]:
+    return [LANGUAGES_FILE] + [CONTENT_DIR / name for name in languages.values()]
+
+
+def _load() -> _State:
+    data = _read(LANGUAGES_FILE)
+    langs = dict(data["languages"])
+    stamp = tuple(_mtime(p) for p in _files(langs))
+    return _State(langs, data.get("default") or next(iter(langs)), stamp, {})
+
+
+def _current() -> _State:
+    global _state
+    state = _state
+    if state is None:
+        with _lock:
+            if _state is None:
+                _state = _load()
+            state = _state
+    return state
+
+
+def languages() -> list[str]:
+    """Language display names, in toggle order."""
+    return list(_current().languages)
+
+
+def default_language() -> str:
+    return _current().default
+
+
+def language_code(lang: str) -> str:
+    """Short code for `lang` from its catalog file name ("ja.toml" -> "ja"),
+    the default language's if unknown."""
+    state = _current()
+    return Path(state.languages.get(lang) or state.languages[state.default]).stem
+
+
+def _compile(state: _State, lang: str) -> dict[str, object]:
+    path = CONTENT_DIR / state.languages[lang]
+    own = _flatten(_read(path))
+    if lang == state.default:
+        return own
+
+    base = _table(state, state.default)
+    unknown = own.keys() - base.keys()
+    if unknown:
+        # Usually a typo or a key renamed in the default catalog only.
+        _LOGGER.warning("%s: %d keys not in the default catalog: %s", path.name, len(unknown), sorted(unknown)[:5])
+    return {**base, **own}
+
+
+def _table(state: _State, lang: str) -> dict[str, object]:
+    table = state.tables.get(lang)
+    if table is None:
+        with _lock:
+            table = state.tables.get(lang)
+            if table is None:
+                table = state.tables[lang] = _compile(state, lang)
+    return table
+
+
+def catalog(lang: str) -> dict[str, object]:
+    """The compiled key -> text table for `lang` (the default language's if unknown)."""
+    state = _current()
+    table = state.tables.get(lang)
+    if table is not None:
+        return table
+    return _table(state, lang if lang in state.languages else state.default)
+
+
+def text(lang: str, key: str) -> str:
+    """Lookup for code that has a language but no session (components, scripts)."""
+    return catalog(lang).get(key, key)
+
+
+def stamp() -> tuple:
+    """Changes whenever the published catalog does; a cache key for derived data."""
+    return _current().stamp
+
+
+def reload():
+    """
+    Re-read the files. The languages already in use are compiled into a new
+    state first and published in one assignment, so lookups meanwhile keep
+    seeing the old catalog, never a half-built one.
+    """
+    global _state
+    with _lock:
+        old = _state
+        state = _load()
+        for lang in [state.default, *(old.tables if old else ())]:
+            if lang in state.languages:
+                _table(state, lang)
+        _state = state
+
+
+def refresh() -> bool:
+    """reload() if a catalog file changed since the published tables were
+    built. Returns whether it did."""
+    state = _current()
+    if tuple(_mtime(p) for p in _files(state.languages)) == state.stamp:
+        return False
+    reload()
+    return True
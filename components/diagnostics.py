@@ -0,0 +1,257 @@
+"""
+Operational diagnostics: live sessions, cache effectiveness and rerun latency.
+
+snapshot() collects, for this process:
+
+- active sessions and the size of each one's session state
+- asset cache hits/misses and bytes held (components/assets.py), and the
+  files and bytes in Streamlit's media store
+- static block cache stats (components/blocks.py)
+- remote-fallback fetch counts (components/remote.py)
+- feedback writer counts and queue depth (components/feedback.py), and
+  the outbox's depth and sync counts (components/outbox.py)
+- rerun latency and bytes sent per page (components/metrics.py)
+
+The Admin page (app_pages/9_Admin.py) shows it. prometheus_text() renders
+the same figures in the Prometheus text format, and start_exporter() serves
+that at /metrics from a background thread when DOTS_METRICS_PORT is set
+(bound to DOTS_METRICS_ADDRESS, default 127.0.0.1).
+
+Both are gated by DOTS_ADMIN_TOKEN: the page asks for it, and the endpoint
+wants it as a bearer token. Without a token the page is not registered and
+the endpoint is open, so only bind it to a private address. Local scrape:
+
+    DOTS_ADMIN_TOKEN=secret DOTS_METRICS_PORT=9464 streamlit run app.py
+    curl -H "Authorization: Bearer secret" http://127.0.0.1:9464/metrics
+
+The companion static server exposes its bytes served at its own /metrics
+(components/asset_server.py).
+
+http.server and the remote, feedback and outbox modules are imported when
+first needed: the app imports this module on every cold start for
+admin_token().
+"""
+
+from __future__ import annotations
+
+import functools
+import hmac
+import logging
+import os
+import threading
+
+from streamlit.runtime import Runtime
+
+from components.assets import asset_cache_stats, media_store_stats
+from components.blocks import block_cache_stats
+from components.metrics import LATENCY_BUCKETS, latency_histograms
+
+ADMIN_TOKEN_ENV = "DOTS_ADMIN_TOKEN"
+METRICS_PORT_ENV = "DOTS_METRICS_PORT"
+METRICS_ADDRESS_ENV = "DOTS_METRICS_ADDRESS"
+
+_LOGGER = logging.getLogger(__name__)
+
+_exporter_started = False
+
+
+# -----------------------------
+# Access
+# -----------------------------
+def admin_token() -> str | None:
+    return os.environ.get(ADMIN_TOKEN_ENV) or None
+
+
+def check_token(given: str | None) -> bool:
+    """True if `given` matches DOTS_ADMIN_TOKEN (never when no token is set)."""
+    token = admin_token()
+    if not token or not given:
+        return False
+    return hmac.compare_digest(given.encode("utf-8"), token.encode("utf-8"))
+
+
+# -----------------------------
+# Collection
+# -----------------------------
+def _session_manager():
+    if not Runtime.exists():
+        return None
+    # The runtime has no public accessor for its session manager
+    # (tests/test_streamlit_hooks.py guards the private name).
+    manager = getattr(Runtime.instance(), "_session_mgr", None)
+    if manager is None:
+        _session_manager_missing()
+    return manager
+
+
+@functools.cache
+def _session_manager_missing():
+    _LOGGER.warning("Runtime._session_mgr not found in this Streamlit version; session sizes are not reported.")
+
+
+def sessions() -> list[dict]:
+    """Active sessions with their session-state size in bytes, largest first."""
+    manager = _session_manager()
+    if manager is None:
+        return []
+
+    rows = []
+    for info in manager.list_active_sessions():
+        try:
+            size = sum(stat.byte_length for stat in info.session.session_state.get_stats())
+        except RuntimeError:
+            # State changed size mid-walk (its script is running); skip this pass.
+            size = None
+        rows.append({"id": info.session.id, "state_bytes": size})
+    return sorted(rows, key=lambda row: row["state_bytes"] or 0, reverse=True)
+
+
+def snapshot() -> dict:
+    from components.feedback import feedback_store
+    from components.outbox import outbox
+    from components.remote import remote_fetcher
+
+    return {
+        "sessions": sessions(),
+        "assets": asset_cache_stats(),
+        "media_store": media_store_stats(),
+        "blocks": block_cache_stats(),
+        "remote": dict(remote_fetcher.stats),
+        "feedback": {**feedback_store.stats, "pending": feedback_store.pending()},
+        "outbox": outbox.status(),
+        "pages": latency_histograms(),
+    }
+
+
+# -----------------------------
+# Prometheus text format
+# -----------------------------
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    # Counters stay exact; "%g" would round large byte counts.
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render_families(families: list[tuple]) -> str:
+    """
+    Render (name, type, help, samples) families; each sample is
+    (name suffix, labels, value).
+    """
+    lines = []
+    for name, kind, help_text, samples in families:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{_labels(labels)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def prometheus_text() -> str:
+    snap = snapshot()
+    assets, blocks, media = snap["assets"], snap["blocks"], snap["media_store"] or {}
+
+    latency = []
+    for page, hist in sorted(snap["pages"].items()):
+        for bound, count in zip(LATENCY_BUCKETS, hist["buckets"]):
+            latency.append(("_bucket", {"page": page, "le": f"{bound:g}"}, count))
+        latency += [
+            ("_bucket", {"page": page, "le": "+Inf"}, hist["count"]),
+            ("_sum", {"page": page}, hist["sum"]),
+            ("_count", {"page": page}, hist["count"]),
+        ]
+
+    families = [
+        ("dots_active_sessions", "gauge", "Sessions with an open connection.",
+         [("", {}, len(snap["sessions"]))]),
+        ("dots_session_state_bytes", "gauge", "Approximate size of each active session's state.",
+         [("", {"session": s["id"]}, s["state_bytes"]) for s in snap["sessions"] if s["state_bytes"] is not None]),
+        ("dots_asset_cache_requests_total", "counter", "Asset lookups by result.",
+         [("", {"result": "hit"}, assets["hits"]), ("", {"result": "miss"}, assets["misses"])]),
+        ("dots_asset_cache_bytes", "gauge", "Asset bytes held in memory (shared across sessions).",
+         [("", {}, assets["bytes"])]),
+        ("dots_media_store_files", "gauge", "Files in Streamlit's media store.",
+         [("", {}, media.get("files", 0))]),
+        ("dots_media_store_bytes", "gauge", "Bytes in Streamlit's media store.",
+         [("", {}, media.get("bytes", 0))]),
+        ("dots_block_cache_requests_total", "counter", "Static block renders by result.",
+         [("", {"result": "hit"}, blocks["hits"]), ("", {"result": "miss"}, blocks["misses"])]),
+        ("dots_block_cache_evictions_total", "counter", "Static blocks evicted from the cache.",
+         [("", {}, blocks["evictions"])]),
+        ("dots_remote_fetches_total", "counter", "Remote-fallback fetches by outcome.",
+         [("", {"outcome": outcome}, count) for outcome, count in sorted(snap["remote"].items())]),
+        ("dots_feedback_rows_total", "counter", "Feedback submissions by outcome.",
+         [("", {"outcome": outcome}, snap["feedback"][outcome]) for outcome in ("queued", "written", "failed")]),
+        ("dots_feedback_pending", "gauge", "Feedback submissions queued but not yet written.",
+         [("", {}, snap["feedback"]["pending"])]),
+        ("dots_feedback_outbox_rows", "gauge", "Stored submissions not yet synced, by state.",
+         [("", {"state": state}, snap["outbox"][state]) for state in ("waiting", "retrying", "rejected")]),
+        ("dots_feedback_synced_total", "counter", "Submissions delivered to the sync backend.",
+         [("", {}, snap["outbox"]["sent"])]),
+        ("dots_rerun_duration_seconds", "histogram", "Script run wall time per page.", latency),
+        ("dots_rerun_bytes_total", "counter", "Bytes queued for the browser per page.",
+         [("", {"page": page}, hist["bytes"]) for page, hist in sorted(snap["pages"].items())]),
+        ("dots_rerun_errors_total", "counter", "Script runs that raised, per page.",
+         [("", {"page": page}, hist["errors"]) for page, hist in sorted(snap["pages"].items())]),
+    ]
+    return render_families(families)
+
+
+# -----------------------------
+# Exporter
+# -----------------------------
+def _metrics_handler():
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            if admin_token():
+                scheme, _, given = self.headers.get("Authorization", "").partition(" ")
+                if scheme.lower() != "bearer" or not check_token(given.strip()):
+                    self.send_error(401)
+                    return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            _LOGGER.debug("metrics: " + format, *args)
+
+    return MetricsHandler
+
+
+def start_exporter() -> int | None:
+    """
+    Serve /metrics on DOTS_METRICS_PORT from a daemon thread, once per
+    process. Returns the port, or None when the exporter is off.
+    """
+    global _exporter_started
+    port = os.environ.get(METRICS_PORT_ENV)
+    if not port or _exporter_started:
+        return None
+    _exporter_started = True
+
+    from http.server import ThreadingHTTPServer
+
+    address = os.environ.get(METRICS_ADDRESS_ENV, "127.0.0.1")
+    try:
+        server = ThreadingHTTPServer((address, int(port)), _metrics_handler())
+    except (OSError, ValueError) as e:
+        _LOGGER.warning("Metrics exporter not started on %s:%s: %s", address, port, e)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="dots-metrics", daemon=True).start()
+    return server.server_address[1]
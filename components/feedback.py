@@ -0,0 +1,381 @@
+"""
+Feedback store: submissions from the Feedback page's in-app form, kept in
+SQLite under data/ so they survive restarts.
+
+submit() never touches the database. It puts the row on an in-process queue
+and returns, and one writer thread per process drains the queue in batches:
+up to BATCH_SIZE rows, or whatever arrived within FLUSH_INTERVAL of the
+first, go in one transaction. A room of staff submitting at once after a
+workshop costs a few commits, not one per person. The database runs in WAL
+mode, so reads (the Admin page's export) and the writer don't block each
+other.
+
+Each batch also updates feedback_daily, in the same transaction: one row
+per UTC day, language, role and rating, with submission and comment counts.
+Dashboards read that (rollups()), so their cost follows the number of days
+and groups, not the number of submissions. rebuild_rollups() recomputes it
+from the raw rows with pandas, in chunks. A database without rollups (from
+before they existed) is backfilled when the writer thread opens it.
+
+Only the writer sets up the schema. Reads (counts, the export, rollups) open
+the file with connect_read() and nothing else.
+
+DOTS_FEEDBACK_DB overrides the path. Rows still queued at exit are written
+by an atexit hook. A batch that keeps failing is logged in full rather than
+dropped silently.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+DB_ENV = "DOTS_FEEDBACK_DB"
+DEFAULT_DB = Path(__file__).resolve().parent.parent / "data" / "feedback.db"
+
+# The team's Google Form: embedded on the Feedback page, and where the outbox
+# (components/outbox.py) can forward stored submissions.
+FORM_URL = "https://docs.google.com/forms/d/e/1FAIpQLScifOKrnjNajCSDbCwWBGdaw8HfZzH5lEaz9qZY5BZtysfJ_w/viewform?usp=send_form"
+
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.25  # seconds a batch waits for more rows
+WRITE_RETRIES = 3
+
+# Language-independent role keys, in the order of feedback.backup.role_options.
+ROLES = ("educator", "school_staff", "parent", "student", "other")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    submitted_at TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    role TEXT NOT NULL,
+    rating INTEGER NOT NULL CHECK (rating BETWEEN 1 AND 5),
+    comment TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS feedback_submitted_at ON feedback (submitted_at);
+CREATE TABLE IF NOT EXISTS feedback_daily (
+    day TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    role TEXT NOT NULL,
+    rating INTEGER NOT NULL,
+    submissions INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    comment_chars INTEGER NOT NULL,
+    PRIMARY KEY (day, lang, role, rating)
+) WITHOUT ROWID;
+"""
+
+COLUMNS = ("submitted_at", "lang", "name", "role", "rating", "comment")
+
+# feedback_daily: group keys, then additive counts (comments = non-empty ones).
+ROLLUP_KEYS = ("day", "lang", "role", "rating")
+ROLLUP_VALUES = ("submissions", "comments", "comment_chars")
+
+_INSERT_ROLLUP = f"INSERT INTO feedback_daily ({', '.join(ROLLUP_KEYS + ROLLUP_VALUES)}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_UPSERT_ROLLUP = (
+    _INSERT_ROLLUP
+    + " ON CONFLICT (day, lang, role, rating) DO UPDATE SET "
+    + ", ".join(f"{v} = {v} + excluded.{v}" for v in ROLLUP_VALUES)
+)
+
+REBUILD_CHUNK = 50_000
+
+_LOGGER = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class Submission:
+    role: str
+    rating: int
+    comment: str = ""
+    name: str = ""
+    lang: str = ""
+    submitted_at: str = field(default_factory=_now)  # UTC, ISO 8601
+
+    def validate(self):
+        """Raise ValueError for a row the schema would refuse."""
+        if isinstance(self.rating, bool) or not isinstance(self.rating, int) or not 1 <= self.rating <= 5:
+            raise ValueError(f"rating must be an integer from 1 to 5, not {self.rating!r}")
+        if not self.role:
+            raise ValueError("role is required")
+
+
+def db_path() -> Path:
+    return Path(os.environ.get(DB_ENV) or DEFAULT_DB)
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open (and if needed create) the store in WAL mode. For the writer thread;
+    reads use connect_read()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # With WAL, NORMAL only risks the last commits on power loss, not corruption.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    has_rows, has_rollups = conn.execute(
+        "SELECT EXISTS (SELECT 1 FROM feedback), EXISTS (SELECT 1 FROM feedback_daily)"
+    ).fetchone()
+    if has_rows and not has_rollups:
+        rebuild_rollups(conn)
+    return conn
+
+
+def connect_read(path: Path) -> sqlite3.Connection:
+    """Open an existing store for reading: just the file, no schema setup or
+    backfill. WAL mode is a property of the file, so readers needn't set it."""
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+# -----------------------------
+# Rollups
+# -----------------------------
+def _rollup_rows(batch: list[Submission]) -> list[tuple]:
+    totals: dict[tuple, list[int]] = {}
+    for s in batch:
+        counts = totals.setdefault((s.submitted_at[:10], s.lang, s.role, s.rating), [0, 0, 0])
+        counts[0] += 1
+        counts[1] += bool(s.comment)
+        counts[2] += len(s.comment)
+    return [(*key, *counts) for key, counts in totals.items()]
+
+
+def rebuild_rollups(conn: sqlite3.Connection, chunksize: int = REBUILD_CHUNK):
+    """Recompute feedback_daily from the raw rows, holding the write lock meanwhile."""
+    import pandas as pd
+
+    query = (
+        "SELECT substr(submitted_at, 1, 10) AS day, lang, role, rating, "
+        "length(comment) AS comment_chars FROM feedback"
+    )
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        parts = []
+        for chunk in pd.read_sql_query(query, conn, chunksize=chunksize):
+            chunk["submissions"] = 1
+            chunk["comments"] = (chunk["comment_chars"] > 0).astype("int64")
+            parts.append(chunk.groupby(list(ROLLUP_KEYS), sort=False)[list(ROLLUP_VALUES)].sum())
+        conn.execute("DELETE FROM feedback_daily")
+        if parts:
+            totals = pd.concat(parts).groupby(level=list(ROLLUP_KEYS)).sum().reset_index()
+            conn.executemany(_INSERT_ROLLUP, totals.itertuples(index=False, name=None))
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+class FeedbackStore:
+    def __init__(
+        self,
+        path: Path | None = None,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        retries: int = WRITE_RETRIES,
+        backoff: float = 0.2,
+    ):
+        self._path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.backoff = backoff
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._conn: sqlite3.Connection | None = None  # writer thread only
+        self.stats = {"queued": 0, "written": 0, "batches": 0, "failed": 0}
+
+    @property
+    def path(self) -> Path:
+        return self._path or db_path()
+
+    # -----------------------------
+    # Public API (never blocks on the database)
+    # -----------------------------
+    def submit(self, submission: Submission):
+        # Checked here so a bad row fails its caller, not a whole batch later.
+        submission.validate()
+        self.start()
+        with self._lock:
+            self.stats["queued"] += 1
+        self._queue.put(submission)
+
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued row is written. For scripts and tests, not pages."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def start(self):
+        """Start the writer thread (once per process)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="dots-feedback", daemon=True)
+            atexit.register(self.close)
+        self._thread.start()
+
+    def close(self, timeout: float = 10.0):
+        """Write what is queued and stop the writer."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    def count(self) -> int:
+        if not self.path.exists():
+            return 0
+        with closing(connect_read(self.path)) as conn:
+            return conn.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+
+    def export_csv(self) -> bytes:
+        """Every stored submission, oldest first, as UTF-8 CSV (with a BOM, for Excel)."""
+        import csv
+        import io
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(COLUMNS)
+        if self.path.exists():
+            with closing(connect_read(self.path)) as conn:
+                writer.writerows(conn.execute(f"SELECT {', '.join(COLUMNS)} FROM feedback ORDER BY id"))
+        return buf.getvalue().encode("utf-8-sig")
+
+    def version(self) -> int:
+        """Changes whenever rows are added; a cache key for rollups()."""
+        if not self.path.exists():
+            return 0
+        with closing(connect_read(self.path)) as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM feedback").fetchone()[0]
+
+    def rollups(self):
+        """feedback_daily as a pandas DataFrame, with `day` as a datetime."""
+        import pandas as pd
+
+        columns = list(ROLLUP_KEYS + ROLLUP_VALUES)
+        if not self.path.exists():
+            return pd.DataFrame(columns=columns)
+        with closing(connect_read(self.path)) as conn:
+            df = pd.read_sql_query(f"SELECT {', '.join(columns)} FROM feedback_daily", conn)
+        df["day"] = pd.to_datetime(df["day"])
+        return df
+
+    def rebuild_rollups(self):
+        with closing(connect(self.path)) as conn:
+            rebuild_rollups(conn)
+
+    # -----------------------------
+    # Writer thread
+    # -----------------------------
+    def _run(self):
+        try:
+            # An existing store gets its schema (and any missing rollups) now,
+            # rather than at the first submission. A new one is created by
+            # the first write.
+            if self.path.exists():
+                try:
+                    self._conn = connect(self.path)
+                except (sqlite3.Error, OSError) as e:
+                    _LOGGER.warning("Feedback store not opened: %s", e)
+            stopping = False
+            while not stopping:
+                first = self._queue.get()
+                if first is _STOP:
+                    self._queue.task_done()
+                    break
+                batch = [first]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        self._queue.task_done()
+                        stopping = True
+                        break
+                    batch.append(item)
+                try:
+                    self._write(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _write(self, batch: list[Submission]):
+        rows = [tuple(getattr(s, column) for column in COLUMNS) for s in batch]
+        for attempt in range(self.retries):
+            try:
+                # Opened here, not at thread start, so a missing or locked file is retried too.
+                if self._conn is None:
+                    self._conn = connect(self.path)
+                # Rows and their rollups commit together, so the two never disagree.
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT INTO feedback ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                        rows,
+                    )
+                    self._conn.executemany(_UPSERT_ROLLUP, _rollup_rows(batch))
+            except sqlite3.IntegrityError as e:
+                # Retrying won't help, and one bad row fails the transaction:
+                # write the rows one by one so only the bad one is lost.
+                if len(batch) > 1:
+                    for submission in batch:
+                        self._write([submission])
+                    return
+                with self._lock:
+                    self.stats["failed"] += 1
+                _LOGGER.error("Feedback row refused (%s): %s", e, json.dumps(asdict(batch[0]), ensure_ascii=False))
+                return
+            except (sqlite3.Error, OSError) as e:
+                _LOGGER.warning("Feedback batch of %d not written (attempt %d): %s", len(rows), attempt + 1, e)
+                if attempt + 1 < self.retries:
+                    time.sleep(self.backoff * (2**attempt))
+                continue
+            with self._lock:
+                self.stats["written"] += len(rows)
+                self.stats["batches"] += 1
+            return
+
+        with self._lock:
+            self.stats["failed"] += len(rows)
+        # Last resort: keep the submissions in the log so they can be recovered.
+        _LOGGER.error("Feedback batch lost: %s", json.dumps([asdict(s) for s in batch], ensure_ascii=False))
+
+
+feedback_store = FeedbackStore()
@@ -0,0 +1,178 @@
+"""
+Per-run performance metrics.
+
+Each instrumented script run (see ui.page_metrics) records:
+
+- wall-clock time of the run
+- time spent in named helpers (apply_brand_styles, the PDF loaders, page
+  sections, ...)
+- the number of elements emitted
+- the approximate bytes sent to the browser
+
+(The last two are None when Streamlit offers no way to count them; see
+ui.page_metrics.)
+
+Runs are tagged by page and language. They are kept in an in-process ring
+buffer of the last RING_SIZE runs (DOTS_METRICS_RING, default 500), and
+export_json() dumps them for comparison across content changes.
+
+Rerun latency is also kept per page as cumulative histograms over
+LATENCY_BUCKETS (latency_histograms()), for the Prometheus exporter in
+components/diagnostics.py; unlike the ring, these never drop old runs.
+
+This module has no Streamlit dependency, so low-level code (asset loading)
+can report helper timings too. timed() is a no-op outside an instrumented
+run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+RING_SIZE = int(os.environ.get("DOTS_METRICS_RING", "500"))
+
+# Upper bounds in seconds (Prometheus convention); +Inf is implied.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class RunMetrics:
+    page: str
+    lang: str
+    started_at: float
+    wall_ms: float = 0.0
+    elements: int | None = 0
+    bytes_sent: int | None = 0
+    helpers: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+_lock = threading.Lock()
+_runs: deque[RunMetrics] = deque(maxlen=RING_SIZE)
+_histograms: dict[str, dict] = {}
+_local = threading.local()
+
+
+def current_run() -> RunMetrics | None:
+    return getattr(_local, "run", None)
+
+
+@contextmanager
+def track_run(page: str, lang: str):
+    """Record one script run; yields the RunMetrics being filled in."""
+    run = RunMetrics(page=page, lang=lang, started_at=time.time())
+    previous, _local.run = current_run(), run
+    started = time.perf_counter()
+    try:
+        yield run
+    except Exception as e:
+        run.error = type(e).__name__
+        raise
+    finally:
+        run.wall_ms = (time.perf_counter() - started) * 1000
+        _local.run = previous
+        with _lock:
+            _runs.append(run)
+            _observe(run)
+
+
+def _observe(run: RunMetrics):
+    # Called with _lock held.
+    hist = _histograms.get(run.page)
+    if hist is None:
+        hist = _histograms[run.page] = {
+            "buckets": [0] * len(LATENCY_BUCKETS),
+            "count": 0,
+            "sum": 0.0,
+            "bytes": 0,
+            "errors": 0,
+        }
+    seconds = run.wall_ms / 1000
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            hist["buckets"][i] += 1
+    hist["count"] += 1
+    hist["sum"] += seconds
+    hist["bytes"] += run.bytes_sent or 0
+    hist["errors"] += run.error is not None
+
+
+def record_helper(name: str, ms: float):
+    run = current_run()
+    if run is not None:
+        run.helpers[name] = run.helpers.get(name, 0.0) + ms
+
+
+@contextmanager
+def timed(name: str):
+    """Add the time spent in the block to helper `name` of the current run."""
+    if current_run() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_helper(name, (time.perf_counter() - started) * 1000)
+
+
+def recent_runs(limit: int | None = None) -> list[RunMetrics]:
+    with _lock:
+        runs = list(_runs)
+    return runs[-limit:] if limit else runs
+
+
+def summary() -> list[dict]:
+    """Per (page, language): run count, p50/p95 wall time, mean elements and bytes."""
+    groups: dict[tuple[str, str], list[RunMetrics]] = {}
+    for run in recent_runs():
+        groups.setdefault((run.page, run.lang), []).append(run)
+
+    rows = []
+    for (page, lang), runs in sorted(groups.items()):
+        walls = sorted(r.wall_ms for r in runs)
+        rows.append({
+            "page": page,
+            "lang": lang,
+            "runs": len(runs),
+            "p50_ms": round(statistics.median(walls), 2),
+            "p95_ms": round(walls[min(len(walls) - 1, int(len(walls) * 0.95))], 2),
+            "elements": _mean([r.elements for r in runs], 1),
+            "bytes": _mean([r.bytes_sent for r in runs], 0),
+        })
+    return rows
+
+
+def _mean(values: list[int | None], digits: int) -> float | None:
+    counted = [v for v in values if v is not None]
+    if not counted:
+        return None
+    mean = round(statistics.mean(counted), digits)
+    return mean if digits else int(mean)
+
+
+def latency_histograms() -> dict[str, dict]:
+    """Per page: cumulative bucket counts, run count, total seconds, bytes and errors."""
+    with _lock:
+        return {page: {**hist, "buckets": list(hist["buckets"])} for page, hist in _histograms.items()}
+
+
+def export_json(indent: int | None = 2) -> str:
+    return json.dumps(
+        {"ring_size": RING_SIZE, "summary": summary(), "runs": [asdict(r) for r in recent_runs()]},
+        ensure_ascii=False,
+        indent=indent,
+    )
+
+
+def clear():
+    with _lock:
+        _runs.clear()
+        _histograms.clear()
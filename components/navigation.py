@@ -0,0 +1,55 @@
+"""
+The app's pages, in sidebar order.
+
+app.py builds st.navigation from this list, and search uses it to link
+results to their pages.
+URL paths are fixed here, and match the old pages/ directory names, so
+bookmarks keep working and the URLs don't change with the language.
+
+Admin pages are only registered when DOTS_ADMIN_TOKEN is set (see
+components/diagnostics.py).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PageSpec:
+    path: str
+    url_path: str
+    title_key: str
+    default: bool = False
+    admin: bool = False
+
+
+PAGES = [
+    PageSpec("app_pages/1_Home.py", "Home", "nav.home", default=True),
+    PageSpec("app_pages/2_Phrases_and_Scripts.py", "Phrases_and_Scripts", "nav.phrases"),
+    PageSpec("app_pages/3_Visual_Tools.py", "Visual_Tools", "nav.visual_tools"),
+    PageSpec("app_pages/4_Guides.py", "Guides", "nav.guides"),
+    PageSpec("app_pages/5_About_the_Toolkit.py", "About_the_Toolkit", "nav.about"),
+    PageSpec("app_pages/6_Feedback_Tool.py", "Feedback_Tool", "nav.feedback"),
+    PageSpec("app_pages/7_Contact.py", "Contact", "nav.contact"),
+    PageSpec("app_pages/8_Search.py", "Search", "nav.search"),
+    PageSpec("app_pages/9_Admin.py", "Admin", "nav.admin", admin=True),
+    PageSpec("app_pages/10_Feedback_Insights.py", "Feedback_Insights", "nav.feedback_insights", admin=True),
+]
+
+_BY_PATH = {spec.path: spec for spec in PAGES}
+
+
+def st_page(page_path: str, title: str | None = None):
+    """The st.Page for a page script, as app.py registers it. st.switch_page
+    and st.page_link match pages by URL path, so this one works for both."""
+    import streamlit as st
+
+    spec = _BY_PATH[page_path]
+    return st.Page(spec.path, title=title, url_path=spec.url_path, default=spec.default)
+
+
+def page_url(page_path: str) -> str:
+    """URL path of a page script ("app_pages/4_Guides.py" -> "Guides"); "" for the default page."""
+    spec = _BY_PATH[page_path]
+    return "" if spec.default else spec.url_path
@@ -0,0 +1,403 @@
+"""
+Feedback outbox: stored submissions forwarded to the team's form backend in
+the background.
+
+Saving stays local and immediate (components/feedback.py). When sync is on,
+a trigger in the feedback database adds every new row to feedback_outbox in
+the same transaction. A sync thread then claims due rows in batches and hands
+them to a backend. Delivered rows leave the outbox. Failed ones are retried
+with exponential backoff (capped at MAX_BACKOFF, with jitter), and a circuit
+breaker (components/remote.py) pauses a backend that keeps failing. A row the
+backend rejects outright (e.g. a 400 from Google Forms) is kept but no longer
+retried. Nothing here runs on a script thread, so a slow or blocked endpoint
+never holds up a page.
+
+Backends, chosen by DOTS_FEEDBACK_SYNC:
+
+- google_form: one POST per row to the formResponse URL of the Google Form
+  the Feedback page embeds (feedback.FORM_URL). DOTS_FEEDBACK_FORM_ENTRIES maps fields to the form's entry
+  ids, e.g. "role=entry.111,rating=entry.222,comment=entry.333".
+- http: one JSON POST per batch to DOTS_FEEDBACK_SYNC_URL, with a bearer
+  token from DOTS_FEEDBACK_SYNC_TOKEN if set. Rows carry their id, so the
+  endpoint can drop repeats.
+- local: keeps rows in memory, with optional delay and failures; a stand-in
+  for tests and load runs.
+
+register_backend() adds others. With DOTS_FEEDBACK_SYNC unset the outbox is
+off: no trigger is created and nothing is queued. Rows stored before sync
+was first turned on are not sent. While sync is configured but not running,
+rows wait in the outbox.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from components.catalog import default_language, text
+from components.feedback import COLUMNS, FORM_URL, ROLES, Submission, connect, connect_read, feedback_store
+from components.remote import CircuitBreaker
+
+SYNC_ENV = "DOTS_FEEDBACK_SYNC"
+SYNC_URL_ENV = "DOTS_FEEDBACK_SYNC_URL"
+SYNC_TOKEN_ENV = "DOTS_FEEDBACK_SYNC_TOKEN"
+FORM_ENTRIES_ENV = "DOTS_FEEDBACK_FORM_ENTRIES"
+
+BATCH_SIZE = 50
+SYNC_INTERVAL = 2.0  # seconds between polls when the outbox is empty
+BASE_BACKOFF = 5.0
+MAX_BACKOFF = 3600.0
+TIMEOUT = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback_outbox (
+    feedback_id INTEGER PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS feedback_outbox_due ON feedback_outbox (next_attempt_at);
+CREATE TRIGGER IF NOT EXISTS feedback_outbox_enqueue AFTER INSERT ON feedback
+BEGIN
+    INSERT INTO feedback_outbox (feedback_id) VALUES (new.id);
+END;
+"""
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Rejected(Exception):
+    """The backend refused row `sent` of a batch for good (the ones before it were delivered)."""
+
+    def __init__(self, message: str, sent: int = 0):
+        super().__init__(message)
+        self.sent = sent
+
+
+@dataclass
+class Pending:
+    id: int
+    submission: Submission
+
+
+# -----------------------------
+# Backends
+# -----------------------------
+# A backend delivers rows in order and returns how many it delivered. It
+# raises on a failure before the first row (or returns a short count after
+# some), and raises Rejected when a row can never be delivered.
+class LocalBackend:
+    """In-memory stand-in: `delay` seconds per batch, failing every `fail_every`-th call."""
+
+    def __init__(self, delay: float = 0.0, fail_every: int = 0):
+        self.delay = delay
+        self.fail_every = fail_every
+        self.calls = 0
+        self.received: list[Pending] = []
+
+    def deliver(self, batch: list[Pending]) -> int:
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_every and self.calls % self.fail_every == 0:
+            raise ConnectionError("local backend: simulated failure")
+        self.received.extend(batch)
+        return len(batch)
+
+
+def _permanent(e: Exception) -> bool:
+    # Client errors won't succeed on retry, except timeouts and rate limits.
+    code = getattr(e, "code", None)
+    return code is not None and 400 <= code < 500 and code not in (408, 429)
+
+
+class HttpBackend:
+    def __init__(self, url: str, token: str | None = None, timeout: float = TIMEOUT):
+        self.url = url
+        self.token = token
+        self.timeout = timeout
+
+    def _post(self, items: list[Pending]):
+        import urllib.request
+
+        body = json.dumps(
+            [{"id": item.id, **asdict(item.submission)} for item in items], ensure_ascii=False
+        ).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, method="POST")
+        request.add_header("Content-Type", "application/json")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def deliver(self, batch: list[Pending]) -> int:
+        try:
+            self._post(batch)
+            return len(batch)
+        except OSError as e:
+            if not _permanent(e):
+                raise
+        # The endpoint refused the batch: send rows one by one to find the bad one.
+        for sent, item in enumerate(batch):
+            try:
+                self._post([item])
+            except OSError as e:
+                if _permanent(e):
+                    raise Rejected(f"HTTP {e.code}", sent) from e
+                if sent:
+                    return sent
+                raise
+        return len(batch)
+
+
+class GoogleFormBackend:
+    def __init__(self, form_url: str, entries: dict[str, str], timeout: float = TIMEOUT):
+        if not entries:
+            # Without a mapping every response would be posted empty, and counted as delivered.
+            raise ValueError(
+                f"{FORM_ENTRIES_ENV} maps no fields (expected e.g. \"role=entry.111,rating=entry.222\", "
+                f"fields from {', '.join(COLUMNS)})"
+            )
+        # .../viewform?... -> .../formResponse
+        self.url = form_url.split("?")[0].rsplit("/", 1)[0] + "/formResponse"
+        self.entries = entries
+        self.timeout = timeout
+
+    def _fields(self, submission: Submission) -> dict[str, str]:
+        values = asdict(submission)
+        # The form's role options are the default language's labels.
+        if submission.role in ROLES:
+            values["role"] = text(default_language(), "feedback.backup.role_options")[ROLES.index(submission.role)]
+        return {entry: str(values[field]) for field, entry in self.entries.items() if field in values}
+
+    def deliver(self, batch: list[Pending]) -> int:
+        import urllib.parse
+        import urllib.request
+
+        # Forms take one response per request.
+        for sent, item in enumerate(batch):
+            data = urllib.parse.urlencode(self._fields(item.submission)).encode("utf-8")
+            try:
+                with urllib.request.urlopen(urllib.request.Request(self.url, data=data), timeout=self.timeout):
+                    pass
+            except OSError as e:
+                if _permanent(e):
+                    raise Rejected(f"HTTP {e.code}", sent) from e
+                if sent:
+                    return sent
+                raise
+        return len(batch)
+
+
+def _parse_entries(value: str) -> dict[str, str]:
+    # "role=entry.1,rating=entry.2" -> {"role": "entry.1", "rating": "entry.2"}
+    pairs = (part.split("=", 1) for part in value.split(",") if "=" in part)
+    return {field.strip(): entry.strip() for field, entry in pairs if field.strip() in COLUMNS}
+
+
+_BACKENDS: dict[str, Callable[[], object]] = {
+    "google_form": lambda: GoogleFormBackend(FORM_URL, _parse_entries(os.environ.get(FORM_ENTRIES_ENV, ""))),
+    "http": lambda: HttpBackend(os.environ[SYNC_URL_ENV], os.environ.get(SYNC_TOKEN_ENV) or None),
+    "local": LocalBackend,
+}
+
+
+def register_backend(name: str, factory: Callable[[], object]):
+    """Make `factory()` available as DOTS_FEEDBACK_SYNC=<name>."""
+    _BACKENDS[name] = factory
+
+
+def backend_from_env():
+    """The configured backend, or None when sync is off."""
+    name = os.environ.get(SYNC_ENV, "").strip()
+    if not name:
+        return None
+    if name not in _BACKENDS:
+        raise ValueError(f"{SYNC_ENV}={name!r}: expected one of {', '.join(sorted(_BACKENDS))}")
+    return _BACKENDS[name]()
+
+
+# -----------------------------
+# Outbox
+# -----------------------------
+class Outbox:
+    def __init__(
+        self,
+        backend=None,
+        batch_size: int = BATCH_SIZE,
+        interval: float = SYNC_INTERVAL,
+        base_backoff: float = BASE_BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+        breaker_threshold: int = 3,
+        breaker_cooldown: float = 60.0,
+        store=feedback_store,
+    ):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.interval = interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.store = store
+
+        self._lock = threading.Lock()
+        self._breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stats = {"sent": 0, "failures": 0, "rejected": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect(self.store.path)
+        conn.executescript(SCHEMA)
+        return conn
+
+    # -----------------------------
+    # Public API (never blocks on the backend)
+    # -----------------------------
+    def start(self) -> bool:
+        """
+        Create the outbox and start syncing on a daemon thread, once per
+        process. Returns False (and does nothing) when sync is off.
+        """
+        with self._lock:
+            if self._thread is not None:
+                return True
+            if self.backend is None:
+                try:
+                    self.backend = backend_from_env()
+                except (KeyError, ValueError) as e:
+                    _LOGGER.error("Feedback sync not started: %s", e)
+                    return False
+                if self.backend is None:
+                    return False
+            self._connect().close()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="dots-outbox", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 10.0):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+
+    def status(self) -> dict:
+        """Outbox depth (waiting, of which retrying, and rejected) plus the sync counters."""
+        counts = {"waiting": 0, "retrying": 0, "rejected": 0}
+        if self.store.path.exists():
+            # Read-only: looking must not create the outbox (and its trigger).
+            with closing(connect_read(self.store.path)) as conn:
+                if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'feedback_outbox'").fetchone():
+                    waiting, retrying, rejected = conn.execute(
+                        "SELECT COUNT(next_attempt_at), "
+                        "COUNT(CASE WHEN attempts > 0 AND next_attempt_at IS NOT NULL THEN 1 END), "
+                        "COUNT(*) - COUNT(next_attempt_at) FROM feedback_outbox"
+                    ).fetchone()
+                    counts = {"waiting": waiting, "retrying": retrying, "rejected": rejected}
+        return {**counts, **self.stats, "running": self._thread is not None}
+
+    # -----------------------------
+    # Sync thread
+    # -----------------------------
+    def _run(self):
+        with closing(self._connect()) as conn:
+            while not self._stop.is_set():
+                try:
+                    busy = self._breaker.allow() and self.sync_once(conn)
+                except sqlite3.Error as e:
+                    _LOGGER.warning("Feedback sync: outbox not readable: %s", e)
+                    busy = False
+                if not busy:
+                    self._stop.wait(self.interval)
+
+    def _claim(self, conn: sqlite3.Connection) -> list[Pending]:
+        # Claimed rows are leased past the backend's worst case, so another
+        # server process sharing the database doesn't send them as well.
+        now = time.time()
+        lease = now + getattr(self.backend, "timeout", TIMEOUT) * self.batch_size + 30
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT o.feedback_id, {', '.join('f.' + c for c in COLUMNS)} FROM feedback_outbox o "
+                "JOIN feedback f ON f.id = o.feedback_id "
+                "WHERE o.next_attempt_at <= ? ORDER BY o.feedback_id LIMIT ?",
+                (now, self.batch_size),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE feedback_outbox SET next_attempt_at = ? WHERE feedback_id = ?",
+                [(lease, row[0]) for row in rows],
+            )
+        return [Pending(row[0], Submission(**dict(zip(COLUMNS, row[1:])))) for row in rows]
+
+    def sync_once(self, conn: sqlite3.Connection | None = None) -> bool:
+        """Send one batch of due rows; True if there was anything to send."""
+        if conn is None:
+            with closing(self._connect()) as conn:
+                return self.sync_once(conn)
+
+        batch = self._claim(conn)
+        if not batch:
+            return False
+        try:
+            sent, error = self.backend.deliver(batch), None
+        except Rejected as e:
+            sent, error = e.sent, e
+        except Exception as e:
+            sent, error = 0, e
+
+        # Rows [0, sent) were delivered. On a rejection, row `sent` is the bad one.
+        done = batch[:sent]
+        rejected = batch[sent] if isinstance(error, Rejected) else None
+        rest = batch[sent + 1:] if rejected is not None else batch[sent:]
+        with conn:
+            conn.executemany("DELETE FROM feedback_outbox WHERE feedback_id = ?", [(item.id,) for item in done])
+            if rejected is not None:
+                # Parked (no next attempt) with its error, for the team to look at.
+                conn.execute(
+                    "UPDATE feedback_outbox SET attempts = attempts + 1, next_attempt_at = NULL, last_error = ? "
+                    "WHERE feedback_id = ?",
+                    (str(error), rejected.id),
+                )
+                # The rows after it were never tried: due again at once.
+                conn.executemany(
+                    "UPDATE feedback_outbox SET next_attempt_at = 0 WHERE feedback_id = ?", [(item.id,) for item in rest]
+                )
+            elif rest:
+                # Unsent rows go back with a backoff; a short count is a failure too.
+                conn.executemany(
+                    "UPDATE feedback_outbox SET attempts = attempts + 1, next_attempt_at = ? + "
+                    "min(?, ? * (1 << min(attempts, 20))) * ?, last_error = ? WHERE feedback_id = ?",
+                    [
+                        (time.time(), self.max_backoff, self.base_backoff, random.uniform(0.5, 1.0),
+                         str(error or "not delivered"), item.id)
+                        for item in rest
+                    ],
+                )
+
+        failed = bool(rest) and rejected is None
+        with self._lock:
+            self.stats["sent"] += len(done)
+            if rejected is not None:
+                self.stats["rejected"] += 1
+            elif failed:
+                self.stats["failures"] += 1
+        if rejected is not None:
+            _LOGGER.warning("Feedback sync: row %d rejected: %s", rejected.id, error)
+        elif failed:
+            self._breaker.record_failure()
+            _LOGGER.warning("Feedback sync: %d of %d rows not delivered: %s", len(rest), len(batch), error)
+        else:
+            self._breaker.record_success()
+        return True
+
+
+outbox = Outbox()
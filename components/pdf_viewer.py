@@ -0,0 +1,188 @@
+"""
+Self-hosted PDF viewer for the narrative cards and reference sheets.
+
+Pages are rasterised on the server (pypdfium2) to WebP at a few fixed widths
+and only when a reader reaches them. Streamlit reports no scroll position to
+the server, so instead of rendering pages as they scroll into view, the
+viewer shows the first page and a "next page" button that adds one more page
+per click. Rendered pages are kept in a bounded
+in-memory LRU cache shared by all sessions, backed by a disk cache under
+.cache/pages, so each page/width is normally rendered once per deploy.
+
+pypdfium2 is imported on first use (load_pdfium), not when the app starts:
+most runs never open the viewer.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import streamlit as st
+
+from components.assets import Asset
+from components.catalog import text
+
+# The viewer is optional; without pypdfium2 callers fall back to links.
+PDFIUM_INSTALLED = importlib.util.find_spec("pypdfium2") is not None
+_pdfium = None
+
+PAGE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "pages"
+
+# Rendered page widths in CSS pixels (phone / tablet / desktop).
+PAGE_WIDTHS = {"S": 480, "M": 960, "L": 1440}
+DEFAULT_WIDTH = "M"
+
+WEBP_QUALITY = 80
+MEMORY_CACHE_BYTES = 48 * 1024 * 1024
+
+
+def viewer_available() -> bool:
+    return PDFIUM_INSTALLED
+
+
+def load_pdfium():
+    """The pypdfium2 module, imported on first use; None if it isn't installed."""
+    global _pdfium
+    if _pdfium is None and PDFIUM_INSTALLED:
+        import pypdfium2
+
+        _pdfium = pypdfium2
+    return _pdfium
+
+
+# -----------------------------
+# Page cache (memory LRU + disk)
+# -----------------------------
+class PageCache:
+    def __init__(self, max_bytes: int = MEMORY_CACHE_BYTES, cache_dir: Path = PAGE_CACHE_DIR):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._items: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "renders": 0}
+
+    def _disk_path(self, key: tuple[str, int, int]) -> Path:
+        sha, page, width = key
+        return self.cache_dir / sha[:16] / f"{page}-{width}.webp"
+
+    def get(self, key: tuple[str, int, int]) -> bytes | None:
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+                self.stats["hits"] += 1
+                return data
+        try:
+            data = self._disk_path(key).read_bytes()
+        except OSError:
+            return None
+        self.stats["disk_hits"] += 1
+        self._remember(key, data)
+        return data
+
+    def put(self, key: tuple[str, int, int], data: bytes):
+        self._remember(key, data)
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    def _remember(self, key: tuple[str, int, int], data: bytes):
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= len(evicted)
+
+
+page_cache = PageCache()
+
+# pdfium is not thread-safe; all document access goes through this lock.
+_pdfium_lock = threading.Lock()
+_page_counts: dict[str, int] = {}
+
+
+def page_count(asset: Asset) -> int:
+    count = _page_counts.get(asset.sha256)
+    if count is None:
+        with _pdfium_lock:
+            doc = load_pdfium().PdfDocument(asset.data)
+            try:
+                count = len(doc)
+            finally:
+                doc.close()
+        _page_counts[asset.sha256] = count
+    return count
+
+
+def render_page(asset: Asset, page: int, width: int) -> bytes:
+    """Return page `page` (0-based) of `asset` as WebP, `width` pixels wide."""
+    key = (asset.sha256, page, width)
+    data = page_cache.get(key)
+    if data is not None:
+        return data
+
+    with _pdfium_lock:
+        doc = load_pdfium().PdfDocument(asset.data)
+        try:
+            pdf_page = doc[page]
+            try:
+                image = pdf_page.render(scale=width / pdf_page.get_width()).to_pil()
+            finally:
+                pdf_page.close()
+        finally:
+            doc.close()
+
+    buf = io.BytesIO()
+    image.save(buf, "WEBP", quality=WEBP_QUALITY)
+    data = buf.getvalue()
+    page_cache.stats["renders"] += 1
+    page_cache.put(key, data)
+    return data
+
+
+# -----------------------------
+# Viewer UI
+# -----------------------------
+def pdf_viewer(asset: Asset, key: str, lang: str = "English"):
+    """
+    Show `asset` page by page. The first page is rendered straight away;
+    further pages are rendered only when the reader asks for them.
+    """
+    total = page_count(asset)
+    shown_key = f"_viewer_pages_{key}"
+    shown = st.session_state.get(shown_key, 1)
+
+    size = st.radio(
+        text(lang, "viewer.page_size"),
+        options=list(PAGE_WIDTHS),
+        index=list(PAGE_WIDTHS).index(DEFAULT_WIDTH),
+        format_func=lambda size: text(lang, f"viewer.size.{size}"),
+        horizontal=True,
+        key=f"{key}_size",
+    )
+    width = PAGE_WIDTHS[size]
+
+    for page in range(min(shown, total)):
+        st.image(render_page(asset, page, width), use_column_width=True)
+        st.caption(f"{page + 1} / {total}")
+
+    if shown < total:
+        st.button(
+            text(lang, "viewer.next_page"),
+            key=f"{key}_more",
+            on_click=lambda: st.session_state.update({shown_key: shown + 1}),
+            use_container_width=True,
+        )
@@ -0,0 +1,232 @@
+"""
+Non-blocking fetcher for assets that are missing locally and have to come
+from GitHub raw.
+
+Fetches never run inside a script run. `status()` / `get()` return at once,
+starting a background fetch when needed, so a slow GitHub response can't
+freeze a page. Each fetch has a bounded timeout and retries with exponential
+backoff. A per-host circuit breaker stops hammering a host that keeps
+failing. Results are kept in memory and in a disk cache keyed by URL, and
+revalidated with the stored ETag (If-None-Match).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "remote"
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+
+class CircuitBreaker:
+    """Open after `threshold` consecutive failures; allow a retry after `cooldown` seconds."""
+
+    def __init__(self, threshold: int = 3, cooldown: float = 60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        return time.monotonic() - self.opened_at >= self.cooldown
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class RemoteFetcher:
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        timeout: float = 5.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        breaker_threshold: int = 3,
+        breaker_cooldown: float = 60.0,
+        max_workers: int = 2,
+    ):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+
+        self._lock = threading.Lock()
+        self._data: dict[str, bytes] = {}
+        self._status: dict[str, str] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dots-remote")
+        self.stats = {"fetches": 0, "not_modified": 0, "failures": 0, "disk_hits": 0}
+
+    # -----------------------------
+    # Public API (never blocks)
+    # -----------------------------
+    def status(self, url: str) -> str:
+        """Return READY, PENDING or FAILED for `url`, starting a fetch if needed."""
+        with self._lock:
+            status = self._status.get(url)
+        if status in (READY, PENDING):
+            return status
+
+        # Read outside the lock: the file can be megabytes and other sessions
+        # only need the in-memory entries.
+        cached = self._read_disk(url)
+        with self._lock:
+            status = self._status.get(url)
+            if status in (READY, PENDING):
+                return status
+
+            if cached is not None:
+                self._data[url] = cached[0]
+                self._status[url] = READY
+                self.stats["disk_hits"] += 1
+                # Revalidate in the background; the cached copy is served meanwhile.
+                self._pool.submit(self._fetch, url, cached[1])
+                return READY
+
+            if status == FAILED and not self._breaker(url).allow():
+                return FAILED
+
+            self._status[url] = PENDING
+            self._pool.submit(self._fetch, url, None)
+            return PENDING
+
+    def get(self, url: str) -> bytes | None:
+        """Return the bytes for `url` if available now, otherwise None (and start a fetch)."""
+        if self.status(url) == READY:
+            return self._data.get(url)
+        return None
+
+    def prefetch(self, *urls: str):
+        for url in urls:
+            self.status(url)
+
+    def wait(self, url: str, timeout: float | None = None) -> str:
+        """Block until `url` is no longer pending. For scripts and tests, not pages."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.status(url) == PENDING:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        return self.status(url)
+
+    # -----------------------------
+    # Background work
+    # -----------------------------
+    def _breaker(self, url: str) -> CircuitBreaker:
+        host = urllib.parse.urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+        return breaker
+
+    def _fetch(self, url: str, etag: str | None):
+        breaker = self._breaker(url)
+        for attempt in range(self.retries):
+            if not breaker.allow():
+                break
+            try:
+                request = urllib.request.Request(url)
+                if etag:
+                    request.add_header("If-None-Match", etag)
+                with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+                    data = resp.read()
+                    new_etag = resp.headers.get("ETag")
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    with self._lock:
+                        breaker.record_success()
+                        self.stats["not_modified"] += 1
+                    return
+                failed = True
+            except Exception:
+                failed = True
+            else:
+                failed = False
+
+            if not failed:
+                self._write_disk(url, data, new_etag)
+                with self._lock:
+                    breaker.record_success()
+                    self.stats["fetches"] += 1
+                    self._data[url] = data
+                    self._status[url] = READY
+                return
+
+            with self._lock:
+                breaker.record_failure()
+                self.stats["failures"] += 1
+            if attempt + 1 < self.retries:
+                time.sleep(self.backoff * (2**attempt))
+
+        with self._lock:
+            # Keep serving a cached copy if revalidation failed.
+            if url not in self._data:
+                self._status[url] = FAILED
+
+    # -----------------------------
+    # Disk cache
+    # -----------------------------
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.bin", self.cache_dir / f"{key}.json"
+
+    def _read_disk(self, url: str) -> tuple[bytes, str | None] | None:
+        data_path, meta_path = self._cache_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            data = data_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        # The digest was taken once, at fetch time; a size check catches a
+        # truncated or replaced file without re-hashing it on every start.
+        if meta.get("url") != url or meta.get("size") != len(data) or not meta.get("sha256"):
+            return None
+        return data, meta.get("etag")
+
+    def _write_disk(self, url: str, data: bytes, etag: str | None):
+        data_path, meta_path = self._cache_paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = data_path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            tmp.replace(data_path)
+            meta_path.write_text(
+                json.dumps(
+                    {
+                        "url": url,
+                        "etag": etag,
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                        "size": len(data),
+                        "fetched_at": time.time(),
+                    }
+                ),
+                encoding="utf-8",
+            )
+        except OSError:
+            # Disk cache is best effort (e.g. read-only deploys).
+            pass
+
+
+# Shared by every page and session in this process.
+remote_fetcher = RemoteFetcher()
@@ -0,0 +1,562 @@
+"""
+Full-text search over the phrases, guides, visual tools and the PDF cards.
+
+Content is collected from the page scripts (the text passed to st.markdown /
+st.write / st.subheader / st.expander etc., mostly `t("...")` keys resolved
+against each language's content catalog) and from the text layer of the
+bundled PDFs. A `for` loop over a literal table defined in the page (e.g.
+Visual Tools' sections) is unrolled, with f-string keys filled in from the
+loop variables. Each section (a heading with an `anchor=`, or an
+expander under it) becomes one document, so results deep-link to
+`<page>#<anchor>`.
+
+Tokenisation is script-aware: runs of kana / kanji become overlapping
+character bigrams (Japanese has no spaces), plus single characters in the
+index so one-character queries match; everything else is split into
+lower-cased words. Ranking is BM25, and the last English query word also
+matches as a prefix, so partial words find results.
+
+The index is built once per process in the background and kept per source
+file. A source is re-read only when its mtime (or, for pages, the content
+catalog's) changes, and those checks
+happen at most every REFRESH_INTERVAL seconds, not on every keystroke.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from components import catalog
+from components.assets import get_asset
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Page scripts whose content is searchable.
+PAGE_SOURCES = [
+    "app_pages/2_Phrases_and_Scripts.py",
+    "app_pages/3_Visual_Tools.py",
+    "app_pages/4_Guides.py",
+]
+
+# Catalog key of each page's title, for result labels.
+PAGE_TITLES = {
+    "app_pages/2_Phrases_and_Scripts.py": "phrases.title",
+    "app_pages/3_Visual_Tools.py": "visual_tools.title",
+    "app_pages/4_Guides.py": "guides.title",
+}
+
+# PDFs and the section of the page that offers them.
+PDF_SOURCES = {
+    "quick_staff_room_reference": ("app_pages/2_Phrases_and_Scripts.py", "quick-staffroom-reference"),
+    "conversation_support_card": ("app_pages/4_Guides.py", "conversation-support-card"),
+    "student_narrative_card": ("app_pages/4_Guides.py", "student-narrative-card"),
+    "dots": ("app_pages/3_Visual_Tools.py", "visual-metaphors"),
+    "waves": ("app_pages/3_Visual_Tools.py", "visual-metaphors"),
+    "pathways": ("app_pages/3_Visual_Tools.py", "visual-metaphors"),
+    "color_guidelines": ("app_pages/3_Visual_Tools.py", "color-guidelines"),
+}
+
+# st.* calls (and our own helpers) whose string arguments are page content.
+TEXT_CALLS = {"markdown", "write", "caption", "info", "success", "subheader", "header", "expander", "page_header", "soft_card", "static_block"}
+HEADING_CALLS = {"subheader", "header", "page_header"}
+
+REFRESH_INTERVAL = 2.0
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_TERMS = 20
+
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿豈-﫿ー]+")
+_WORD = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+_MARKUP = re.compile(r"[*_`#>|]+|^\s*[-•]\s+|^\s*\d+\)\s+", re.MULTILINE)
+
+EN_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "with",
+}
+
+
+# -----------------------------
+# Tokenisation
+# -----------------------------
+def normalise(text: str) -> str:
+    # NFKC folds full-width latin / half-width kana, so "ＤＯＴＳ" matches "dots".
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def tokenize(text: str, unigrams: bool = False) -> list[str]:
+    """
+    Words and CJK bigrams. Documents are indexed with `unigrams` too, so a
+    one-character query ("色") matches inside longer runs; queries of two or
+    more characters still match on bigrams only.
+    """
+    text = normalise(text)
+    tokens = []
+    pos = 0
+    for m in _CJK.finditer(text):
+        tokens.extend(_words(text[pos : m.start()]))
+        run = m.group()
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+            if unigrams:
+                tokens.extend(run)
+        pos = m.end()
+    tokens.extend(_words(text[pos:]))
+    return tokens
+
+
+def _words(text: str) -> list[str]:
+    return [w for w in _WORD.findall(text) if w not in EN_STOPWORDS]
+
+
+# -----------------------------
+# Content extraction
+# -----------------------------
+@dataclass
+class SearchDoc:
+    source: str
+    lang: str
+    page: str
+    anchor: str | None
+    title: str
+    text: str
+    tf: Counter = field(default_factory=Counter, repr=False)
+    length: int = 0
+
+
+def _is_lang_test(node: ast.AST) -> bool:
+    # Matches `lang == "English"` and `get_lang() == "English"`.
+    return (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.ops[0], ast.Eq)
+        and isinstance(node.comparators[0], ast.Constant)
+        and node.comparators[0].value == "English"
+    )
+
+
+_UNKNOWN = object()
+
+
+def _value(node: ast.AST | None, env: dict) -> object:
+    """
+    The value of a literal expression, reading names from `env` (the page's
+    tables and loop variables); _UNKNOWN if it isn't one.
+    """
+    if node is None:
+        return _UNKNOWN
+    if isinstance(node, ast.Name):
+        return env.get(node.id, _UNKNOWN)
+    if isinstance(node, ast.JoinedStr):
+        parts = [_value(v, env) for v in node.values]
+        return _UNKNOWN if _UNKNOWN in parts else "".join(map(str, parts))
+    if isinstance(node, ast.FormattedValue) and node.format_spec is None:
+        return _value(node.value, env)
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return _UNKNOWN
+
+
+def _strings(node: ast.AST | None, lang: str, env: dict | None = None) -> str:
+    """The text an expression evaluates to for `lang` (non-literal parts dropped)."""
+    env = env or {}
+    if node is None:
+        return ""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Name):
+        value = env.get(node.id)
+        return value if isinstance(value, str) else ""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "t":
+        key = _value(node.args[0] if node.args else None, env)
+        if isinstance(key, str):
+            value = catalog.text(lang, key)
+            return value if isinstance(value, str) else ""
+        return ""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "format":
+        return _strings(node.func.value, lang, env)
+    if isinstance(node, ast.IfExp) and _is_lang_test(node.test):
+        return _strings(node.body if lang == "English" else node.orelse, lang, env)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _strings(node.left, lang, env) + _strings(node.right, lang, env)
+    if isinstance(node, ast.JoinedStr):
+        return "".join(_strings(v, lang, env) for v in node.values)
+    if isinstance(node, ast.FormattedValue):
+        return _strings(node.value, lang, env)
+    return ""
+
+
+def _call_name(node: ast.AST) -> str | None:
+    if not isinstance(node, ast.Call):
+        return None
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    return None
+
+
+def _text_args(call: ast.Call, name: str, lang: str, env: dict) -> list[str]:
+    if name == "static_block":
+        key = _value(call.args[0] if call.args else None, env)
+        return [catalog.text(lang, key)] if isinstance(key, str) else []
+    if name == "expander":
+        args = call.args[:1]
+    elif name in ("page_header", "soft_card"):
+        args = call.args[:2]
+    else:
+        args = call.args[:1] + [kw.value for kw in call.keywords if kw.arg in ("body", "subtitle", "title")]
+    return [s for s in (_strings(a, lang, env) for a in args) if s.strip()]
+
+
+class _PageExtractor:
+    """Walk a page script in source order, grouping content into sections."""
+
+    def __init__(self, page: str, lang: str):
+        self.page = page
+        self.lang = lang
+        self.docs: list[SearchDoc] = []
+        self.anchor: str | None = None
+        self.heading = ""
+        self.env: dict[str, object] = {}
+        self._open(None, "")
+
+    def _open(self, anchor: str | None, title: str):
+        self.current = SearchDoc(source=self.page, lang=self.lang, page=self.page, anchor=anchor, title=title, text="")
+        self.docs.append(self.current)
+
+    def run(self, tree: ast.Module) -> list[SearchDoc]:
+        self._stmts(tree.body)
+        return [d for d in self.docs if d.text.strip()]
+
+    def _stmts(self, stmts: list[ast.stmt]):
+        for stmt in stmts:
+            self._stmt(stmt)
+
+    def _stmt(self, stmt: ast.stmt):
+        if isinstance(stmt, (ast.FunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom)):
+            return
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            value = _value(stmt.value, self.env)
+            if value is not _UNKNOWN:
+                # A content table (or a constant); loops over it are unrolled.
+                self.env[stmt.targets[0].id] = value
+                return
+        if isinstance(stmt, ast.If) and _is_lang_test(stmt.test):
+            self._stmts(stmt.body if self.lang == "English" else stmt.orelse)
+            return
+        if isinstance(stmt, ast.If) and _value(stmt.test, self.env) is not _UNKNOWN:
+            self._stmts(stmt.body if _value(stmt.test, self.env) else stmt.orelse)
+            return
+        if isinstance(stmt, ast.For) and not stmt.orelse:
+            items = self._iterable(stmt.iter)
+            if items is not None:
+                for item in items:
+                    self._bind(stmt.target, item)
+                    self._stmts(stmt.body)
+                return
+        if isinstance(stmt, ast.With):
+            label = None
+            for item in stmt.items:
+                if _call_name(item.context_expr) in ("expander", "lazy_expander"):
+                    label = _strings(item.context_expr.args[0], self.lang, self.env) if item.context_expr.args else ""
+            if label is not None:
+                # Each expander is its own result, linked to the heading above it;
+                # content after it continues the heading's section.
+                self._open(self.anchor, f"{self.heading} › {label}" if self.heading else label)
+                self._stmts(stmt.body)
+                self._open(self.anchor, self.heading)
+                return
+            self._stmts(stmt.body)
+            return
+        if isinstance(stmt, (ast.If, ast.For, ast.While, ast.Try)):
+            for block in (getattr(stmt, "body", []), getattr(stmt, "orelse", []), getattr(stmt, "finalbody", [])):
+                self._stmts(block)
+            return
+        for node in ast.walk(stmt):
+            self._call(node)
+
+    def _iterable(self, node: ast.AST) -> list | None:
+        if _call_name(node) == "enumerate" and len(node.args) == 1:
+            items = _value(node.args[0], self.env)
+            return list(enumerate(items)) if isinstance(items, (list, tuple)) else None
+        items = _value(node, self.env)
+        return list(items) if isinstance(items, (list, tuple)) else None
+
+    def _bind(self, target: ast.AST, value: object):
+        if isinstance(target, ast.Name):
+            self.env[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)) and isinstance(value, (list, tuple)) and len(value) == len(target.elts):
+            for elt, v in zip(target.elts, value):
+                self._bind(elt, v)
+
+    def _call(self, node: ast.AST):
+        name = _call_name(node)
+        if name not in TEXT_CALLS:
+            return
+        texts = _text_args(node, name, self.lang, self.env)
+        if name in HEADING_CALLS and texts:
+            anchor = next((kw.value for kw in node.keywords if kw.arg == "anchor"), None)
+            anchor = _value(anchor, self.env)
+            anchor = anchor if isinstance(anchor, str) else None
+            if name == "page_header":
+                anchor = None
+            self.anchor, self.heading = anchor, texts[0]
+            self._open(anchor, texts[0])
+            texts = texts[1:]
+        for text in texts:
+            self.current.text += _MARKUP.sub(" ", text).strip() + "\n"
+
+
+def extract_page(path: Path, page: str) -> list[SearchDoc]:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    docs = []
+    for lang in catalog.languages():
+        docs.extend(_PageExtractor(page, lang).run(tree))
+    return docs
+
+
+def extract_pdf(asset_id: str) -> list[SearchDoc]:
+    """Text layer of a PDF, its lines split between the languages by script
+    (each catalog's search.pdf_script)."""
+    from components.pdf_viewer import _pdfium_lock, load_pdfium  # pdfium isn't thread-safe
+
+    asset = get_asset(asset_id)
+    # PDF text is optional; without pypdfium2 page content is still indexed.
+    pdfium = load_pdfium()
+    if asset is None or pdfium is None:
+        return []
+    page, anchor = PDF_SOURCES[asset_id]
+
+    with _pdfium_lock:
+        doc = pdfium.PdfDocument(asset.data)
+        try:
+            parts = []
+            for pdf_page in doc:
+                textpage = pdf_page.get_textpage()
+                try:
+                    parts.append(textpage.get_text_range())
+                finally:
+                    textpage.close()
+                    pdf_page.close()
+            text = "\n".join(parts)
+        finally:
+            doc.close()
+
+    lines = {"cjk": [], "latin": []}
+    for line in text.replace("\r", "\n").split("\n"):
+        line = " ".join(line.split())
+        if line:
+            lines["cjk" if _CJK.search(line) else "latin"].append(line)
+
+    title = asset.name.rsplit(".", 1)[0].strip() + " (PDF)"
+    docs = []
+    for lang in catalog.languages():
+        found = lines.get(catalog.text(lang, "search.pdf_script"), lines["latin"])
+        if found:
+            docs.append(SearchDoc(source=asset_id, lang=lang, page=page, anchor=anchor, title=title, text="\n".join(found)))
+    return docs
+
+
+# -----------------------------
+# Index
+# -----------------------------
+@dataclass
+class SearchResult:
+    doc: SearchDoc
+    score: float
+    snippet: str
+
+
+class SearchIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: dict[int, SearchDoc] = {}
+        self._by_source: dict[str, list[int]] = defaultdict(list)
+        # Per language, created as documents arrive, so a new catalog file needs no change here.
+        self._postings: dict[str, dict[str, dict[int, int]]] = defaultdict(lambda: defaultdict(dict))
+        self._total_len: dict[str, int] = defaultdict(int)
+        self._count: dict[str, int] = defaultdict(int)
+        self._vocab: dict[str, list[str]] = {}
+        self._mtimes: dict[str, object] = {}
+        self._next_id = 0
+        self._checked_at = 0.0
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.stats = {"builds": 0, "source_updates": 0, "queries": 0, "build_ms": 0.0}
+
+    # -----------------------------
+    # Building
+    # -----------------------------
+    def start(self):
+        """Build the index on a background thread (once per process)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self.refresh, name="dots-search-index", daemon=True)
+        self._thread.start()
+
+    def _sources(self) -> dict[str, Path | None]:
+        sources: dict[str, Path | None] = {page: ROOT / page for page in PAGE_SOURCES}
+        for asset_id in PDF_SOURCES:
+            # Revalidated, so a replaced PDF is re-extracted from its new bytes.
+            asset = get_asset(asset_id, revalidate=True)
+            sources[asset_id] = asset.path if asset else None
+        return sources
+
+    @staticmethod
+    def _mtime(path: Path | None) -> int | None:
+        try:
+            return path.stat().st_mtime_ns if path else None
+        except OSError:
+            return None
+
+    def refresh(self, force: bool = False):
+        """Re-index sources whose file changed. Cheap no-op within REFRESH_INTERVAL."""
+        now = time.monotonic()
+        if not force and self._ready.is_set() and now - self._checked_at < REFRESH_INTERVAL:
+            return
+        with self._lock:
+            self._checked_at = now
+            started = time.perf_counter()
+            changed = 0
+
+            # Page text comes from the catalog, so a catalog edit re-indexes the pages.
+            catalog.refresh()
+            catalog_stamp = catalog.stamp()
+
+            for source, path in self._sources().items():
+                mtime = self._mtime(path)
+                if mtime is not None and source not in PDF_SOURCES:
+                    mtime = (mtime, catalog_stamp)
+                if not force and self._mtimes.get(source) == mtime and source in self._mtimes:
+                    continue
+                self._mtimes[source] = mtime
+                self._remove_source(source)
+                if mtime is not None:
+                    if source in PDF_SOURCES:
+                        docs = extract_pdf(source)
+                    else:
+                        docs = extract_page(path, source)
+                    for doc in docs:
+                        self._add(doc)
+                changed += 1
+            if changed:
+                self._vocab.clear()
+                self.stats["source_updates"] += changed
+                if not self._ready.is_set():
+                    self.stats["builds"] += 1
+                    self.stats["build_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self._ready.set()
+
+    def _add(self, doc: SearchDoc):
+        doc.tf = Counter(tokenize(doc.title + "\n" + doc.text, unigrams=True))
+        doc.length = sum(doc.tf.values())
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = doc
+        self._by_source[doc.source].append(doc_id)
+        postings = self._postings[doc.lang]
+        for token, count in doc.tf.items():
+            postings[token][doc_id] = count
+        self._total_len[doc.lang] += doc.length
+        self._count[doc.lang] += 1
+
+    def _remove_source(self, source: str):
+        for doc_id in self._by_source.pop(source, []):
+            doc = self._docs.pop(doc_id)
+            postings = self._postings[doc.lang]
+            for token in doc.tf:
+                entry = postings.get(token)
+                if entry is not None:
+                    entry.pop(doc_id, None)
+                    if not entry:
+                        del postings[token]
+            self._total_len[doc.lang] -= doc.length
+            self._count[doc.lang] -= 1
+
+    def _vocabulary(self, lang: str) -> list[str]:
+        vocab = self._vocab.get(lang)
+        if vocab is None:
+            vocab = self._vocab[lang] = sorted(self._postings[lang])
+        return vocab
+
+    # -----------------------------
+    # Querying
+    # -----------------------------
+    def search(self, query: str, lang: str, limit: int = 10, wait: float = 5.0) -> list[SearchResult]:
+        if not self._ready.wait(wait):
+            return []
+        self.refresh()
+        terms = tokenize(query)
+        if not terms:
+            return []
+        self.stats["queries"] += 1
+        if lang not in catalog.languages():
+            lang = catalog.default_language()
+
+        with self._lock:
+            postings = self._postings[lang]
+            n = self._count[lang] or 1
+            avg_len = (self._total_len[lang] / n) or 1.0
+
+            # The word being typed also matches as a prefix ("convers" -> "conversation").
+            expanded = [[t] for t in terms]
+            last = terms[-1]
+            if not _CJK.fullmatch(last):
+                vocab = self._vocabulary(lang)
+                i = bisect.bisect_left(vocab, last)
+                prefixed = []
+                while i < len(vocab) and vocab[i].startswith(last) and len(prefixed) < MAX_PREFIX_TERMS:
+                    prefixed.append(vocab[i])
+                    i += 1
+                expanded[-1] = prefixed or [last]
+
+            scores: dict[int, float] = defaultdict(float)
+            for alternatives in expanded:
+                for term in alternatives:
+                    docs = postings.get(term)
+                    if not docs:
+                        continue
+                    idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+                    for doc_id, tf in docs.items():
+                        length = self._docs[doc_id].length
+                        scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len))
+
+            ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+            return [
+                SearchResult(doc=self._docs[doc_id], score=score, snippet=snippet(self._docs[doc_id].text, query))
+                for doc_id, score in ranked
+            ]
+
+
+def snippet(text: str, query: str, width: int = 140) -> str:
+    """A short excerpt of `text` around the first query match."""
+    flat = " ".join(text.split())
+    lowered = normalise(flat)
+    hit = -1
+    for needle in [normalise(query).strip()] + sorted(set(tokenize(query)), key=len, reverse=True):
+        if needle:
+            hit = lowered.find(needle)
+            if hit >= 0:
+                break
+    if hit < 0:
+        return flat[:width] + ("…" if len(flat) > width else "")
+    start = max(0, hit - width // 3)
+    end = min(len(flat), start + width)
+    return ("…" if start else "") + flat[start:end] + ("…" if end < len(flat) else "")
+
+
+# Shared by every page and session in this process.
+search_index = SearchIndex()
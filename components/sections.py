@@ -0,0 +1,85 @@
+"""
+Lazy page sections and per-section render cost.
+
+Streamlit renders everything inside an st.expander on every run, collapsed or
+not, and the expander's open state never reaches the server. lazy_expander()
+replaces it with a bordered box and a toggle. While the toggle is off, the
+body is skipped entirely: no server work and no payload.
+
+    with lazy_expander(t("..label"), key="typography.rules") as is_open:
+        if is_open:
+            static_block("..body")
+
+Set DOTS_LAZY_SECTIONS=0 to get plain expanders back.
+
+timed_section() and lazy_expander() record how long each section's body took
+to run. section_costs() returns the totals for this process, which is how to
+see what a page costs and where to spend effort. The same timings land in
+the current run's page metrics as "section:<key>".
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+from components.metrics import record_helper
+
+LAZY_SECTIONS = os.environ.get("DOTS_LAZY_SECTIONS", "1") != "0"
+
+_lock = threading.Lock()
+_costs: dict[str, dict[str, float]] = {}
+
+
+def _record(name: str, ms: float):
+    record_helper(f"section:{name}", ms)
+    with _lock:
+        cost = _costs.get(name)
+        if cost is None:
+            cost = _costs[name] = {"runs": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+        cost["runs"] += 1
+        cost["total_ms"] += ms
+        cost["last_ms"] = ms
+        cost["max_ms"] = max(cost["max_ms"], ms)
+
+
+def section_costs() -> dict[str, dict[str, float]]:
+    """Render cost per section since the process started, most expensive first."""
+    with _lock:
+        rows = {name: {**cost, "mean_ms": cost["total_ms"] / cost["runs"]} for name, cost in _costs.items()}
+    return dict(sorted(rows.items(), key=lambda kv: kv[1]["mean_ms"], reverse=True))
+
+
+@contextmanager
+def timed_section(name: str):
+    """Record how long the body of the `with` block takes to render."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, (time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def lazy_expander(label: str, key: str, expanded: bool = False):
+    """
+    Collapsible section whose body runs only while it is open. Yields whether
+    it is open; the caller renders the body under `if is_open:`. Opened
+    sections are timed under `key`.
+    """
+    if not LAZY_SECTIONS:
+        with st.expander(label, expanded=expanded), timed_section(key):
+            yield True
+        return
+
+    with st.container(border=True):
+        is_open = st.toggle(label, value=expanded, key=f"_section_{key}")
+        if not is_open:
+            yield False
+            return
+        with timed_section(key):
+            yield True
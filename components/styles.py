@@ -0,0 +1,301 @@
+"""
+Brand stylesheet build.
+
+The CSS lives in styles/*.css. Previously apply_brand_styles(), the Home page
+and set_sidebar_branding() each pushed their own <style> block through
+st.markdown on every rerun. Now the sources are compiled once per process
+into a single sheet:
+
+- merged in SOURCES order
+- comments and whitespace stripped
+- exact duplicate rules and declarations dropped (the last copy is kept, so
+  the cascade is unchanged)
+- adjacent rules with the same selector folded together
+
+The result is written to .cache/styles under a content-hashed name. The page
+links to it (see ui.apply_brand_styles), so the browser fetches it once and
+then caches it. Reruns only send the <link> tag. Without a media store (e.g. in tests), the compiled CSS
+is inlined instead.
+
+Build ahead of time with `python -m components.styles`.
+
+The build also reports selector conflicts: the same selector (after
+splitting selector lists) in the same @media block setting a property to
+different values in two rules. Order-dependent overrides like that are what
+tokens in components/theme.py are for.
+
+The parser covers the CSS we write: rules and @media blocks, with no braces
+or semicolons inside strings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from components.assets import Asset, shared_media_url, static_url
+
+STYLE_DIR = Path(__file__).resolve().parent.parent / "styles"
+STYLE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "styles"
+
+# Cascade order: later sheets win ties.
+# theme.css is generated from the tokens in components/theme.py.
+SOURCES = ["theme.css", "brand.css"]
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_OR_STRING = re.compile(r"(\"[^\"]*\"|'[^']*')|\s+")
+_PUNCT_OR_STRING = re.compile(r"(\"[^\"]*\"|'[^']*')|\s*([>+~,:;(){}])\s*")
+
+
+@dataclass(frozen=True)
+class Stylesheet:
+    css: str
+    sha256: str
+    path: Path
+    source_bytes: int
+    rules_dropped: int
+    conflicts: tuple[str, ...] = ()
+
+    @property
+    def size(self) -> int:
+        return len(self.css.encode("utf-8"))
+
+
+_lock = threading.Lock()
+_sheet: Stylesheet | None = None
+_sheet_asset: Asset | None = None
+
+
+# -----------------------------
+# Minify
+# -----------------------------
+def _squash(text: str) -> str:
+    # Collapse whitespace outside quoted strings.
+    return _SPACE_OR_STRING.sub(lambda m: m.group(1) or " ", text).strip()
+
+
+def _tight(text: str, punct: str) -> str:
+    # Drop spaces around `punct` outside quoted strings.
+    def sub(m: re.Match) -> str:
+        if m.group(1):
+            return m.group(1)
+        return m.group(2) if m.group(2) in punct else m.group(0)
+
+    return _PUNCT_OR_STRING.sub(sub, _squash(text))
+
+
+def _selector(text: str) -> str:
+    # Spaces around combinators and commas carry no meaning; ":" stays as is
+    # so "a :hover" and "a:hover" remain distinct.
+    return _tight(text, ">+~,")
+
+
+def _declarations(body: str) -> list[tuple[str, str]]:
+    decls = []
+    for part in body.split(";"):
+        prop, sep, value = part.partition(":")
+        if not sep or not prop.strip():
+            continue
+        prop = prop.strip()
+        decls.append((prop if prop.startswith("--") else prop.lower(), _tight(value, ",()")))
+    # Exact repeats are dropped; a changed value (a fallback) is kept.
+    deduped = []
+    for i, decl in enumerate(decls):
+        if decl not in decls[i + 1:]:
+            deduped.append(decl)
+    return deduped
+
+
+def _parse(css: str, i: int = 0) -> tuple[list, int]:
+    """[(selector, declarations) | (at-rule prelude, [nested items])], end index."""
+    items, start = [], i
+    while i < len(css):
+        c = css[i]
+        if c == "{":
+            prelude = _squash(css[start:i])
+            if prelude.startswith("@"):
+                nested, i = _parse(css, i + 1)
+                items.append((_tight(prelude, ":,"), nested))
+            else:
+                end = css.index("}", i)
+                items.append((_selector(prelude), _declarations(css[i + 1:end])))
+                i = end + 1
+            start = i
+        elif c == "}":
+            return items, i + 1
+        else:
+            i += 1
+    return items, i
+
+
+def _optimize(items: list) -> tuple[list, int]:
+    dropped = 0
+    out = []
+    for prelude, body in items:
+        if prelude.startswith("@"):
+            body, n = _optimize(body)
+            dropped += n
+            if body:
+                out.append((prelude, body))
+            continue
+        if not body:
+            dropped += 1
+            continue
+        if out and out[-1][0] == prelude:
+            merged = out[-1][1] + body
+            out[-1] = (prelude, [d for i, d in enumerate(merged) if d not in merged[i + 1:]])
+            dropped += 1
+            continue
+        out.append((prelude, body))
+
+    # A rule repeated verbatim later in the same block is redundant here.
+    seen, result = set(), []
+    for prelude, body in reversed(out):
+        key = (prelude, repr(body))
+        if key in seen:
+            dropped += 1
+            continue
+        seen.add(key)
+        result.append((prelude, body))
+    return result[::-1], dropped
+
+
+def _serialize(items: list) -> str:
+    parts = []
+    for prelude, body in items:
+        if prelude.startswith("@"):
+            parts.append(f"{prelude}{{{_serialize(body)}}}")
+        else:
+            parts.append(f"{prelude}{{{';'.join(f'{p}:{v}' for p, v in body)}}}")
+    return "".join(parts)
+
+
+def _split_selectors(selector: str) -> list[str]:
+    # Commas inside :is()/:has()/:not() don't separate selectors.
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(selector):
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(selector[start:i])
+            start = i + 1
+    parts.append(selector[start:])
+    return parts
+
+
+def find_conflicts(sources: dict[str, str]) -> list[str]:
+    """Selector/property pairs set to different values by different rules."""
+    seen: dict[tuple[str, str, str], tuple[str, str]] = {}
+    conflicts = []
+
+    def walk(items: list, context: str, source: str):
+        for n, (prelude, body) in enumerate(items):
+            if prelude.startswith("@"):
+                walk(body, f"{context}{prelude} ", source)
+                continue
+            # Within one rule a repeated property is a deliberate fallback.
+            last = dict(body)
+            for selector in _split_selectors(prelude):
+                for prop, value in last.items():
+                    key = (context, selector, prop)
+                    where = f"{source} rule {n + 1}"
+                    if key in seen and seen[key][0] != value:
+                        conflicts.append(
+                            f"{context}{selector} {{{prop}}}: {seen[key][0]!r} ({seen[key][1]}) vs {value!r} ({where})"
+                        )
+                    seen[key] = (value, where)
+
+    for name, text in sources.items():
+        items, _ = _parse(_COMMENT.sub("", text))
+        walk(items, "", name)
+    return conflicts
+
+
+def compile_css(sources: list[str]) -> tuple[str, int]:
+    """Merge and minify CSS sources; returns (css, rules dropped)."""
+    css = _COMMENT.sub("", "\n".join(sources))
+    items, _ = _parse(css)
+    items, dropped = _optimize(items)
+    return _serialize(items), dropped
+
+
+# -----------------------------
+# Build + serve
+# -----------------------------
+def build_stylesheet(style_dir: Path = STYLE_DIR, out_dir: Path = STYLE_CACHE_DIR) -> Stylesheet:
+    named = {name: (style_dir / name).read_text(encoding="utf-8") for name in SOURCES}
+    sources = list(named.values())
+    css, dropped = compile_css(sources)
+    data = css.encode("utf-8")
+    sha = hashlib.sha256(data).hexdigest()
+
+    path = out_dir / f"dots-{sha[:16]}.css"
+    if not path.exists():
+        out_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    return Stylesheet(
+        css=css,
+        sha256=sha,
+        path=path,
+        source_bytes=sum(len(s.encode("utf-8")) for s in sources),
+        rules_dropped=dropped,
+        conflicts=tuple(find_conflicts(named)),
+    )
+
+
+def get_stylesheet() -> Stylesheet:
+    """The compiled brand stylesheet, built once per process."""
+    global _sheet
+    if _sheet is None:
+        with _lock:
+            if _sheet is None:
+                _sheet = build_stylesheet()
+                for conflict in _sheet.conflicts:
+                    _LOGGER.warning("CSS conflict: %s", conflict)
+    return _sheet
+
+
+def stylesheet_url(sheet: Stylesheet) -> str | None:
+    """
+    Cacheable URL of the compiled sheet: on the companion static server (under
+    /assets/_styles/) if configured, else the shared media store. None when
+    neither is available.
+    """
+    global _sheet_asset
+    url = static_url(f"_styles/{sheet.path.name}", sheet.sha256, download=False)
+    if url:
+        return url
+    if _sheet_asset is None or _sheet_asset.sha256 != sheet.sha256:
+        data = sheet.css.encode("utf-8")
+        _sheet_asset = Asset(
+            name=sheet.path.name,
+            path=sheet.path,
+            data=data,
+            sha256=sheet.sha256,
+            size=len(data),
+            mtime_ns=0,
+            variant="stylesheet",
+            mime="text/css",
+        )
+    return shared_media_url(_sheet_asset, mime="text/css", download=False)
+
+
+if __name__ == "__main__":
+    # Build step: python -m components.styles
+    sheet = build_stylesheet()
+    print(f"{sheet.path.relative_to(STYLE_DIR.parent)}: {sheet.source_bytes} -> {sheet.size} bytes, {sheet.rules_dropped} rule(s) dropped")
+    for conflict in sheet.conflicts:
+        print(f"conflict: {conflict}")
+    sys.exit(1 if sheet.conflicts else 0)
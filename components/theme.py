@@ -0,0 +1,181 @@
+"""
+Theme tokens: the brand palette and the colour roles built on it.
+
+Every brand colour is defined once here. `python -m components.theme`
+generates from these tokens:
+
+- .streamlit/config.toml, which holds only the [theme] table
+- styles/theme.css: the CSS variables, surfaces, buttons, tiles and cards
+
+Both outputs are committed. Nothing is generated while pages run; theme.css
+is compiled with the other sheets by components/styles.py, which also
+reports selector conflicts (`--check` fails the build on any).
+
+Tile rows are targeted with a marker emitted right before the row by
+ui.tile_columns(), not by the row's position on the page.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+THEME_CSS = ROOT / "styles" / "theme.css"
+CONFIG_TOML = ROOT / ".streamlit" / "config.toml"
+
+PALETTE = {
+    # Pastel accents
+    "soft-blue": "#8FB9FF",
+    "mint-green": "#AEEBD5",
+    "peach": "#FFC7B2",
+    "lavender": "#D9C8FF",
+    "pale-yellow": "#FFF1A8",
+    # Neutrals
+    "ink": "#2B2B2B",
+    "line": "#323232",
+    "paper": "#FFFDF8",
+    "white": "#FFFFFF",
+    # Sidebar gradient
+    "mist-blue": "#F3F7FF",
+    "mist-lilac": "#F7F2FF",
+    "mist-cream": "#FFF9E8",
+}
+
+# Streamlit theme option -> palette token (or literal value)
+STREAMLIT_THEME = {
+    "primaryColor": ("Pastel accent (Soft blue)", "soft-blue"),
+    "backgroundColor": ("App background (very light warm-white)", "paper"),
+    "secondaryBackgroundColor": ("Sidebar + containers background (very light pastel)", "mist-blue"),
+    "textColor": ("Text", "ink"),
+    "font": ("Font", "sans serif"),
+}
+
+# Tile rows: role -> colour of column 1, 2, 3
+TILES = {
+    "quick_actions": ["peach", "mint-green", "lavender"],   # Parents / Students / Colleagues
+    "explore": ["soft-blue", "pale-yellow", "lavender"],    # Phrases / Visual tools / Guides
+}
+TILE_FILL = 0.32
+TILE_BORDER = 0.55
+TILE_HOVER = 0.42
+TILE_RADIUS = "14px"
+
+BUTTON_RADIUS = "12px"
+BUTTON_BORDER = ("soft-blue", 0.30)
+SIDEBAR_BORDER = ("line", 0.06)
+CARD = {"fill": ("white", 0.75), "border": ("line", 0.08), "radius": "14px"}
+
+
+def rgba(token: str, alpha: float) -> str:
+    h = PALETTE[token].lstrip("#")
+    r, g, b = (int(h[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r}, {g}, {b}, {alpha:g})"
+
+
+def tile_marker(role: str) -> str:
+    """Role class of the marker ui.tile_columns() puts before a tile row."""
+    return f"dots-tiles-{role}"
+
+
+# -----------------------------
+# Generators
+# -----------------------------
+def theme_css() -> str:
+    out = [
+        "/* Generated by components/theme.py from the palette tokens. Do not edit. */",
+        "",
+        ":root{",
+        *(f"    --{name}: {value};" for name, value in PALETTE.items()),
+        "}",
+        "",
+        'html, body, [class*="css"] { color: var(--ink); }',
+        "",
+        '[data-testid="stAppViewContainer"]{ background: var(--paper); }',
+        "",
+        "/* Sidebar background MUST be opaque (no rgba) */",
+        '[data-testid="stSidebar"]{',
+        "    background: linear-gradient(180deg, var(--mist-blue) 0%, var(--mist-lilac) 45%, var(--mist-cream) 100%);",
+        f"    border-right: 1px solid {rgba(*SIDEBAR_BORDER)};",
+        "}",
+        "",
+        "/* Buttons */",
+        ".stButton > button,",
+        ".stDownloadButton > button,",
+        ".stLinkButton > a{",
+        f"    border: 1px solid {rgba(*BUTTON_BORDER)} !important;",
+        "}",
+        ".stDownloadButton > button,",
+        ".stLinkButton > a{",
+        f"    border-radius: {BUTTON_RADIUS} !important;",
+        "}",
+        "",
+        "/* st.button renders as a tile */",
+        ".stButton > button{",
+        "    color: var(--ink) !important;",
+        "    font-weight: 650 !important;",
+        "    padding: 0.95rem 1rem !important;",
+        f"    border-radius: {TILE_RADIUS} !important;",
+        "}",
+        "",
+        "/* Tile rows: the marker's own container is hidden, so it adds no gap */",
+        ".element-container:has(.dots-tiles){ display: none; }",
+    ]
+    for role, colors in TILES.items():
+        row = f'.element-container:has(.{tile_marker(role)}) + [data-testid="stHorizontalBlock"]'
+        out += ["", f"/* {role} */"]
+        for i, color in enumerate(colors, start=1):
+            button = f'{row} [data-testid="column"]:nth-child({i}) .stButton > button'
+            out += [
+                f"{button}{{",
+                f"    background: {rgba(color, TILE_FILL)} !important;",
+                f"    border-color: {rgba(color, TILE_BORDER)} !important;",
+                "}",
+                f"{button}:hover{{ background: {rgba(color, TILE_HOVER)} !important; }}",
+            ]
+    out += [
+        "",
+        "/* ui.soft_card */",
+        ".dots-soft-card{",
+        f"    background: {rgba(*CARD['fill'])};",
+        f"    border: 1px solid {rgba(*CARD['border'])};",
+        f"    border-radius: {CARD['radius']};",
+        "    padding: 16px 16px;",
+        "    margin: 10px 0 14px 0;",
+        "}",
+    ]
+    return "\n".join(out) + "\n"
+
+
+def config_toml() -> str:
+    out = ["# Generated by components/theme.py from the palette tokens. Do not edit.", "[theme]"]
+    for option, (comment, value) in STREAMLIT_THEME.items():
+        out += [f"# {comment}", f'{option} = "{PALETTE.get(value, value)}"', ""]
+    return "\n".join(out).rstrip() + "\n"
+
+
+def generate(check: bool = False) -> list[str]:
+    """Write (or with `check`, compare) the generated files; returns the stale ones."""
+    stale = []
+    for path, content in ((THEME_CSS, theme_css()), (CONFIG_TOML, config_toml())):
+        current = path.read_text(encoding="utf-8") if path.exists() else None
+        if current == content:
+            continue
+        stale.append(str(path.relative_to(ROOT)))
+        if not check:
+            path.write_text(content, encoding="utf-8")
+    return stale
+
+
+if __name__ == "__main__":
+    # python -m components.theme [--check]
+    from components.styles import build_stylesheet
+
+    check = "--check" in sys.argv[1:]
+    stale = generate(check=check)
+    for name in stale:
+        print(f"{name}: {'out of date' if check else 'written'}")
+    sheet = build_stylesheet()
+    for conflict in sheet.conflicts:
+        print(f"conflict: {conflict}")
+    sys.exit(1 if (check and stale) or sheet.conflicts else 0)
@@ -1,35 +1,67 @@
+import functools
+import html
+import json
+import logging
+import os
 import streamlit as st
-from pathlib import Path
-
-LANG_EN = "English"
-LANG_JA = "日本語"
-
-TEXT = {
-    "toggle_label": {LANG_EN: "Language", LANG_JA: "言語"},
-    "menu_title": {LANG_EN: "Menu", LANG_JA: "メニュー"},
-    "home_title": {
-        LANG_EN: "Neurodiversity Communication Toolkit",
-        LANG_JA: "ニューロダイバーシティ・コミュニケーション ツールキット",
-    },
-    "home_subtitle": {
-        LANG_EN: "Support for gentle, clear conversations about neurodiversity in Japanese educational contexts.",
-        LANG_JA: "日本の教育現場におけるニューロダイバーシティをめぐる、やさしく明確な対話を支えるツールです。",
-    },
-    "home_intro": {
-        LANG_EN: (
-            "This toolkit supports educators in communicating about neurodiversity in ways that are culturally respectful, "
-            "emotionally safe, and practically useful.\n\n"
-            "It does not provide diagnoses or labels. Instead, it offers language, visuals, and guidance to help conversations "
-            "feel clearer and less stressful for everyone involved."
-        ),
-        LANG_JA: (
-            "本ツールキットは、教育者がニューロダイバーシティについて話すときに、文化的配慮・心理的安全性・実用性を両立しながら、"
-            "対話を進めるための支援を目的としています。\n\n"
-            "診断やラベル付けを行うものではありません。代わりに、言葉・視覚的メタファー・会話の進め方を通して、"
-            "対話がより明確で、ストレスの少ないものになるよう助けます。"
-        ),
-    },
-}
+from contextlib import contextmanager
+from typing import Callable
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from components.assets import (
+    ASSETS_DIR,
+    Asset,
+    get_asset,
+    load_manifest,
+    shared_media_url,
+    start_warmup,
+    static_asset_url,
+    static_original_url,
+)
+from components.blocks import render_block
+from components.catalog import catalog, default_language, languages
+from components.metrics import current_run, timed, track_run
+from components.navigation import st_page
+
+# Every page imports this module, so it imports only what nearly every run
+# needs. Search, the PDF viewer, bundles, the stylesheet, feedback and
+# diagnostics are imported by the helpers that use them, and nothing starts
+# on import: app.py calls start_background_workers().
+_workers_started = False
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Background workers
+# -----------------------------
+def start_background_workers():
+    """
+    Once per process, off the script thread: validate the asset manifest,
+    load the PDFs and build the bundles, build the search index, start the
+    metrics exporter (when DOTS_METRICS_PORT is set) and the feedback sync
+    (when DOTS_FEEDBACK_SYNC is; its module isn't even imported otherwise).
+    The feedback writer starts now so that it, not the first reader, brings
+    an existing database's schema up to date.
+    """
+    global _workers_started
+    if _workers_started:
+        return
+    _workers_started = True
+
+    from components.diagnostics import start_exporter
+    from components.feedback import feedback_store
+    from components.search import search_index
+
+    start_warmup()
+    search_index.start()
+    start_exporter()
+    feedback_store.start()
+    if os.environ.get("DOTS_FEEDBACK_SYNC"):
+        from components.outbox import outbox
+
+        outbox.start()
 
 
 # -----------------------------
@@ -37,274 +69,164 @@ TEXT = {
 # -----------------------------
 def get_lang() -> str:
     if "lang" not in st.session_state:
-        st.session_state.lang = LANG_EN
+        st.session_state.lang = default_language()
     return st.session_state.lang
 
 
 def t(key: str) -> str:
-    lang = get_lang()
-    if key not in TEXT:
-        return key
-    return TEXT[key].get(lang, TEXT[key].get(LANG_EN, key))
+    # Catalogs are compiled with fallbacks resolved (components/catalog.py),
+    # so this is one dict lookup; unknown keys render as the key itself.
+    return catalog(get_lang()).get(key, key)
 
 
 # -----------------------------
-# Global styles (pastel + airy)
+# Moving between pages
 # -----------------------------
-def apply_brand_styles():
-    st.markdown(
-        """
-        <style>
-        :root{
-            --soft-blue: #8FB9FF;
-            --mint-green: #AEEBD5;
-            --peach: #FFC7B2;
-            --lavender: #D9C8FF;
-            --pale-yellow: #FFF1A8;
-
-            --ink: #2B2B2B;
-        }
-
-        html, body, [class*="css"]  { color: var(--ink); }
-
-        /* App background */
-        [data-testid="stAppViewContainer"]{
-            background: #FFFDF8;
-        }
-
-        /* Content width on desktop */
-        .block-container{
-            padding-top: 1.1rem;
-            padding-bottom: 2.2rem;
-            max-width: 980px;
-        }
-
-        /* Sidebar background MUST be opaque (no rgba) */
-        [data-testid="stSidebar"]{
-            background: linear-gradient(
-              180deg,
-              #F3F7FF 0%,
-              #F7F2FF 45%,
-              #FFF9E8 100%
-            );
-            border-right: 1px solid rgba(50,50,50,0.06);
-        }
-
-        /* Make sidebar overlay look clean on mobile */
-        @media (max-width: 768px){
-            /* keep content readable */
-            .block-container{
-                padding-left: 1rem;
-                padding-right: 1rem;
-                max-width: 100%;
-            }
-
-            /* reduce huge titles on phone */
-            h1{
-                font-size: 2.0rem !important;
-                line-height: 1.15 !important;
-            }
-            h2{
-                font-size: 1.35rem !important;
-                line-height: 1.2 !important;
-            }
-        }
-
-        /* Buttons */
-        .stButton > button,
-        .stDownloadButton > button,
-        .stLinkButton > a{
-            border-radius: 12px !important;
-            border: 1px solid rgba(143,185,255,0.30) !important;
-        }
-        /* ---------- Quick actions: colored tiles (Parents / Students / Colleagues) ---------- */
-/* Targets the 3 buttons in the first 3-column row on the page.
-   If you later add more 3-column rows above it, tell me and I'll make it key-based. */
-
-div[data-testid="column"]:nth-child(1) .stButton > button {
-    background: rgba(255, 199, 178, 0.32) !important;   /* peach */
-    border: 1px solid rgba(255, 199, 178, 0.55) !important;
-}
-
-div[data-testid="column"]:nth-child(2) .stButton > button {
-    background: rgba(174, 235, 213, 0.32) !important;   /* mint */
-    border: 1px solid rgba(174, 235, 213, 0.55) !important;
-}
-
-div[data-testid="column"]:nth-child(3) .stButton > button {
-    background: rgba(217, 200, 255, 0.32) !important;   /* lavender */
-    border: 1px solid rgba(217, 200, 255, 0.55) !important;
-}
-
-/* Shared tile styling */
-.stButton > button {
-    color: #2B2B2B !important;
-    font-weight: 650 !important;
-    padding: 0.95rem 1rem !important;
-    border-radius: 14px !important;
-}
-
-/* Hover */
-div[data-testid="column"]:nth-child(1) .stButton > button:hover {
-    background: rgba(255, 199, 178, 0.42) !important;
-}
-div[data-testid="column"]:nth-child(2) .stButton > button:hover {
-    background: rgba(174, 235, 213, 0.42) !important;
-}
-div[data-testid="column"]:nth-child(3) .stButton > button:hover {
-    background: rgba(217, 200, 255, 0.42) !important;
-}
-
-/* ---------- Explore: colored tiles ---------- */
-/* This targets the next 3-column row of buttons after Quick actions.
-   If you later add more 3-column rows, tell me and I’ll make it key-based. */
-
-div[data-testid="column"]:nth-child(1) .stButton > button[key="ex_phrases"] {}
-
-/* Key-based is not supported directly by CSS selectors in Streamlit markup,
-   so we style the "Explore row" by using a container hook approach below. */
-
-/* Style the Explore buttons by the order within THEIR row.
-   This works if Explore is the second 3-column row of buttons on Home. */
-
-/* Soft Blue */
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(1) .stButton > button {
-    background: rgba(143, 185, 255, 0.24) !important;
-    border: 1px solid rgba(143, 185, 255, 0.45) !important;
-}
-
-/* Pale Yellow */
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(2) .stButton > button {
-    background: rgba(255, 241, 168, 0.32) !important;
-    border: 1px solid rgba(255, 241, 168, 0.55) !important;
-}
-
-/* Lavender */
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(3) .stButton > button {
-    background: rgba(217, 200, 255, 0.32) !important;
-    border: 1px solid rgba(217, 200, 255, 0.55) !important;
-}
-
-/* Hover states */
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(1) .stButton > button:hover {
-    background: rgba(143, 185, 255, 0.34) !important;
-}
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(2) .stButton > button:hover {
-    background: rgba(255, 241, 168, 0.42) !important;
-}
-div[data-testid="stHorizontalBlock"] + div[data-testid="stHorizontalBlock"]
-  div[data-testid="column"]:nth-child(3) .stButton > button:hover {
-    background: rgba(217, 200, 255, 0.42) !important;
-}
-
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+_ANCHOR_KEY = "_scroll_to"
+
 
-def set_sidebar_branding(title: str = "Menu"):
-    safe_title = title.replace('"', '\\"')
-
-    st.markdown(
-        f"""
-        <style>
-        /* Custom label above the page list */
-        [data-testid="stSidebarNav"]::before {{
-            content: "•••  {safe_title}";
-            display: block;
-            font-size: 14px;
-            font-weight: 700;
-            opacity: 0.92;
-            padding: 10px 12px 6px 12px;
-            margin-top: 2px;
-            color: #2B2B2B;
-        }}
-
-        /* --- Hide the "app" entry (it is the FIRST nav item in your build) --- */
-        [data-testid="stSidebarNav"] ul > li:first-child {{
-            display: none !important;
-        }}
-
-        /* Backup selector for DOM variations */
-        [data-testid="stSidebarNav"] [role="list"] > *:first-child {{
-            display: none !important;
-        }}
-
-        /* Optional: remove extra spacing after hiding */
-        [data-testid="stSidebarNav"] ul {{
-            margin-top: 0.25rem !important;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
+def go_to(page_path: str, anchor: str | None = None):
+    """
+    Switch to another page in this session, so the language and the rest of
+    the session state carry over (a plain link would start a new session),
+    then scroll to `anchor` once the page has rendered.
+    """
+    if anchor:
+        st.session_state[_ANCHOR_KEY] = anchor
+    st.switch_page(st_page(page_path))
+
+
+def scroll_to_pending_anchor():
+    """Scroll to the section go_to() asked for. app.py calls this after the page runs."""
+    anchor = st.session_state.pop(_ANCHOR_KEY, None)
+    if not anchor:
+        return
+    import streamlit.components.v1 as components
+
+    # The heading may render a moment after this frame loads; retry briefly.
+    components.html(
+        "<script>"
+        "const go = (n) => {"
+        f"  const el = window.parent.document.getElementById({json.dumps(anchor)});"
+        "  if (el) el.scrollIntoView({behavior: 'smooth', block: 'start'});"
+        "  else if (n) setTimeout(() => go(n - 1), 100);"
+        "};"
+        "go(30);"
+        "</script>",
+        height=0,
     )
 
 
-def soft_card(html: str):
+# -----------------------------
+# Instrumentation
+# -----------------------------
+_METRICS_PAGE_KEY = "_metrics_page"
+
+
+@contextmanager
+def page_metrics(page: str):
     """
-    Optional: use this only where YOU want a gentle card.
-    Example:
-        soft_card("<b>Tip</b><br>Keep language calm and non-evaluative.")
+    Record this script run in the page metrics (components/metrics.py): wall
+    time, helper timings, elements emitted and bytes queued for the browser.
+    Yields the RunMetrics, so the caller can retag it (app.py sets the page
+    once st.navigation has picked it).
     """
-    st.markdown(
-        f"""
-        <div style="
-            background: rgba(255,255,255,0.75);
-            border: 1px solid rgba(50,50,50,0.08);
-            border-radius: 14px;
-            padding: 16px 16px;
-            margin: 10px 0 14px 0;
-        ">
-            {html}
-        </div>
-        """,
-        unsafe_allow_html=True,
+    ctx = get_script_run_ctx()
+    with track_run(page, get_lang()) as run:
+        if ctx is None:
+            yield run
+            return
+
+        # ScriptRunContext has no public hook on outgoing messages; wrap its
+        # private _enqueue (tests/test_streamlit_hooks.py guards the name).
+        enqueue = getattr(ctx, "_enqueue", None)
+        if enqueue is None:
+            _enqueue_missing()
+            run.elements = run.bytes_sent = None
+            yield run
+            st.session_state[_METRICS_PAGE_KEY] = run.page
+            return
+
+        def counting_enqueue(msg):
+            if msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                run.elements += 1
+            run.bytes_sent += msg.ByteSize()
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+        try:
+            yield run
+        finally:
+            ctx._enqueue = enqueue
+            st.session_state[_METRICS_PAGE_KEY] = run.page
+
+
+@functools.cache
+def _enqueue_missing():
+    _LOGGER.warning(
+        "ScriptRunContext._enqueue not found in this Streamlit version; "
+        "page metrics will not count elements or bytes sent."
     )
 
 
+def instrumented(name: str, fragment: bool = False):
+    """
+    Time a helper into the current run's metrics under `name`. With
+    `fragment`, a rerun of just that fragment is recorded as a run of its own,
+    tagged "<page>#<name>". Goes under @st.fragment.
+    """
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if fragment and current_run() is None:
+                page = st.session_state.get(_METRICS_PAGE_KEY, "?")
+                with page_metrics(f"{page}#{name}"):
+                    return fn(*args, **kwargs)
+            with timed(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
 # -----------------------------
-# Sidebar "Menu" above pages
+# Global styles (pastel + airy)
 # -----------------------------
-def set_sidebar_branding(title: str | None = None):
+@instrumented("apply_brand_styles")
+def apply_brand_styles():
     """
-    Reliable on Streamlit Cloud:
-    - Hide the built-in nav header that shows "app"
-    - Inject our own header above the page list using CSS
-    - Uses dot glyphs (•••) as the icon for reliability
+    Link the compiled brand stylesheet (styles/*.css, see components/styles.py).
+    The sheet is built once per process and cached by the browser, so a rerun
+    only re-sends this tag.
     """
-    if title is None:
-        title = t("menu_title")
-
-    safe_title = title.replace('"', '\\"')
-
-    st.markdown(
-        f"""
-        <style>
-        /* Try multiple targets to hide the default header ('app') */
-        [data-testid="stSidebarNav"] > div:first-child {{ display: none !important; }}
-        [data-testid="stSidebarNav"] header {{ display: none !important; }}
-        [data-testid="stSidebarNavTitle"] {{ display: none !important; }}
-
-        /* Add our own header above the pages list */
-        [data-testid="stSidebarNav"]::before {{
-            content: "•••  {safe_title}";
-            display: block;
-            font-size: 14px;
-            font-weight: 600;
-            opacity: 0.90;
-            padding: 10px 12px 6px 12px;
-            margin-top: 2px;
-            color: var(--ink);
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    from components.styles import get_stylesheet, stylesheet_url
+
+    sheet = get_stylesheet()
+    url = stylesheet_url(sheet)
+    tag = f'<link rel="stylesheet" href="{html.escape(url)}">' if url else f"<style>{sheet.css}</style>"
+    st.markdown(tag, unsafe_allow_html=True)
+
+
+def tile_columns(role: str, n: int = 3) -> list:
+    """
+    st.columns(n) whose buttons are coloured as the `role` tile row from
+    components/theme.py (e.g. "quick_actions"). A hidden marker just before
+    the row is what the generated CSS targets.
+    """
+    from components.theme import tile_marker
+
+    st.markdown(f'<span class="dots-tiles {tile_marker(role)}"></span>', unsafe_allow_html=True)
+    return st.columns(n)
+
+
+def soft_card(html: str):
+    """
+    Optional: use this only where YOU want a gentle card.
+    Example:
+        soft_card("<b>Tip</b><br>Keep language calm and non-evaluative.")
+    """
+    st.markdown(f'<div class="dots-soft-card">{html}</div>', unsafe_allow_html=True)
 
 
 # -----------------------------
@@ -313,11 +235,11 @@ def set_sidebar_branding(title: str | None = None):
 def language_toggle(sidebar: bool = True) -> str:
     container = st.sidebar if sidebar else st
     current = get_lang()
-    options = [LANG_JA, LANG_EN]
-    index = options.index(current) if current in options else 1
+    options = languages()
+    index = options.index(current) if current in options else options.index(default_language())
 
     selected = container.radio(
-        t("toggle_label"),
+        t("ui.language"),
         options=options,
         index=index,
         horizontal=True,
@@ -337,9 +259,339 @@ def page_header(title: str, subtitle: str | None = None):
     st.divider()
 
 
+# -----------------------------
+# Admin gate (DOTS_ADMIN_TOKEN)
+# -----------------------------
+def require_admin():
+    """Ask for the admin token once per session; nothing below runs until it is given."""
+    if st.session_state.get("_admin"):
+        return
+    from components.diagnostics import check_token
+
+    token = st.text_input(t("admin.token"), type="password")
+    if not check_token(token):
+        if token:
+            st.error(t("admin.bad_token"))
+        st.stop()
+    st.session_state._admin = True
+    st.rerun()
+
+
+# -----------------------------
+# Static content blocks
+# -----------------------------
+@instrumented("static_block")
+def static_block(key: str):
+    """
+    Render the catalog text `key` as a static block: converted to HTML once per
+    language and content hash (components/blocks.py), then sent as-is.
+    """
+    text = t(key)
+    html = render_block(key, get_lang(), text)
+    if html is None:
+        st.markdown(text)
+    else:
+        st.html(html)
+
+
+# -----------------------------
+# In-app PDF viewer
+# -----------------------------
+@instrumented("pdf_view_button")
+def pdf_view_button(
+    label: str,
+    title: str,
+    asset: Asset | None,
+    fallback_url: str,
+    key: str,
+    use_container_width: bool = True,
+):
+    """
+    View button that opens the self-hosted viewer in a dialog. Without a local
+    asset (or without pypdfium2) it links to `fallback_url` instead.
+    """
+    from components.pdf_viewer import pdf_viewer, viewer_available
+
+    if asset is None or not viewer_available():
+        st.link_button(label, fallback_url, use_container_width=use_container_width)
+        return
+
+    if st.button(label, key=f"{key}_view", use_container_width=use_container_width):
+        st.dialog(title, width="large")(pdf_viewer)(asset, key=key, lang=get_lang())
+
+
+# -----------------------------
+# Deferred download button
+# -----------------------------
+def lazy_download_button(
+    label: str,
+    ready_label: str,
+    load: Callable[[], bytes | None],
+    file_name: str,
+    key: str,
+    mime: str = "application/pdf",
+    missing_message: str | None = None,
+    use_container_width: bool = True,
+) -> bool:
+    """
+    Download button that reads and sends no bytes until the user asks for them.
+
+    - First shows a plain button (`label`). Nothing is loaded on these reruns.
+    - On click, `load()` runs and the real download button (`ready_label`)
+      replaces it for this session.
+    - Once the file has been downloaded, it goes back to the plain button, so
+      the bytes are not pushed again on every later rerun.
+    """
+    ready_key = f"_dl_ready_{key}"
+
+    if not st.session_state.get(ready_key):
+        if not st.button(label, key=f"{key}_prepare", use_container_width=use_container_width):
+            return False
+        st.session_state[ready_key] = True
+
+    data = load()
+    if not data:
+        st.session_state.pop(ready_key, None)
+        if missing_message:
+            st.warning(missing_message)
+        return False
+
+    clicked = st.download_button(
+        label=ready_label,
+        data=data,
+        file_name=file_name,
+        mime=mime,
+        key=key,
+        use_container_width=use_container_width,
+    )
+    if clicked:
+        st.session_state.pop(ready_key, None)
+    return clicked
+
+
+def _print_quality_link(asset: Asset, file_name: str, mime: str, key: str):
+    # `asset` is the web-optimised copy; the original is offered for printing
+    # through the same shared URL as the web copies, registered once per process.
+    if asset.variant != "web" or asset.asset_id is None:
+        return
+    url = static_original_url(asset.asset_id)
+    original = None
+    if url is None:
+        original = get_asset(asset.asset_id, print_quality=True)
+        url = original and shared_media_url(original, file_name=file_name, mime=mime)
+    if url:
+        st.caption(f"[{t('ui.print_quality_pdf')}]({url})")
+        return
+    if original is None:
+        return
+    lazy_download_button(
+        label=t("ui.print_quality_pdf"),
+        ready_label=t("ui.print_quality_pdf") + " ↓",
+        load=lambda: original.data,
+        file_name=file_name,
+        key=f"{key}_original",
+        mime=mime,
+        use_container_width=False,
+    )
+
+
+@instrumented("asset_download_button")
+def asset_download_button(
+    label: str,
+    ready_label: str,
+    asset: Asset,
+    file_name: str,
+    key: str,
+    mime: str = "application/pdf",
+    use_container_width: bool = True,
+):
+    """
+    Download an asset through the companion static server if configured,
+    otherwise through its shared media URL (one copy per process, no bytes
+    sent over the websocket). Falls back to the deferred button when there
+    is neither.
+    """
+    url = static_asset_url(asset, download=True) or shared_media_url(
+        asset, file_name=file_name, mime=mime
+    )
+    if url:
+        st.link_button(label, url, use_container_width=use_container_width)
+    else:
+        lazy_download_button(
+            label=label,
+            ready_label=ready_label,
+            load=lambda: asset.data,
+            file_name=file_name,
+            key=key,
+            mime=mime,
+            use_container_width=use_container_width,
+        )
+    _print_quality_link(asset, file_name, mime, key)
+
+
+@st.fragment(run_every=1.0)
+def _wait_for_remote(url: str, message: str):
+    # Polls only this placeholder; once the fetch settles, rerun the page
+    # so the real button (or the warning) replaces it.
+    from components.remote import PENDING, remote_fetcher
+
+    if remote_fetcher.status(url) != PENDING:
+        st.rerun()
+    st.info(message)
+
+
+@instrumented("remote_download_button")
+def remote_download_button(
+    label: str,
+    ready_label: str,
+    url: str,
+    file_name: str,
+    key: str,
+    pending_message: str,
+    missing_message: str,
+    mime: str = "application/pdf",
+    use_container_width: bool = True,
+):
+    """
+    Download a file that is not available locally. The fetch runs in the
+    background (see components/remote.py); until it finishes, a placeholder
+    is shown instead of blocking the page. The fetcher is imported here:
+    only missing assets need it.
+    """
+    from components.remote import FAILED, PENDING, remote_fetcher
+
+    status = remote_fetcher.status(url)
+    if status == PENDING:
+        _wait_for_remote(url, pending_message)
+    elif status == FAILED:
+        st.warning(missing_message)
+    else:
+        lazy_download_button(
+            label=label,
+            ready_label=ready_label,
+            load=lambda: remote_fetcher.get(url),
+            file_name=file_name,
+            key=key,
+            mime=mime,
+            missing_message=missing_message,
+            use_container_width=use_container_width,
+        )
+
+
+# -----------------------------
+# View + Download row for a PDF card
+# -----------------------------
+@st.fragment
+@instrumented("pdf_card_actions", fragment=True)
+def pdf_card_actions(
+    title: str,
+    asset: Asset | None,
+    file_name: str,
+    raw_url: str,
+    key: str,
+    fetch_missing: bool = False,
+):
+    """
+    View and Download buttons side by side. Runs as a fragment, so opening the
+    viewer or preparing a download reruns only this row, not the whole page.
+
+    Without a local asset, View links to `raw_url`; Download either fetches
+    it in the background (`fetch_missing`) or shows a "not found" error.
+    """
+    c1, c2 = st.columns(2)
+
+    with c1:
+        pdf_view_button(
+            t("common.view"),
+            title=title,
+            asset=asset,
+            fallback_url=(asset and static_asset_url(asset)) or raw_url,
+            key=f"view_{key}",
+        )
+
+    with c2:
+        if asset:
+            asset_download_button(
+                label=t("common.download_pdf"),
+                ready_label=t("common.save_pdf"),
+                asset=asset,
+                file_name=file_name,
+                key=f"dl_{key}",
+            )
+        elif fetch_missing:
+            remote_download_button(
+                label=t("common.download_pdf"),
+                ready_label=t("common.save_pdf"),
+                url=raw_url,
+                file_name=file_name,
+                key=f"dl_{key}",
+                pending_message=t("common.fetching_pdf"),
+                missing_message=t("common.pdf_missing"),
+            )
+        else:
+            st.error(t("common.pdf_not_found").format(file=file_name))
+
+
+# -----------------------------
+# "Download all cards" bundle
+# -----------------------------
+@st.fragment(run_every=1.0)
+def _wait_for_bundle():
+    # Polls only this placeholder until the warm-up has built the bundles.
+    from components.bundles import bundles_warmed
+
+    if bundles_warmed():
+        st.rerun()
+    st.caption(t("ui.bundle.preparing"))
+
+
+@st.fragment
+@instrumented("bundle_download_button", fragment=True)
+def bundle_download_button(key: str, use_container_width: bool = True):
+    """
+    One-click ZIP of every card and narrative in the current language. The
+    bundle is built once per set of asset hashes (see components/bundles.py)
+    and served from the static server or the shared media store. A fragment,
+    so preparing the download reruns only the button.
+    """
+    from components.bundles import bundle_as_asset, bundles_warmed, get_bundle, static_bundle_url
+
+    # Built by the warm-up thread; a page only builds one itself after that
+    # has run (e.g. for an asset that changed since).
+    bundle = get_bundle(get_lang(), build=bundles_warmed())
+    if bundle is None:
+        if not bundles_warmed():
+            _wait_for_bundle()
+        return
+
+    url = static_bundle_url(bundle) or shared_media_url(
+        bundle_as_asset(bundle), file_name=bundle.download_name, mime="application/zip"
+    )
+    if url:
+        st.link_button(t("ui.bundle.label"), url, use_container_width=use_container_width)
+    else:
+        lazy_download_button(
+            label=t("ui.bundle.label"),
+            ready_label=t("ui.bundle.ready"),
+            load=lambda: bundle_as_asset(bundle).data,
+            file_name=bundle.download_name,
+            key=key,
+            mime="application/zip",
+            use_container_width=use_container_width,
+        )
+    st.caption(t("ui.bundle.caption").format(size=f"{bundle.size / 1_000_000:.1f} MB"))
+
+
 # -----------------------------
 # App icon helper (tab icon)
 # -----------------------------
-def get_app_icon_path(default: str = "assets/dots.png") -> str | None:
-    p = Path(default)
-    return str(p) if p.exists() else None
+def get_app_icon_path(default: str = "favicon-32.png") -> str | None:
+    # Icons are generated by components/asset_pipeline.py and listed in the
+    # manifest; fall back to the source image when it hasn't been built.
+    icon = load_manifest().get("icons", {}).get(default)
+    if icon:
+        return str(ASSETS_DIR / icon["path"])
+    for p in (ASSETS_DIR / "icons" / default, ASSETS_DIR / "Dots_icon.png"):
+        if p.exists():
+            return str(p)
+    return None
@@ -0,0 +1,120 @@
+"""The companion static server, on a scratch assets directory."""
+
+import asyncio
+import http.client
+import os
+import threading
+
+import pytest
+import tornado.httpserver
+import tornado.netutil
+
+from components import asset_server
+
+PDF = b"%PDF-1.4\n" + b"stroke colour palette " * 400
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_server.AssetHandler, "_sha_cache", {})
+    src, out = tmp_path / "assets", tmp_path / "static"
+    src.mkdir()
+    (src / "card.pdf").write_bytes(PDF)
+    asset_server.build_precompressed(src, out)
+    return src, out
+
+
+@pytest.fixture
+def get(dirs):
+    """GET against a server on a random port; returns (status, headers, body)."""
+    src, out = dirs
+    sockets = tornado.netutil.bind_sockets(0, "127.0.0.1")
+    port = sockets[0].getsockname()[1]
+    started = threading.Event()
+    loop = asyncio.new_event_loop()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        server = tornado.httpserver.HTTPServer(asset_server.make_app(src, out))
+        server.add_sockets(sockets)
+        loop.call_soon(started.set)
+        loop.run_forever()
+        server.stop()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    started.wait(5)
+
+    def request(path, **headers):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.headers, response.read()
+        finally:
+            conn.close()
+
+    yield request
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+def test_precompressed_variant(get):
+    status, headers, body = get("/assets/card.pdf", **{"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert len(body) < len(PDF)
+
+
+def test_stale_variant_falls_back_to_identity(dirs, get):
+    src, _ = dirs
+    path = src / "card.pdf"
+    st = path.stat()
+    path.write_bytes(b"%PDF-1.4\nreplaced")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    status, headers, body = get("/assets/card.pdf", **{"Accept-Encoding": "br, gzip"})
+    assert status == 200
+    assert "Content-Encoding" not in headers
+    assert body == b"%PDF-1.4\nreplaced"
+
+
+def test_etag_follows_the_file(dirs, get):
+    src, _ = dirs
+    path = src / "card.pdf"
+    _, headers, _ = get("/assets/card.pdf")
+    etag = headers["ETag"]
+    assert get("/assets/card.pdf", **{"If-None-Match": etag})[0] == 304
+
+    st = path.stat()
+    path.write_bytes(b"%PDF-1.4\nreplaced")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    status, headers, _ = get("/assets/card.pdf", **{"If-None-Match": etag})
+    assert status == 200 and headers["ETag"] != etag
+    # The old digest is replaced, not kept next to the new one.
+    assert list(asset_server.AssetHandler._sha_cache) == [str(path)]
+
+
+def test_encoding_choice(get):
+    assert get("/assets/card.pdf", **{"Accept-Encoding": "gzip, br"})[1]["Content-Encoding"] == "br"
+    assert "Content-Encoding" not in get("/assets/card.pdf")[1]
+    # A range always addresses the identity bytes.
+    status, headers, body = get("/assets/card.pdf", **{"Accept-Encoding": "br", "Range": "bytes=0-7"})
+    assert status == 206 and "Content-Encoding" not in headers
+    assert body == PDF[:8]
+    assert headers["Content-Range"] == f"bytes 0-7/{len(PDF)}"
+
+
+def test_download_name_and_caching_headers(get):
+    _, headers, _ = get("/assets/card.pdf?v=abc&download=1&name=Card%20(print).pdf")
+    assert headers["Content-Disposition"] == "attachment; filename*=utf-8''Card%20%28print%29.pdf"
+    assert "immutable" in headers["Cache-Control"]
+    assert headers["Content-Type"] == "application/pdf"
+
+
+def test_paths_outside_the_root_are_refused(dirs, get):
+    src, _ = dirs
+    (src.parent / "secret.txt").write_text("secret")
+    for path in ("/assets/../secret.txt", "/assets/%2e%2e/secret.txt", "/assets/%2e%2e%2fsecret.txt"):
+        status, _, body = get(path)
+        assert status in (403, 404) and b"secret" not in body
@@ -0,0 +1,55 @@
+"""The asset registry picks up replaced files without a restart."""
+
+import os
+
+import pytest
+
+from components import assets
+
+
+@pytest.fixture
+def assets_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "ASSETS_DIR", tmp_path)
+    monkeypatch.setattr(assets, "ASSET_FILES", {"card": ("card.pdf",)})
+    monkeypatch.setattr(assets, "_manifest", {})  # no build manifest: lookup by name
+    monkeypatch.setattr(assets, "_assets_by_id", {})
+    monkeypatch.setattr(assets, "_checked_at", {})
+    monkeypatch.setattr(assets, "_assets_by_path", {})
+    return tmp_path
+
+
+def _replace(path, data: bytes):
+    stat = path.stat() if path.exists() else None
+    path.write_bytes(data)
+    if stat is not None:
+        # Make sure the mtime moves even on coarse filesystem clocks.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_cached_between_checks(assets_dir):
+    _replace(assets_dir / "card.pdf", b"v1")
+    first = assets.get_asset("card")
+    _replace(assets_dir / "card.pdf", b"v2 longer")
+
+    # Within REVALIDATE_INTERVAL the cached copy is served without a stat.
+    assert assets.get_asset("card") is first
+
+
+def test_revalidate_rereads_a_replaced_file(assets_dir):
+    _replace(assets_dir / "card.pdf", b"v1")
+    first = assets.get_asset("card")
+    _replace(assets_dir / "card.pdf", b"v2 longer")
+
+    second = assets.get_asset("card", revalidate=True)
+    assert second.data == b"v2 longer"
+    assert second.sha256 != first.sha256
+    assert assets.get_asset("card", revalidate=True) is second
+
+
+def test_rechecked_after_the_interval(assets_dir, monkeypatch):
+    _replace(assets_dir / "card.pdf", b"v1")
+    assets.get_asset("card")
+    _replace(assets_dir / "card.pdf", b"v2 longer")
+    monkeypatch.setattr(assets, "REVALIDATE_INTERVAL", 0.0)
+
+    assert assets.get_asset("card").data == b"v2 longer"
@@ -0,0 +1,43 @@
+"""Static block rendering: the cache and what catalog text may emit."""
+
+from collections import OrderedDict
+
+import pytest
+
+from components import blocks
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    if not blocks.blocks_available():
+        pytest.skip("markdown-it not installed")
+    monkeypatch.setattr(blocks, "_cache", OrderedDict())
+    monkeypatch.setattr(blocks, "_stats", {"hits": 0, "misses": 0, "evictions": 0})
+
+
+def test_rendered_once_per_content():
+    first = blocks.render_block("guides.body", "English", "**Calm** words")
+    assert "<strong>Calm</strong>" in first
+    assert blocks.render_block("guides.body", "English", "**Calm** words") is first
+    blocks.render_block("guides.body", "English", "**Calm** words, edited")
+
+    stats = blocks.block_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+
+def test_least_recently_used_is_evicted(monkeypatch):
+    monkeypatch.setattr(blocks, "MAX_BLOCKS", 2)
+    for key in ("a", "b", "a", "c"):
+        blocks.render_block(key, "English", key)
+
+    assert [k[0] for k in blocks._cache] == ["a", "c"]
+    assert blocks.block_cache_stats()["evictions"] == 1
+
+
+def test_raw_html_and_unsafe_links_are_not_emitted():
+    html = blocks.render_block(
+        "x", "English", '<script>alert(1)</script>\n\n<b onclick="x()">hi</b> [link](javascript:alert(1))'
+    )
+    assert "<script" not in html and "<b " not in html
+    assert "&lt;script&gt;" in html
+    assert "href" not in html  # the link is left as text
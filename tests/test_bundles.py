@@ -0,0 +1,56 @@
+"""Card bundles built from a scratch assets directory."""
+
+import os
+import zipfile
+
+import pytest
+
+from components import assets, bundles, catalog
+
+
+@pytest.fixture
+def cards(tmp_path, monkeypatch):
+    src = tmp_path / "assets"
+    src.mkdir()
+    (src / "Dots.pdf").write_bytes(b"%PDF dots")
+    (src / "Waves.pdf").write_bytes(b"%PDF waves")
+    monkeypatch.setattr(assets, "ASSETS_DIR", src)
+    monkeypatch.setattr(assets, "ASSET_FILES", {"dots": ("Dots.pdf",), "waves": ("Waves.pdf",), "pathways": ("Pathways.pdf",)})
+    monkeypatch.setattr(assets, "_manifest", {})
+    monkeypatch.setattr(assets, "_assets_by_id", {})
+    monkeypatch.setattr(assets, "_checked_at", {})
+    monkeypatch.setattr(assets, "_assets_by_path", {})
+    monkeypatch.setattr(bundles, "BUNDLE_CONTENTS", ["dots", "waves", "pathways"])
+    monkeypatch.setattr(bundles, "BUNDLE_DIR", tmp_path / "bundles")
+    monkeypatch.setattr(bundles, "_bundles", {})
+    return src
+
+
+def test_zip_holds_the_cards_under_catalog_names(cards):
+    bundle = bundles.get_bundle("日本語")
+    assert bundle.missing == ("pathways",)
+    with zipfile.ZipFile(bundle.path) as zf:
+        assert zf.namelist() == [
+            "README.txt",
+            catalog.text("日本語", "ui.bundle.files.dots"),
+            catalog.text("日本語", "ui.bundle.files.waves"),
+        ]
+        assert zf.read(catalog.text("日本語", "ui.bundle.files.dots")) == b"%PDF dots"
+        assert zf.read("README.txt").decode("utf-8") == catalog.text("日本語", "ui.bundle.readme")
+
+
+def test_key_follows_language_and_content(cards):
+    english = bundles.get_bundle("English")
+    assert bundles.get_bundle("English") is english
+    assert bundles.get_bundle("日本語").path != english.path
+
+    stat = (cards / "Dots.pdf").stat()
+    (cards / "Dots.pdf").write_bytes(b"%PDF dots, revised")
+    os.utime(cards / "Dots.pdf", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assets.get_asset("dots", revalidate=True)
+
+    # Not built yet for the new content, then built under a new name.
+    assert bundles.get_bundle("English", build=False) is None
+    revised = bundles.get_bundle("English")
+    assert revised.path != english.path and revised.sha256 != english.sha256
+    assert english.path.exists()  # the old ZIP stays valid for links already handed out
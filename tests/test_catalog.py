@@ -0,0 +1,56 @@
+"""Catalog compilation, fallback and reload on a scratch content directory."""
+
+import os
+
+import pytest
+
+from components import catalog
+
+
+def _write(path, text):
+    stat = path.stat() if path.exists() else None
+    path.write_text(text, encoding="utf-8")
+    if stat is not None:
+        # Make sure the mtime moves even on coarse filesystem clocks.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def content(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "CONTENT_DIR", tmp_path)
+    monkeypatch.setattr(catalog, "LANGUAGES_FILE", tmp_path / "languages.toml")
+    monkeypatch.setattr(catalog, "_state", None)
+    _write(tmp_path / "languages.toml", 'default = "English"\n[languages]\n"English" = "en.toml"\n"日本語" = "ja.toml"\n')
+    _write(tmp_path / "en.toml", '[home]\ntitle = "Home"\nbody = "Welcome"\n')
+    _write(tmp_path / "ja.toml", '[home]\ntitle = "ホーム"\n')
+    return tmp_path
+
+
+def test_languages_and_default(content):
+    assert catalog.languages() == ["English", "日本語"]
+    assert catalog.default_language() == "English"
+    assert catalog.language_code("日本語") == "ja"
+    assert catalog.language_code("Klingon") == "en"
+
+
+def test_missing_translation_falls_back_to_the_default(content):
+    assert catalog.text("日本語", "home.title") == "ホーム"
+    assert catalog.text("日本語", "home.body") == "Welcome"
+    assert catalog.text("Klingon", "home.title") == "Home"
+    assert catalog.text("English", "no.such.key") == "no.such.key"
+
+
+def test_refresh_swaps_in_a_whole_new_catalog(content):
+    old = catalog.catalog("日本語")
+    old_stamp = catalog.stamp()
+    assert not catalog.refresh()
+
+    _write(content / "ja.toml", '[home]\ntitle = "ようこそ"\nbody = "こんにちは"\n')
+    assert catalog.refresh()
+
+    # Readers still holding the old table see it unchanged, not half-updated.
+    assert old == {"home.title": "ホーム", "home.body": "Welcome"}
+    # Languages in use were compiled before the new catalog was published.
+    assert "日本語" in catalog._state.tables
+    assert catalog.catalog("日本語") == {"home.title": "ようこそ", "home.body": "こんにちは"}
+    assert catalog.stamp() != old_stamp
@@ -0,0 +1,38 @@
+"""FeedbackStore writes on a scratch database."""
+
+import logging
+
+import pytest
+
+from components.feedback import FeedbackStore, Submission
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeedbackStore(path=tmp_path / "feedback.db", flush_interval=0.05, backoff=0.01)
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize("rating", [0, 6, "5", True, None])
+def test_submit_refuses_invalid_rating(store, rating):
+    with pytest.raises(ValueError):
+        store.submit(Submission(role="parent", rating=rating))
+    assert store.stats["queued"] == 0
+
+
+def test_bad_row_loses_only_itself(store, caplog):
+    good = [Submission(role="parent", rating=r, comment=str(r)) for r in (1, 2, 3)]
+    # Slipped past submit(), e.g. a caller putting rows on the queue directly.
+    bad = Submission(role="parent", rating=9, comment="bad")
+    with caplog.at_level(logging.ERROR, logger="components.feedback"):
+        store.start()
+        for submission in (good[0], bad, good[1], good[2]):
+            store._queue.put(submission)
+        assert store.flush(timeout=5)
+
+    assert store.count() == 3
+    assert store.stats["written"] == 3
+    assert store.stats["failed"] == 1
+    refused = [r.getMessage() for r in caplog.records]
+    assert len(refused) == 1 and '"comment": "bad"' in refused[0]
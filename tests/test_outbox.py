@@ -0,0 +1,118 @@
+"""Outbox delivery against LocalBackend, on a scratch feedback database."""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from components.feedback import FeedbackStore, Submission
+from components.outbox import LocalBackend, Outbox, Rejected
+
+
+class RejectingBackend(LocalBackend):
+    """Refuses the row with comment "bad"; delivers the rows before it."""
+
+    def deliver(self, batch):
+        for sent, item in enumerate(batch):
+            if item.submission.comment == "bad":
+                self.received.extend(batch[:sent])
+                raise Rejected("HTTP 400", sent)
+        return super().deliver(batch)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeedbackStore(path=tmp_path / "feedback.db", flush_interval=0.01)
+    yield store
+    store.close()
+
+
+def _outbox(store, backend, **kwargs):
+    outbox = Outbox(backend=backend, store=store, **kwargs)
+    outbox._connect().close()  # creates the outbox table and its trigger
+    return outbox
+
+
+def _submit(store, *comments):
+    for comment in comments:
+        store.submit(Submission(role="educator", rating=4, comment=comment, lang="English"))
+    assert store.flush(timeout=5)
+
+
+def _rows(store):
+    with closing(sqlite3.connect(store.path)) as conn:
+        return conn.execute(
+            "SELECT feedback_id, attempts, next_attempt_at, last_error FROM feedback_outbox ORDER BY feedback_id"
+        ).fetchall()
+
+
+def test_trigger_enqueues_inserted_rows(store):
+    _outbox(store, LocalBackend())
+    _submit(store, "one", "two")
+
+    assert [row[:3] for row in _rows(store)] == [(1, 0, 0), (2, 0, 0)]
+
+
+def test_rows_stored_before_sync_are_not_enqueued(store):
+    _submit(store, "before")
+    outbox = _outbox(store, LocalBackend())
+    _submit(store, "after")
+
+    assert [row[0] for row in _rows(store)] == [2]
+    assert outbox.status()["waiting"] == 1
+
+
+def test_delivery(store):
+    backend = LocalBackend()
+    outbox = _outbox(store, backend)
+    _submit(store, "one", "two", "three")
+
+    assert outbox.sync_once()
+    assert [item.id for item in backend.received] == [1, 2, 3]
+    assert [item.submission.comment for item in backend.received] == ["one", "two", "three"]
+    assert _rows(store) == []
+    assert not outbox.sync_once()
+    assert outbox.status()["sent"] == 3
+
+
+def test_transient_failure_backs_off_then_retries(store):
+    backend = LocalBackend(fail_every=1)
+    outbox = _outbox(store, backend, base_backoff=60.0)
+    _submit(store, "one")
+
+    assert outbox.sync_once()
+    ((_, attempts, next_attempt_at, last_error),) = _rows(store)
+    assert attempts == 1
+    assert next_attempt_at is not None and next_attempt_at > 0
+    assert "simulated failure" in last_error
+    assert outbox.stats["failures"] == 1
+
+    # Not due yet, so nothing is claimed.
+    assert not outbox.sync_once()
+    assert backend.calls == 1
+
+    with closing(sqlite3.connect(store.path)) as conn, conn:
+        conn.execute("UPDATE feedback_outbox SET next_attempt_at = 0")
+    backend.fail_every = 0
+    assert outbox.sync_once()
+    assert [item.id for item in backend.received] == [1]
+    assert _rows(store) == []
+
+
+def test_rejected_row_is_parked_and_the_rest_delivered(store):
+    backend = RejectingBackend()
+    outbox = _outbox(store, backend)
+    _submit(store, "one", "bad", "three")
+
+    assert outbox.sync_once()
+    assert [item.id for item in backend.received] == [1]
+    rows = _rows(store)
+    assert rows[0] == (2, 1, None, "HTTP 400")
+    assert rows[1][:3] == (3, 0, 0)  # never tried, so due again at once
+
+    assert outbox.sync_once()
+    assert [item.id for item in backend.received] == [1, 3]
+    assert not outbox.sync_once()  # the rejected row is not retried
+
+    status = outbox.status()
+    assert (status["waiting"], status["rejected"], status["sent"], status["failures"]) == (0, 1, 2, 0)
@@ -0,0 +1,119 @@
+"""RemoteFetcher against a local HTTP server on an ephemeral port."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from components.remote import FAILED, PENDING, READY, RemoteFetcher
+
+BODY = b"%PDF-1.4 test body"
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("If-None-Match")))
+        if server.failing:
+            self.send_error(503)
+        elif self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.failing = False
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path="/card.pdf"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def _fetcher(tmp_path, **kwargs):
+    kwargs.setdefault("timeout", 2.0)
+    kwargs.setdefault("backoff", 0.01)
+    return RemoteFetcher(cache_dir=tmp_path, **kwargs)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_first_fetch_then_ready(server, tmp_path):
+    fetcher = _fetcher(tmp_path)
+    url = _url(server)
+
+    assert fetcher.status(url) == PENDING
+    assert fetcher.wait(url, timeout=5) == READY
+    assert fetcher.get(url) == BODY
+    assert fetcher.stats["fetches"] == 1
+    assert server.requests == [("/card.pdf", None)]
+
+
+def test_not_modified_revalidates_cached_copy(server, tmp_path):
+    url = _url(server)
+    first = _fetcher(tmp_path)
+    assert first.wait(url, timeout=5) == READY
+
+    # A new process: served from the disk cache at once, revalidated with the ETag.
+    second = _fetcher(tmp_path)
+    assert second.status(url) == READY
+    assert second.get(url) == BODY
+    _wait_for(lambda: second.stats["not_modified"] == 1)
+    assert second.stats["disk_hits"] == 1
+    assert second.stats["fetches"] == 0
+    assert server.requests[-1] == ("/card.pdf", ETAG)
+
+
+def test_breaker_opens_and_recloses_after_cooldown(server, tmp_path):
+    fetcher = _fetcher(tmp_path, retries=3, breaker_threshold=2, breaker_cooldown=0.3)
+    url = _url(server)
+    server.failing = True
+
+    assert fetcher.wait(url, timeout=5) == FAILED
+    # The breaker opened after two failures, so the third attempt never went out.
+    assert len(server.requests) == 2
+    assert fetcher.stats["failures"] == 2
+
+    # While open, status() doesn't start another fetch.
+    assert fetcher.status(url) == FAILED
+    assert len(server.requests) == 2
+
+    server.failing = False
+    time.sleep(0.3)
+    assert fetcher.wait(url, timeout=5) == READY
+    assert fetcher.get(url) == BODY
+    assert fetcher._breaker(url).opened_at is None
+
+
+def test_no_sleep_after_last_attempt(server, tmp_path):
+    fetcher = _fetcher(tmp_path, retries=2, backoff=1.0, breaker_threshold=2)
+    url = _url(server)
+    server.failing = True
+
+    started = time.monotonic()
+    assert fetcher.wait(url, timeout=5) == FAILED
+    # One backoff (1s) between the two attempts, none after the second.
+    assert time.monotonic() - started < 1.9
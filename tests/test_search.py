@@ -0,0 +1,111 @@
+"""Tokenisation and BM25 queries on a small hand-built index."""
+
+import os
+import textwrap
+
+import pytest
+
+from components import catalog, search
+from components.search import SearchDoc, SearchIndex, extract_page, tokenize
+
+
+def _index(*docs: SearchDoc) -> SearchIndex:
+    index = SearchIndex()
+    for doc in docs:
+        index._add(doc)
+    # Built by hand: mark it ready and keep refresh() from indexing the real pages.
+    index._checked_at = float("inf")
+    index._ready.set()
+    return index
+
+
+def _doc(source: str, lang: str, title: str, text: str) -> SearchDoc:
+    return SearchDoc(source=source, lang=lang, page="app_pages/4_Guides.py", anchor=None, title=title, text=text)
+
+
+@pytest.fixture
+def index():
+    return _index(
+        _doc("colour", "English", "Colour guidelines", "Use a calm colour palette."),
+        _doc("parents", "English", "For parents", "Talking with parents about support."),
+        _doc("colour", "日本語", "カラーガイドライン", "落ち着いた配色を使います。"),
+        _doc("parents", "日本語", "保護者向け", "保護者との会話について。"),
+    )
+
+
+def _sources(index, query, lang):
+    return [r.doc.source for r in index.search(query, lang, wait=0)]
+
+
+def test_tokenize_splits_words_and_cjk_bigrams():
+    assert tokenize("The DOTS toolkit") == ["dots", "toolkit"]
+    assert tokenize("保護者") == ["保護", "護者"]
+    assert sorted(tokenize("保護者", unigrams=True)) == sorted(["保護", "護者", "保", "護", "者"])
+    assert tokenize("色") == ["色"]
+
+
+def test_english_query(index):
+    assert _sources(index, "parents", "English") == ["parents"]
+    # The last word matches as a prefix.
+    assert _sources(index, "colo", "English") == ["colour"]
+
+
+def test_bm25_ranks_the_denser_match_first():
+    index = _index(
+        _doc("long", "English", "Notes", "Support is one topic among many others in this longer general text."),
+        _doc("short", "English", "Support", "Support at home, support at school."),
+        _doc("other", "English", "Colour", "A calm palette."),
+    )
+    # More occurrences in a shorter document (title included) score higher.
+    results = index.search("support", "English", wait=0)
+    assert [r.doc.source for r in results] == ["short", "long"]
+    assert results[0].score > results[1].score > 0
+
+
+def test_japanese_queries(index):
+    assert _sources(index, "保護者", "日本語") == ["parents"]
+    # One character, inside a longer run ("配色").
+    assert _sources(index, "色", "日本語") == ["colour"]
+    assert _sources(index, "保", "日本語") == ["parents"]
+
+
+def test_loops_over_page_tables_are_unrolled(tmp_path):
+    page = tmp_path / "page.py"
+    page.write_text(textwrap.dedent("""
+        SECTIONS = [
+            ("visual_tools.typography", "typography", ["visual_tools.typography.text_hierarchy"]),
+        ]
+        for section, anchor, keys in SECTIONS:
+            st.subheader(t(f"{section}.title"), anchor=anchor)
+            for i, key in enumerate(keys):
+                with lazy_expander(t(f"{key}.label"), key=key, expanded=i == 0) as is_open:
+                    if is_open:
+                        static_block(f"{key}.body")
+    """), encoding="utf-8")
+
+    (doc,) = [d for d in extract_page(page, "page.py") if d.lang == "English"]
+    heading = catalog.text("English", "visual_tools.typography.title")
+    label = catalog.text("English", "visual_tools.typography.text_hierarchy.label")
+    assert (doc.anchor, doc.title) == ("typography", f"{heading} › {label}")
+    assert "Neutral Sans-Serif" in doc.text  # from the expander's body
+
+
+def test_refresh_reindexes_a_changed_page(tmp_path, monkeypatch):
+    page = tmp_path / "page.py"
+    page.write_text('st.subheader("Section", anchor="section")\nst.markdown("alpha")\n', encoding="utf-8")
+    monkeypatch.setattr(search, "ROOT", tmp_path)
+    monkeypatch.setattr(search, "PAGE_SOURCES", ["page.py"])
+    monkeypatch.setattr(search, "PDF_SOURCES", {})
+    monkeypatch.setattr(search, "REFRESH_INTERVAL", 0.0)
+    index = SearchIndex()
+    index.refresh()
+    assert _sources(index, "alpha", "English") == ["page.py"]
+
+    stat = page.stat()
+    page.write_text('st.subheader("Section", anchor="section")\nst.markdown("beta")\n', encoding="utf-8")
+    os.utime(page, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    index.refresh()
+
+    assert _sources(index, "alpha", "English") == []
+    assert _sources(index, "beta", "English") == ["page.py"]
+    assert index.stats["source_updates"] == 2
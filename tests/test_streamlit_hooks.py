@@ -0,0 +1,65 @@
+"""The private Streamlit attributes the components rely on (see requirements.txt)."""
+
+import logging
+
+import pytest
+from streamlit.runtime import Runtime, RuntimeConfig
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.testing.v1 import AppTest
+
+from components import assets, diagnostics, metrics
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    monkeypatch.setattr(Runtime, "_instance", None)
+    return Runtime(RuntimeConfig(
+        script_path="app.py",
+        command_line=None,
+        media_file_storage=MemoryMediaFileStorage("/media"),
+        uploaded_file_manager=MemoryUploadedFileManager("/upload"),
+    ))
+
+
+def test_media_file_manager_storage(runtime):
+    # assets.shared_media_url registers files straight in the storage.
+    assert assets._media_storage() is runtime.media_file_mgr._storage
+
+
+def test_runtime_session_manager(runtime):
+    # diagnostics.sessions lists sessions through it.
+    assert diagnostics._session_manager() is not None
+    assert diagnostics.sessions() == []
+
+
+def _metered_script():
+    import streamlit as st
+
+    from components.ui import page_metrics
+
+    with page_metrics("hooks-test"):
+        st.write("one")
+        st.write("two")
+
+
+def test_script_run_context_enqueue():
+    # ui.page_metrics counts elements and bytes through ctx._enqueue.
+    AppTest.from_function(_metered_script).run()
+    run = [r for r in metrics.recent_runs() if r.page == "hooks-test"][-1]
+    assert run.elements >= 2
+    assert run.bytes_sent > 0
+
+
+def test_missing_enqueue_turns_the_count_off(monkeypatch, caplog):
+    from components import ui
+
+    # A context without _enqueue, as a Streamlit upgrade could leave it.
+    monkeypatch.setattr(ui, "get_script_run_ctx", lambda: object())
+    ui._enqueue_missing.cache_clear()
+    with caplog.at_level(logging.WARNING, logger="components.ui"):
+        with ui.page_metrics("hooks-missing") as run:
+            pass
+
+    assert run.elements is None and run.bytes_sent is None
+    assert "_enqueue" in caplog.text
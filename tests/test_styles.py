@@ -0,0 +1,36 @@
+"""Stylesheet compilation and the selector conflict check."""
+
+from components import styles
+
+
+def test_compile_minifies_and_drops_duplicates():
+    css, dropped = styles.compile_css([
+        "/* theme */\n.a { color : red; margin: 0 }\n.b{color:blue}",
+        ".b { color: blue; }\n.b { padding: 1px }\n.a{color:red;margin:0}\n.empty{}",
+    ])
+    # The first .a repeats the last verbatim, the adjacent .b rules fold
+    # together, and the empty rule goes.
+    assert css == ".b{color:blue;padding:1px}.a{color:red;margin:0}"
+    assert dropped == 4
+
+
+def test_media_blocks_and_strings_are_kept():
+    css, _ = styles.compile_css(['@media (max-width: 600px) { .a { content: "a  b"; } }'])
+    assert css == '@media (max-width:600px){.a{content:"a  b"}}'
+
+
+def test_conflicts_name_both_rules():
+    conflicts = styles.find_conflicts({
+        "theme.css": ".a, .b { color: red }",
+        "brand.css": ".b { color: blue; color: navy }\n@media print { .a { color: black } }",
+    })
+    # A repeated property within one rule is a fallback, and @media is its own scope.
+    assert conflicts == [".b {color}: 'red' (theme.css rule 1) vs 'navy' (brand.css rule 1)"]
+
+
+def test_shipped_sheets_build_without_conflicts(tmp_path):
+    sheet = styles.build_stylesheet(out_dir=tmp_path)
+    assert sheet.conflicts == ()
+    assert sheet.path == tmp_path / f"dots-{sheet.sha256[:16]}.css"
+    assert sheet.path.read_text(encoding="utf-8") == sheet.css
+    assert sheet.size < sheet.source_bytes